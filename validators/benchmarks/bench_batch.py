@@ -0,0 +1,73 @@
+"""Benchmark `batch` against a list comprehension over the decorated validator.
+
+Run with `python benchmarks/bench_batch.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import batch, card_number, email, ipv4, slug  # noqa: E402
+
+
+def _column(rows: int, valid: Callable[[int], str], invalid: Callable[[int], str]):
+    """Column with a failure every fourth row."""
+    return [invalid(idx) if idx % 4 == 0 else valid(idx) for idx in range(rows)]
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, validator: Callable[..., Any], values: List[str]):
+    failed = sum(not validator(value) for value in values)
+    assert len(batch(validator, values).failures) == failed
+
+    baseline = _best(lambda: [validator(value) for value in values])
+    batched = _best(lambda: batch(validator, values))
+    print(
+        f"{name:<12}{len(values) / baseline:>14.0f}{len(values) / batched:>14.0f}"
+        + f"{baseline / batched:>10.2f}x"
+    )
+
+
+def main(rows: int):
+    """Compare both approaches."""
+    print(f"rows: {rows}, rows/s of:")
+    print(f"{'':<12}{'list comp':>14}{'batch':>14}{'speedup':>11}")
+    _compare(
+        "email",
+        email,
+        _column(rows, lambda i: f"user{i}@host{i % 500}.example.com", lambda i: f"user{i}@@x"),
+    )
+    # every domain distinct, so `email_stream` has nothing to share
+    _compare(
+        "email uniq",
+        email,
+        _column(rows, lambda i: f"user@host{i}.example.com", lambda i: f"user{i}@@x"),
+    )
+    _compare(
+        "ipv4",
+        ipv4,
+        _column(rows, lambda i: f"10.{i % 256}.{i % 199}.1", lambda i: f"300.{i % 256}.0.1"),
+    )
+    _compare(
+        "card_number",
+        card_number,
+        _column(rows, lambda _: "4242424242424242", lambda _: "4242424242424241"),
+    )
+    _compare("slug", slug, _column(rows, lambda i: f"my-slug-{i}", lambda i: f"Not a slug {i}"))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,52 @@
+"""Benchmark the memoization cache on repetitive traffic.
+
+Run with `python benchmarks/bench_cache.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, btc_address, cache, domain, email, url  # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, validator: Callable[..., Any], values: List[str]):
+    check = as_bool(validator)
+    cache.disable()
+    uncached = _best(lambda: [check(value) for value in values])
+    cache.enable(maxsize=4096)
+    memoized = _best(lambda: [check(value) for value in values])
+    info = cache.info()
+    cache.disable()
+    print(
+        f"{name:<12}{len(values) / uncached:>12.0f}{len(values) / memoized:>12.0f}"
+        + f"{uncached / memoized:>10.2f}x{info.hits / (info.hits + info.misses):>10.1%}"
+    )
+
+
+def main(rows: int):
+    """Compare validation with and without the cache."""
+    print(f"rows: {rows}, 1000 distinct values, rows/s of:")
+    print(f"{'':<12}{'uncached':>12}{'cached':>12}{'speedup':>11}{'hit rate':>10}")
+    _compare("url", url, [f"https://host{i % 1000}.example.com/" for i in range(rows)])
+    _compare("email", email, [f"user@sender{i % 1000}.example.com" for i in range(rows)])
+    _compare("domain", domain, [f"sender{i % 1000}.example.com" for i in range(rows)])
+    _compare("btc_address", btc_address, ["1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2"] * rows)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,54 @@
+"""Benchmark `compile` against calling validators with keyword options.
+
+Run with `python benchmarks/bench_compile.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, compile, domain, email, hostname, url  # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, validator: Callable[..., Any], values: List[str], **options: Any):
+    compiled = compile(validator, **options)
+    assert [bool(validator(value, **options)) for value in values] == [
+        bool(compiled(value)) for value in values
+    ]
+    check, compiled_check = as_bool(validator), as_bool(compiled)
+
+    keyword = _best(lambda: [check(value, **options) for value in values])
+    specialised = _best(lambda: [compiled_check(value) for value in values])
+    print(
+        f"{name:<10}{len(values) / keyword:>14.0f}{len(values) / specialised:>14.0f}"
+        + f"{keyword / specialised:>10.2f}x"
+    )
+
+
+def main(rows: int):
+    """Compare both approaches."""
+    options: Dict[str, Any] = {"consider_tld": True, "rfc_1034": True}
+    print(f"rows: {rows}, rows/s of:")
+    print(f"{'':<10}{'keywords':>14}{'compiled':>14}{'speedup':>11}")
+    _compare("url", url, [f"https://host{i}.example.com/p?q={i}" for i in range(rows)], **options)
+    _compare("hostname", hostname, [f"host{i}.example.com:80" for i in range(rows)], **options)
+    _compare("domain", domain, [f"host{i}.example.com" for i in range(rows)], **options)
+    _compare("email", email, [f"user{i}@example.com" for i in range(rows)], simple_host=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,50 @@
+"""Benchmark `email_stream` against `email` on a synthetic mailing list.
+
+Run with `python benchmarks/bench_email.py [rows]` from the project root.
+"""
+
+# standard
+from collections import deque
+import sys
+from time import perf_counter
+from typing import Any, Callable, Iterator, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, email, email_stream  # noqa: E402
+
+_DOMAINS = 50_000
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _addresses(rows: int) -> Iterator[str]:
+    """Distinct addresses over `_DOMAINS` domains, with a few invalid ones."""
+    for idx in range(rows):
+        local = f"first.last{idx}" if idx % 101 else f"first last{idx}"
+        yield f"{local}@mail{idx % _DOMAINS}.example{idx % 7}.com"
+
+
+def main(rows: int):
+    """Compare `email` on every address with `email_stream` over all of them."""
+    check = as_bool(email)
+    # the corpus is generated lazily, time it to subtract it
+    generate = _best(lambda: deque(_addresses(rows), 0), repeat=1)
+    per_call = _best(lambda: deque(map(check, _addresses(rows)), 0), repeat=1) - generate
+    streamed = _best(lambda: deque(email_stream(_addresses(rows)), 0), repeat=1) - generate
+    print(f"rows: {rows}, {_DOMAINS} distinct domains, addresses/s of:")
+    print(f"{'email':<14}{rows / per_call:>12.0f}")
+    print(f"{'email_stream':<14}{rows / streamed:>12.0f}{per_call / streamed:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,65 @@
+"""Benchmark `hostname` against trying each kind of host in turn.
+
+Run with `python benchmarks/bench_hostname.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import domain, ipv4, ipv6  # noqa: E402
+from validators.hostname import (  # noqa: E402
+    _hostname_checker,  # type: ignore
+    _port_validator,  # type: ignore
+    _simple_hostname_regex,  # type: ignore
+)
+
+
+def _sequential(value: str):
+    """Host check as done before `classify_host`."""
+    value = _port_validator(value) or value
+    return bool(
+        _simple_hostname_regex().match(value)
+        or domain(value)
+        or ipv4(value, cidr=False)
+        or ipv6(value, cidr=False)
+    )
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, values: List[str]):
+    check = _hostname_checker()
+    assert [_sequential(value) for value in values] == [bool(check(value)) for value in values]
+    sequential = _best(lambda: [_sequential(value) for value in values])
+    classified = _best(lambda: [check(value) for value in values])
+    print(
+        f"{name:<8}{len(values) / sequential:>14.0f}{len(values) / classified:>14.0f}"
+        + f"{sequential / classified:>10.2f}x"
+    )
+
+
+def main(rows: int):
+    """Compare both approaches per kind of host."""
+    print(f"rows: {rows}, rows/s of:")
+    print(f"{'':<8}{'sequential':>14}{'classified':>14}{'speedup':>11}")
+    _compare("simple", [f"host-{idx}" for idx in range(rows)])
+    _compare("domain", [f"host{idx}.example.com" for idx in range(rows)])
+    _compare("ipv4", [f"10.{idx % 256}.{idx % 199}.1" for idx in range(rows)])
+    _compare("ipv6", [f"2001:db8::{idx % 65536:x}" for idx in range(rows)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,47 @@
+"""Benchmark the IDNA conversion of `domain` against the `idna` codec.
+
+Run with `python benchmarks/bench_idna.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import domain  # noqa: E402
+from validators.domain import _to_ascii  # type: ignore # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, values: List[str]):
+    codec = _best(lambda: [value.encode("idna").decode("utf-8") for value in values])
+    fast = _best(lambda: [_to_ascii(value) for value in values])
+    validated = _best(lambda: [domain(value) for value in values])
+    print(
+        f"{name:<8}{len(values) / codec:>12.0f}{len(values) / fast:>12.0f}"
+        + f"{codec / fast:>10.2f}x{len(values) / validated:>12.0f}"
+    )
+
+
+def main(rows: int):
+    """Compare ASCII and IDN workloads."""
+    print(f"rows: {rows}, rows/s of:")
+    print(f"{'':<8}{'codec':>12}{'fast path':>12}{'speedup':>11}{'domain':>12}")
+    _compare("ascii", [f"host{idx}.example.com" for idx in range(rows)])
+    _compare("idn", [f"пример{idx % 1000}.испытание.рф" for idx in range(rows)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
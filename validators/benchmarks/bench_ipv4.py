@@ -0,0 +1,61 @@
+"""Benchmark `ipv4` against the `ipaddress` object implementation.
+
+Run with `python benchmarks/bench_ipv4.py [rows]` from the project root.
+"""
+
+# standard
+from ipaddress import IPv4Network
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, ipv4  # noqa: E402
+
+
+def _legacy(value: str):
+    """IPv4 check as done before `_parse_ipv4`."""
+    try:
+        return bool(IPv4Network(value))
+    except ValueError:
+        return False
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(
+    name: str, legacy: Callable[[str], bool], check: Callable[[str], bool], values: List[str]
+):
+    before = _best(lambda: [legacy(value) for value in values])
+    after = _best(lambda: [check(value) for value in values])
+    print(
+        f"{name:<16}{len(values) / before:>12.0f}{len(values) / after:>12.0f}"
+        + f"{before / after:>10.2f}x"
+    )
+
+
+def main(rows: int):
+    """Compare parsing dotted-quads with and without `ipaddress` objects."""
+    addresses = [f"{i % 223 + 1}.{i % 256}.{i // 256 % 256}.{i % 7}" for i in range(rows)]
+    networks = [f"10.{i % 256}.{i // 256 % 256}.0/24" for i in range(rows)]
+    invalid = [f"{i % 300}.{i % 256}.0{i % 10}.1" for i in range(rows)]
+    check = as_bool(ipv4)
+    print(f"rows: {rows}, values/s of:")
+    print(f"{'':<16}{'ipaddress':>12}{'parser':>12}{'speedup':>11}")
+    _compare("addresses", _legacy, check, addresses)
+    _compare("networks", _legacy, check, networks)
+    _compare("invalid", _legacy, check, invalid)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,70 @@
+"""Benchmark Luhn's check against the former `card_number` implementation.
+
+Run with `python benchmarks/bench_luhn.py [rows]` from the project root.
+The NumPy path is measured only if NumPy is installed.
+"""
+
+# standard
+from importlib import import_module
+from random import Random
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, card_number, card_number_batch  # noqa: E402
+
+
+def _legacy(value: str):
+    """Luhn's check as done before the doubled-digit table."""
+    if not value:
+        return False
+    try:
+        digits = list(map(int, value))
+        odd_sum = sum(digits[-1::-2])
+        even_sum = sum(sum(divmod(2 * d, 10)) for d in digits[-2::-2])
+        return (odd_sum + even_sum) % 10 == 0
+    except ValueError:
+        return False
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main(rows: int):
+    """Compare checking card numbers one by one, in a batch and with NumPy."""
+    rng = Random(23)
+    values = [str(rng.randrange(10**15, 10**16)) for _ in range(rows)]
+    check = as_bool(card_number)
+    before = _best(lambda: [_legacy(value) for value in values])
+    print(f"rows: {rows}, values/s of:")
+    print(f"{'former card_number':<22}{rows / before:>12.0f}")
+    for name, run in (
+        ("card_number", lambda: [check(value) for value in values]),
+        ("card_number_batch", lambda: card_number_batch(values)),
+    ):
+        timing = _best(run)
+        print(f"{name:<22}{rows / timing:>12.0f}{before / timing:>10.2f}x")
+    numpy: Any = None
+    try:
+        # external, optional
+        numpy = import_module("numpy")
+    except ImportError:
+        print(f"{'numpy array':<22}{'skipped, NumPy is not installed':>12}")
+        return
+    array = numpy.array([value.encode() for value in values])
+    timing = _best(lambda: card_number_batch(array))
+    print(f"{'numpy array':<22}{rows / timing:>12.0f}{before / timing:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
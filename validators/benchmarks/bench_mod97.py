@@ -0,0 +1,76 @@
+"""Benchmark the MOD 97-10 table against the former big integer `iban` check.
+
+Run with `python benchmarks/bench_mod97.py [rows]` from the project root.
+"""
+
+# standard
+from random import Random
+from string import ascii_uppercase, digits
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, iban, iban_batch, mod97_10  # noqa: E402
+
+
+def _char_value(char: str):
+    return char if char.isdigit() else str(10 + ord(char) - ord("A"))
+
+
+def _legacy(value: str):
+    """Check sum as done before `mod97_10`, through one big integer."""
+    rearranged = value[4:] + value[:4]
+    return int("".join(_char_value(char) for char in rearranged)) % 97 == 1
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _legacy_remainder(value: str):
+    return int("".join(_char_value(char) for char in value)) % 97
+
+
+def _ibans(rows: int):
+    """Valid GB IBAN codes."""
+    rng = Random(24)
+    values: List[str] = []
+    for _ in range(rows):
+        bban = "".join(rng.choices(ascii_uppercase, k=4) + rng.choices(digits, k=14))
+        check = 98 - _legacy_remainder(bban + "GB00")
+        values.append(f"GB{check:02d}{bban}")
+    return values
+
+
+def main(rows: int):
+    """Compare the check sum alone, then whole `iban` validations."""
+    values = _ibans(rows)
+    rearranged = [value[4:] + value[:4] for value in values]
+    check = as_bool(iban)
+    before = _best(lambda: [_legacy(value) for value in values])
+    after = _best(lambda: [mod97_10(value) == 1 for value in rearranged])
+    print(f"rows: {rows}, values/s of:")
+    print(f"{'big integer':<16}{rows / before:>12.0f}")
+    print(f"{'mod97_10':<16}{rows / after:>12.0f}{before / after:>10.2f}x")
+    # one digit too many for GB, rejected before the check sum
+    too_long = [value + "0" for value in values]
+    for name, run in (
+        ("iban", lambda: [check(value) for value in values]),
+        ("iban_batch", lambda: iban_batch(values)),
+        ("wrong length", lambda: iban_batch(too_long)),
+    ):
+        timing = _best(run)
+        print(f"{name:<16}{rows / timing:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,63 @@
+"""Benchmark the netloc cache of `url` on crawl-like traffic.
+
+Run with `python benchmarks/bench_netloc.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List, Optional
+
+sys.path.insert(0, "src")
+
+# local
+from validators import as_bool, cache, url  # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _urls(rows: int, hosts: int):
+    """Distinct URLs over `hosts` netlocs, some of them IDNs with ports."""
+    netlocs = [
+        f"www.xn--bcher-kva{idx}.example:8080" if idx % 4 else f"shop{idx}.bücher.de"
+        for idx in range(hosts)
+    ]
+    return [f"https://{netlocs[idx % hosts]}/item/{idx}?page={idx % 7}" for idx in range(rows)]
+
+
+def _run(values: List[str], maxsize: Optional[int]):
+    check = as_bool(url)
+    if maxsize is not None:
+        cache.enable_netloc(maxsize)
+    elapsed = _best(lambda: [check(value) for value in values])
+    info = cache.netloc_info()
+    cache.disable_netloc()
+    return elapsed, info
+
+
+def main(rows: int):
+    """Compare `url` with the netloc cache off and at several sizes."""
+    values = _urls(rows, 2000)
+    print(f"rows: {rows}, 2000 distinct netlocs, all URLs distinct, over 3 runs:")
+    print(f"{'':<16}{'rows/s':>12}{'speedup':>11}{'hit rate':>10}{'evictions':>12}")
+    uncached, _ = _run(values, None)
+    print(f"{'uncached':<16}{len(values) / uncached:>12.0f}")
+    for maxsize in (512, 2048, 8192):
+        elapsed, info = _run(values, maxsize)
+        print(
+            f"{f'maxsize={maxsize}':<16}{len(values) / elapsed:>12.0f}"
+            + f"{uncached / elapsed:>10.2f}x{info.hits / (info.hits + info.misses):>10.1%}"
+            + f"{info.evictions:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,78 @@
+"""Benchmark `NetworkSet` and `analyse_networks` on large prefix lists.
+
+Run with `python benchmarks/bench_networks.py [prefixes]` from the project root.
+"""
+
+# standard
+from ipaddress import IPv4Address, ip_network
+from random import Random
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import NetworkSet, analyse_networks  # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _prefixes(count: int, rng: Random):
+    """Random IPv4 prefixes, mostly /24, and one IPv6 prefix in ten."""
+    prefixes: List[str] = []
+    for idx in range(count):
+        if idx % 10:
+            length = rng.choice((16, 20, 22, 24, 24, 24, 28, 32))
+            prefixes.append(f"{IPv4Address(rng.getrandbits(32))}/{length}")
+        else:
+            prefixes.append(f"2001:db8:{rng.getrandbits(16):x}:{rng.getrandbits(16):x}::/64")
+    return prefixes
+
+
+def main(count: int):
+    """Report build time, lookup rate and memory of a set of `count` prefixes, and analyse them."""
+    rng = Random(0)
+    prefixes = _prefixes(count, rng)
+    addresses = [str(IPv4Address(rng.getrandbits(32))) for _ in range(100_000)]
+    start = perf_counter()
+    networks = NetworkSet(prefixes)
+    built = perf_counter() - start
+    lookup = _best(lambda: [address in networks for address in addresses])
+    print(f"prefixes: {count}")
+    print(f"{'build':<22}{built:>10.2f} s")
+    print(f"{'merged ranges':<22}{len(networks):>10}")
+    print(f"{'memory':<22}{networks.nbytes / 2**20:>10.1f} MiB")
+    print(f"{'lookups':<22}{len(addresses) / lookup:>10.0f} /s")
+    # linear scan over `ipaddress` networks, as done without `NetworkSet`
+    small = [ip_network(prefix, strict=False) for prefix in prefixes[:1_000]]
+    sample = [IPv4Address(address) for address in addresses[:1_000]]
+    linear = _best(lambda: [any(a in net for net in small) for a in sample], repeat=1)
+    small_set = NetworkSet(prefixes[:1_000])
+    indexed = _best(lambda: [address in small_set for address in addresses[:1_000]])
+    print(f"{'1k prefixes, linear':<22}{len(sample) / linear:>10.0f} /s")
+    print(f"{'1k prefixes, set':<22}{len(sample) / indexed:>10.0f} /s")
+    start = perf_counter()
+    analyse_networks(prefixes)
+    plain = perf_counter() - start
+    start = perf_counter()
+    report = analyse_networks(prefixes, aggregate=True)
+    analysed = perf_counter() - start
+    print(f"{'analyse':<22}{plain:>10.2f} s")
+    print(f"{'analyse, aggregate':<22}{analysed:>10.2f} s")
+    print(f"{'analysed':<22}{count / analysed:>10.0f} /s")
+    print(f"{'duplicates':<22}{len(report.duplicates):>10}")
+    print(f"{'covered':<22}{len(report.covered):>10}")
+    print(f"{'aggregated':<22}{len(report.aggregated or ()):>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
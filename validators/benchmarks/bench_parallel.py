@@ -0,0 +1,39 @@
+"""Benchmark `parallel` against `batch` on a single process.
+
+Run with `python benchmarks/bench_parallel.py [rows] [jobs]` from the project root.
+"""
+
+# standard
+from os import cpu_count
+import sys
+from time import perf_counter
+
+sys.path.insert(0, "src")
+
+# local
+from validators import batch, parallel, url  # noqa: E402
+
+
+def main(rows: int, jobs: int):
+    """Compare single process and process pool throughput."""
+    values = [
+        f"https://host{idx % 1000}.example.com/path/{idx}?q={idx}" if idx % 5 else f"http//{idx}"
+        for idx in range(rows)
+    ]
+
+    start = perf_counter()
+    single = batch(url, values)
+    elapsed = perf_counter() - start
+    print(f"batch, 1 process: {rows / elapsed:12.0f} rows/s")
+
+    for chunk_size in (1_000, 10_000, 50_000):
+        result = parallel(url, values, jobs=jobs, chunk_size=chunk_size)
+        assert result.flags == single.flags
+        print(f"parallel, {jobs} jobs, chunks of {chunk_size}: {result.throughput:12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else cpu_count() or 1,
+    )
@@ -0,0 +1,50 @@
+"""Benchmark Public Suffix List lookups.
+
+Run with `python benchmarks/bench_psl.py [rows]` from the project root.
+"""
+
+# standard
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import psl, registrable_domain  # noqa: E402
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main(rows: int):
+    """Time compiling the list and grouping hosts by registrable domain."""
+    hosts = [
+        "example.com",
+        "www.example.co.uk",
+        "a.b.c.d.example.co.uk",
+        "user.github.io",
+        "www.city.kobe.jp",
+        "cdn.s3.amazonaws.com",
+        "host.notatld",
+    ]
+    values = [f"h{idx}.{hosts[idx % len(hosts)]}" for idx in range(rows)]
+
+    def cold():
+        psl._trie = None  # type: ignore
+        registrable_domain("example.com")
+
+    print(f"compile trie:        {_best(cold) * 1e3:>10.2f} ms")
+    elapsed = _best(lambda: [registrable_domain(value) for value in values])
+    print(f"registrable_domain:  {len(values) / elapsed:>10.0f} /s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
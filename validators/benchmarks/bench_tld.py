@@ -0,0 +1,59 @@
+"""Benchmark IANA TLD lookups, cold and warm, against rescanning `_tld.txt`.
+
+Also times reloading the registry from a file.
+
+Run with `python benchmarks/bench_tld.py [lookups]` from the project root.
+"""
+
+# standard
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+
+sys.path.insert(0, "src")
+
+# local
+from validators import tld  # noqa: E402
+from validators.tld import _check  # type: ignore # noqa: E402
+
+_TLD_FILE = Path("src/validators/_tld.txt")
+
+
+def _rescan(tld: str):
+    """Lookup as done before the list was kept in memory."""
+    with _TLD_FILE.open() as tld_f:
+        _ = next(tld_f)
+        return tld in (line.strip() for line in tld_f)
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _cold():
+    tld._registry = None  # type: ignore
+    _check("NINJA")
+
+
+def main(lookups: int):
+    """Compare lookup costs."""
+    tlds = ["NINJA", "XN--P1AI", "ZW", "NOTATLD"] * (lookups // 4)
+    cold = _best(_cold)
+    warm = _best(lambda: [_check(name) for name in tlds])
+    rescan = _best(lambda: [_rescan(name) for name in tlds[:1_000]])
+    reload = _best(lambda: tld.load(_TLD_FILE))
+    print(f"cold, first lookup:  {cold * 1e3:>10.3f} ms")
+    print(f"warm, per lookup:    {warm / len(tlds) * 1e6:>10.3f} us")
+    print(f"rescan, per lookup:  {rescan / 1_000 * 1e6:>10.3f} us")
+    print(f"reload from file:    {reload * 1e3:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,85 @@
+"""Benchmark `url` against the `urlsplit` and `parse_qs` implementation.
+
+Run with `python benchmarks/bench_url.py [rows]` from the project root.
+"""
+
+# standard
+import re
+import sys
+from time import perf_counter
+from typing import Any, Callable, List
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, "src")
+
+# local
+from validators.url import (  # noqa: E402
+    _netloc_checker,  # type: ignore
+    _path_regex,  # type: ignore
+    _url_checker,  # type: ignore
+    _validate_scheme,  # type: ignore
+)
+
+_netloc = _netloc_checker(False, False, True, False, False, None, False, False, False)
+
+
+def _legacy(value: str):
+    """URL check as done before `_split_url`."""
+    if not value or re.search(r"\s", value):
+        return False
+    try:
+        scheme, netloc, path, query, fragment = urlsplit(value)
+    except ValueError:
+        return False
+    if not (_validate_scheme(scheme) and _netloc(netloc)):
+        return False
+    if path and not _path_regex().match(path):
+        return False
+    try:
+        if query:
+            parse_qs(query, strict_parsing=True, separator="&")
+            parse_qs(query, strict_parsing=True, separator=";")
+    except ValueError:
+        return False
+    return not fragment or bool(
+        re.fullmatch(r"[0-9a-z?/:@\-._~%!$&'()*+,;=#]*", fragment, re.IGNORECASE)
+    )
+
+
+def _best(run: Callable[[], Any], repeat: int = 3):
+    """Fastest of `repeat` runs, in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def _compare(name: str, values: List[str]):
+    check = _url_checker()
+    assert [_legacy(value) for value in values] == [bool(check(value)) for value in values]
+    # `urlsplit` keeps an lru_cache, start each run without it
+    legacy = _best(lambda: (urlsplit.cache_clear(), [_legacy(value) for value in values]))  # type: ignore
+    scanned = _best(lambda: [check(value) for value in values])
+    print(
+        f"{name:<10}{len(values) / legacy:>12.0f}{len(values) / scanned:>12.0f}"
+        + f"{legacy / scanned:>10.2f}x"
+    )
+
+
+def main(rows: int):
+    """Compare both approaches."""
+    print(f"rows: {rows}, rows/s of:")
+    print(f"{'':<10}{'legacy':>12}{'scanner':>12}{'speedup':>11}")
+    _compare("plain", [f"https://host{idx}.example.com/" for idx in range(rows)])
+    _compare(
+        "query",
+        [f"https://example.com/p/{idx}?a={idx}&b=2&c=3#top" for idx in range(rows)],
+    )
+    _compare("auth", [f"ftp://user{idx}:pw@10.0.{idx % 256}.1:21/f" for idx in range(rows)])
+    _compare("invalid", [f"https://example.com/?q{idx}&x" for idx in range(rows)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
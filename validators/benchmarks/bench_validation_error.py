@@ -0,0 +1,72 @@
+"""Benchmark `ValidationError` allocation per failure.
+
+Run with `python benchmarks/bench_validation_error.py` from the project root.
+"""
+
+# standard
+from inspect import getfullargspec
+from itertools import chain
+import sys
+from timeit import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+sys.path.insert(0, "src")
+
+# local
+from validators import ValidationError, between  # noqa: E402
+
+
+class _EagerValidationError(Exception):
+    """`ValidationError` as it was before arguments were captured lazily."""
+
+    def __init__(self, function: Callable[..., Any], arg_dict: Dict[str, Any], message: str = ""):
+        if message:
+            self.reason = message
+        self.func = function
+        self.__dict__.update(arg_dict)
+
+
+def _eager_failure(func: Callable[..., Any], *args: Any, **kwargs: Any):
+    return _EagerValidationError(
+        func,
+        dict(
+            list(zip(dict.fromkeys(chain(getfullargspec(func)[0], kwargs.keys())), args))
+            + list(kwargs.items())
+        ),
+    )
+
+
+def _allocated(build: Callable[[], Any], rounds: int = 10_000):
+    """Bytes allocated per object, while keeping all objects alive."""
+    tracemalloc.start()
+    keep = [build() for _ in range(rounds)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return size / rounds
+
+
+def _deferred_failure(
+    func: Callable[..., Any], arg_names: Tuple[str, ...], *args: Any, **kwargs: Any
+):
+    """`ValidationError` as `validator` builds it, argument names read once."""
+    return ValidationError(func, kwargs, args=args, arg_names=arg_names)
+
+
+def main():
+    """Compare eager and deferred failures, built from the same arguments."""
+    func: Callable[..., Any] = between.__wrapped__  # type: ignore
+    arg_names = tuple(getfullargspec(func).args)
+    eager = lambda: _eager_failure(func, 3, min_val=4, max_val=5)  # noqa: E731
+    lazy = lambda: _deferred_failure(func, arg_names, 3, min_val=4, max_val=5)  # noqa: E731
+    assert vars(eager()) == vars(lazy())
+
+    print(f"{'':<10}{'bytes/failure':>15}{'usec/failure':>15}")
+    for name, build in (("eager", eager), ("deferred", lazy)):
+        usec = timeit(build, number=100_000) * 10
+        print(f"{name:<10}{_allocated(build):>15.0f}{usec:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,39 @@
 """Validate Anything!"""
 
 # local
+from . import cache, fast, tld
+from .batch import BatchResult, batch, batched_by
 from .between import between
-from .card import amex, card_number, diners, discover, jcb, mastercard, mir, unionpay, visa
+from .card import (
+    amex,
+    card_brand,
+    card_number,
+    card_number_batch,
+    diners,
+    discover,
+    jcb,
+    mastercard,
+    mir,
+    unionpay,
+    visa,
+)
 from .country import calling_code, country_code, currency
 from .cron import cron
 from .crypto_addresses import bsc_address, btc_address, eth_address, trx_address
 from .domain import domain
-from .email import email
+from .email import email, email_stream
 from .encoding import base16, base32, base58, base64
-from .finance import cusip, isin, sedol
+from .finance import (
+    creditor_reference,
+    creditor_reference_batch,
+    cusip,
+    isin,
+    lei,
+    lei_batch,
+    sedol,
+)
 from .hashes import md5, sha1, sha224, sha256, sha384, sha512
-from .hostname import hostname
+from .hostname import classify_host, hostname
 from .i18n import (
     es_cif,
     es_doi,
@@ -25,16 +47,30 @@ from .i18n import (
     ind_pan,
     ru_inn,
 )
-from .iban import iban
-from .ip_address import ipv4, ipv6
+from .iban import IBANParts, iban, iban_batch, mod97_10, parse_iban
+from .ip_address import ip_category, ipv4, ipv6
 from .length import length
 from .mac_address import mac_address
+from .networks import NetworkReport, NetworkSet, analyse_networks, ip_in_networks
+from .parallel import ParallelResult, parallel, parallel_chunks
+from .psl import public_suffix, registrable_domain
 from .slug import slug
-from .url import url
-from .utils import ValidationError, validator
+from .url import URLParts, parse_url, url
+from .utils import (
+    ValidationError,
+    as_bool,
+    compile as compile,  # not in `__all__`, a star import keeps the builtin
+    compiled_by,
+    refresh_env,
+    validator,
+)
 from .uuid import uuid
 
 __all__ = (
+    # batch
+    "batch",
+    "batched_by",
+    "BatchResult",
     # ...
     "between",
     # crypto_addresses
@@ -44,7 +80,9 @@ __all__ = (
     "trx_address",
     # cards
     "amex",
+    "card_brand",
     "card_number",
+    "card_number_batch",
     "diners",
     "discover",
     "jcb",
@@ -60,16 +98,21 @@ __all__ = (
     "cron",
     # ...
     "domain",
-    # ...
+    # email
     "email",
+    "email_stream",
     # encodings
     "base16",
     "base32",
     "base58",
     "base64",
     # finance
+    "creditor_reference",
+    "creditor_reference_batch",
     "cusip",
     "isin",
+    "lei",
+    "lei_batch",
     "sedol",
     # hashes
     "md5",
@@ -79,6 +122,7 @@ __all__ = (
     "sha384",
     "sha512",
     # ...
+    "classify_host",
     "hostname",
     # i18n
     "es_cif",
@@ -93,22 +137,50 @@ __all__ = (
     "ind_pan",
     "ru_inn",
     # ...
+    "IBANParts",
     "iban",
+    "iban_batch",
+    "mod97_10",
+    "parse_iban",
     # ip_addresses
+    "ip_category",
     "ipv4",
     "ipv6",
+    # networks
+    "analyse_networks",
+    "ip_in_networks",
+    "NetworkReport",
+    "NetworkSet",
     # ...
     "length",
     # ...
     "mac_address",
+    # parallel
+    "parallel",
+    "parallel_chunks",
+    "ParallelResult",
+    # psl
+    "public_suffix",
+    "registrable_domain",
     # ...
     "slug",
-    # ...
+    # url
+    "parse_url",
     "url",
+    "URLParts",
     # ...
     "uuid",
+    # memoization
+    "cache",
+    # plain-bool variants
+    "fast",
+    # top level domains
+    "tld",
     # utils
     "ValidationError",
+    "as_bool",
+    "compiled_by",
+    "refresh_env",
     "validator",
 )
 
@@ -0,0 +1,198 @@
+"""Validate newline-delimited values from the command line.
+
+Examples:
+    $ python -m validators email addresses.txt --format failures
+    $ zcat urls.gz | python -m validators url --opt consider_tld=true -j 8 -f jsonl
+"""
+
+# standard
+from argparse import ArgumentParser, ArgumentTypeError
+from ast import literal_eval
+from inspect import signature
+from json import dumps
+from mmap import ACCESS_READ, mmap
+from os import (
+    O_WRONLY,
+    devnull,
+    dup2,
+    fstat,
+    open as os_open,
+)
+import sys
+from time import perf_counter
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+# local
+import validators
+from validators.parallel import parallel_chunks
+from validators.utils import as_bool
+
+_ENCODING = "utf-8"
+_ERRORS = "surrogateescape"
+
+
+def _validator_names():
+    """Names of the validators exported by the package."""
+    for name in validators.__all__:
+        try:
+            as_bool(getattr(validators, name))
+        except TypeError:
+            continue
+        yield name
+
+
+def _option(value: str) -> Tuple[str, Any]:
+    """Parse `key=value` into a keyword argument."""
+    key, sep, raw = value.partition("=")
+    if not sep or not key.isidentifier():
+        raise ArgumentTypeError(f"expected KEY=VALUE, got {value!r}")
+    keywords = {"true": True, "false": False, "none": None}
+    if raw.lower() in keywords:
+        return key, keywords[raw.lower()]
+    try:
+        return key, literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return key, raw
+
+
+def _count(minimum: int):
+    """Argument type of integers no less than `minimum`."""
+
+    def convert(value: str):
+        try:
+            count = int(value)
+        except ValueError:
+            count = minimum - 1
+        if count < minimum:
+            raise ArgumentTypeError(f"expected an integer of at least {minimum}, got {value!r}")
+        return count
+
+    return convert
+
+
+def _map_file(path: str) -> Optional[mmap]:
+    """Read-only memory map of a file, `None` if it is empty."""
+    with open(path, "rb") as source:
+        if fstat(source.fileno()).st_size == 0:
+            return None
+        # the map keeps its own handle on the file
+        return mmap(source.fileno(), 0, access=ACCESS_READ)
+
+
+def _mapped_lines(mapped: Optional[mmap]) -> Iterator[str]:
+    """Yield lines of a memory mapped file, then close the map."""
+    if mapped is None:
+        return
+    with mapped:
+        for line in iter(mapped.readline, b""):
+            yield line.rstrip(b"\r\n").decode(_ENCODING, _ERRORS)
+
+
+def _stream_lines(stream: TextIO) -> Iterator[str]:
+    """Yield lines of a text stream."""
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def _formatter(name: str) -> Callable[[List[str], bytearray], str]:
+    """Render one validated chunk."""
+    if name == "jsonl":
+        return lambda chunk, flags: "".join(
+            dumps({"value": value, "valid": bool(flag)}) + "\n" for value, flag in zip(chunk, flags)
+        )
+    if name == "failures":
+        return lambda chunk, flags: "".join(
+            value + "\n" for value, flag in zip(chunk, flags) if not flag
+        )
+    return lambda chunk, flags: "".join(
+        ("pass\t" if flag else "fail\t") + value + "\n" for value, flag in zip(chunk, flags)
+    )
+
+
+def _parser():
+    parser = ArgumentParser(
+        prog="python -m validators",
+        description="Validate newline-delimited values, one per line.",
+    )
+    parser.add_argument("validator", choices=list(_validator_names()), metavar="validator")
+    parser.add_argument("source", nargs="?", default="-", help="input file, `-` for stdin")
+    parser.add_argument(
+        "-o",
+        "--opt",
+        type=_option,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="keyword argument passed to the validator, may be repeated",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("status", "jsonl", "failures"),
+        default="status",
+        help="`pass`/`fail` per line (default), JSON lines or only the failing lines",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=_count(0), default=1, help="worker processes, 0 for one per CPU"
+    )
+    parser.add_argument(
+        "--chunk-size", type=_count(1), default=10_000, help="values per chunk (default: 10000)"
+    )
+    parser.add_argument("--stats", action="store_true", help="print throughput to stderr")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Run the command line interface.
+
+    Args:
+        argv:
+            Command line arguments, defaults to `sys.argv[1:]`.
+
+    Returns:
+        (int): `0` if every value is valid, `1` otherwise, or if the
+            output was closed before every value was written.
+    """
+    parser = _parser()
+    args = parser.parse_intermixed_args(argv)
+    validator = getattr(validators, args.validator)
+    options = dict(args.opt)
+    try:
+        signature(validator).bind("", **options)
+    except TypeError as err:
+        parser.error(f"invalid options for {args.validator}: {err}")
+    render = _formatter(args.format)
+    if args.source == "-":
+        values = _stream_lines(sys.stdin)
+    else:
+        try:
+            values = _mapped_lines(_map_file(args.source))
+        except OSError as err:
+            parser.error(f"cannot read {args.source}: {err}")
+    total = failed = 0
+    start = perf_counter()
+    try:
+        for chunk, flags in parallel_chunks(
+            validator, values, jobs=args.jobs or None, chunk_size=args.chunk_size, **options
+        ):
+            sys.stdout.write(render(chunk, flags))
+            total += len(flags)
+            failed += flags.count(0)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reader is gone, as with `| head`, so the flush at exit would fail too
+        dup2(os_open(devnull, O_WRONLY), sys.stdout.fileno())
+        return 1
+    if args.stats:
+        elapsed = perf_counter() - start
+        sys.stderr.write(
+            f"{total} values, {failed} failed, {elapsed:.3f}s, "
+            + f"{total / elapsed if elapsed else 0:.0f} values/s\n"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.stdin.reconfigure(encoding=_ENCODING, errors=_ERRORS)  # type: ignore
+    sys.stdout.reconfigure(encoding=_ENCODING, errors=_ERRORS)  # type: ignore
+    sys.exit(main())
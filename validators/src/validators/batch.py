@@ -0,0 +1,133 @@
+"""Batch."""
+
+# standard
+from array import array
+from functools import partial
+from inspect import signature
+from typing import Any, Callable, Iterable, Optional
+
+# local
+from .utils import as_bool
+
+
+class BatchResult:
+    """Pass/fail flags of a batch validation.
+
+    `flags` holds one byte per input value, `1` if it passed and `0` if
+    it failed. Indexes of the failures are collected on first access.
+    """
+
+    __slots__ = ("flags", "_failures")
+
+    def __init__(self, flags: bytearray):
+        """Initialize Batch Result."""
+        self.flags = flags
+        self._failures: Optional["array[int]"] = None
+
+    @property
+    def failures(self):
+        """Indexes of the values which failed validation."""
+        if self._failures is None:
+            failures: "array[int]" = array("q")
+            find, idx = self.flags.find, -1
+            while (idx := find(0, idx + 1)) != -1:
+                failures.append(idx)
+            self._failures = failures
+        return self._failures
+
+    @property
+    def passed(self):
+        """Number of values which passed validation."""
+        return len(self.flags) - len(self.failures)
+
+    def __len__(self):
+        """Number of validated values."""
+        return len(self.flags)
+
+    def __bool__(self):
+        """Whether every value passed validation."""
+        return 0 not in self.flags
+
+    def __repr__(self):
+        """Repr Batch Result."""
+        return f"BatchResult(total={len(self)}, failed={len(self.failures)})"
+
+
+def batched_by(bulk: Callable[..., Iterable[Any]]):
+    """Register how `batch` validates many values with a validator.
+
+    `bulk` takes the values and the keyword options of the validator,
+    and yields, in order, what its plain-bool variant would return for
+    each value. It may share work between values, which the validator
+    alone cannot do.
+
+    Examples:
+        >>> from validators import validator
+        >>> def _multiple_flags(values, *, of=2):
+        ...     return (not (value % of) for value in values)
+        >>> @batched_by(_multiple_flags)
+        ... @validator
+        ... def multiple(value, /, *, of=2):
+        ...     return not (value % of)
+        >>> batch(multiple, [3, 4, 9], of=3)
+        BatchResult(total=3, failed=1)
+
+    Args:
+        bulk:
+            Function validating an iterable of values.
+
+    Returns:
+        (Callable[[Callable[..., Any]], Callable[..., Any]]):
+            A decorator for functions decorated with `validator`.
+    """
+
+    def register(func: Callable[..., Any]):
+        setattr(func, "_batcher", bulk)
+        return func
+
+    return register
+
+
+def batch(validator: Callable[..., Any], values: Iterable[Any], /, **options: Any):
+    """Validate many values at once with the same validator.
+
+    Uses the plain-bool variant of `validator`, so no `ValidationError`
+    is built for failing values, and `options` are bound only once.
+    Validators registered with `batched_by` are run through their bulk
+    implementation instead, as `email` is through `email_stream`, which
+    checks each distinct domain part once. That makes lists repeating
+    few domains several times faster, while lists of distinct domains
+    validate about as fast as calling `email` on each value.
+
+    Examples:
+        >>> from validators import email
+        >>> result = batch(email, ['a@example.com', 'bogus@@', 'b@example.com'])
+        >>> result
+        BatchResult(total=3, failed=1)
+        >>> list(result.flags), list(result.failures)
+        ([1, 0, 1], [1])
+        >>> bool(batch(email, ['a@example.com']))
+        True
+
+    Args:
+        validator:
+            Function decorated with `validator`.
+        values:
+            Values to validate.
+        **options:
+            Keyword arguments passed to `validator` with every value.
+
+    Returns:
+        (BatchResult): Pass/fail flags of `values`, in order.
+
+    Raises:
+        (TypeError): If `validator` is not decorated with `validator`,
+            or does not accept `options`.
+    """
+    check = partial(as_bool(validator), **options) if options else as_bool(validator)
+    signature(validator).bind(None, **options)
+    bulk: Optional[Callable[..., Iterable[Any]]] = getattr(validator, "_batcher", None)
+    if bulk is not None:
+        return BatchResult(bytearray(bulk(values, **options)))
+    # bools are ints, so the loop happens inside `bytearray`
+    return BatchResult(bytearray(map(check, values)))
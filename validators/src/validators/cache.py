@@ -0,0 +1,291 @@
+"""Cache."""
+
+# standard
+from collections import OrderedDict
+from functools import wraps
+from sys import getsizeof
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the memoization cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+    nbytes: int
+    max_bytes: Optional[int]
+
+
+class _LRUStore:
+    """Thread-safe LRU mapping of call keys to results."""
+
+    __slots__ = (
+        "_entries",
+        "_lock",
+        "maxsize",
+        "max_bytes",
+        "nbytes",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, maxsize: int, max_bytes: Optional[int]):
+        """Initialize LRU Store."""
+        self._entries: "OrderedDict[Hashable, Tuple[bool, int]]" = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable):
+        """Cached result of `key`, `None` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: bool, size: int):
+        """Store `result`, evicting least recently used entries over budget."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (result, size)
+            self.nbytes += size
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def info(self):
+        """Snapshot of the statistics."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self.maxsize,
+                self.nbytes,
+                self.max_bytes,
+            )
+
+
+_store: Optional[_LRUStore] = None
+# results of the netloc check in `url`, keyed on netloc and host options
+_netloc_store: Optional[_LRUStore] = None
+
+
+def enable(maxsize: int = 4096, max_bytes: Optional[int] = None):
+    """Memoize the results of the expensive validators.
+
+    `url`, `email`, `domain`, `hostname`, `btc_address` and `eth_address`
+    then remember the outcome for each value and set of options, and
+    return it without validating again. Least recently used entries are
+    evicted once there are more than `maxsize` of them, or once their
+    approximate size exceeds `max_bytes`. Enabling again starts with an
+    empty cache. Values that raise, or are not hashable, are not cached.
+    Specialised by `compile`, `url`, `email`, `domain` and `hostname`
+    resolve their options ahead of the cache and are not memoized.
+
+    Examples:
+        >>> enable(maxsize=128, max_bytes=1 << 20)
+        >>> info().maxsize, info().max_bytes
+        (128, 1048576)
+        >>> disable()
+
+    Args:
+        maxsize:
+            Maximum number of cached results.
+        max_bytes:
+            Maximum approximate size of the cached entries, in bytes.
+
+    Raises:
+        (ValueError): If `maxsize` or `max_bytes` is less than one.
+    """
+    global _store
+    _store = _new_store(maxsize, max_bytes)
+
+
+def _new_store(maxsize: int, max_bytes: Optional[int]):
+    if maxsize < 1 or (max_bytes is not None and max_bytes < 1):
+        raise ValueError("`maxsize` and `max_bytes` must be at least one")
+    return _LRUStore(maxsize, max_bytes)
+
+
+def disable():
+    """Stop memoizing and drop the cache.
+
+    Examples:
+        >>> disable()
+        >>> info()
+        CacheInfo(hits=0, misses=0, evictions=0, currsize=0, maxsize=0, nbytes=0, max_bytes=None)
+    """
+    global _store
+    _store = None
+
+
+def clear():
+    """Drop the cached results and statistics, keeping the caches enabled.
+
+    Both the memoization and the netloc cache are cleared.
+
+    Examples:
+        >>> enable()
+        >>> clear()
+        >>> info().currsize
+        0
+        >>> disable()
+    """
+    if (store := _store) is not None:
+        enable(store.maxsize, store.max_bytes)
+    if (store := _netloc_store) is not None:
+        enable_netloc(store.maxsize, store.max_bytes)
+
+
+def info():
+    """Hits, misses, evictions and size of the cache.
+
+    Examples:
+        >>> enable(maxsize=2)
+        >>> info()
+        CacheInfo(hits=0, misses=0, evictions=0, currsize=0, maxsize=2, nbytes=0, max_bytes=None)
+        >>> disable()
+
+    Returns:
+        (CacheInfo): Statistics since the cache was last enabled or cleared,
+            all zeros if it is disabled.
+    """
+    if (store := _store) is None:
+        return CacheInfo(0, 0, 0, 0, 0, 0, None)
+    return store.info()
+
+
+def enable_netloc(maxsize: int = 4096, max_bytes: Optional[int] = None):
+    """Memoize the network location check of `url`.
+
+    Bulk URLs tend to repeat a few hosts with distinct paths, that the
+    memoization cache of `enable` cannot share. The netloc cache then
+    remembers the outcome of the `[userinfo@]host[:port]` check for each
+    netloc and set of host options, while scheme, path, query and
+    fragment are still validated for each URL. It also applies to `url`
+    specialised by `compile`, and to `parse_url`. Least recently used
+    entries are evicted over `maxsize` of them, or over `max_bytes`.
+    Enabling again starts with an empty cache.
+
+    Examples:
+        >>> enable_netloc(maxsize=1024)
+        >>> netloc_info().maxsize
+        1024
+        >>> disable_netloc()
+
+    Args:
+        maxsize:
+            Maximum number of cached netlocs.
+        max_bytes:
+            Maximum approximate size of the cached entries, in bytes.
+
+    Raises:
+        (ValueError): If `maxsize` or `max_bytes` is less than one.
+    """
+    global _netloc_store
+    _netloc_store = _new_store(maxsize, max_bytes)
+
+
+def disable_netloc():
+    """Stop memoizing the netloc check of `url` and drop its cache.
+
+    Examples:
+        >>> disable_netloc()
+        >>> netloc_info().currsize
+        0
+    """
+    global _netloc_store
+    _netloc_store = None
+
+
+def netloc_info():
+    """Hits, misses, evictions and size of the netloc cache.
+
+    A low hit rate, `hits / (hits + misses)`, with many `evictions`
+    calls for a larger `maxsize`.
+
+    Examples:
+        >>> enable_netloc(maxsize=8)
+        >>> netloc_info()
+        CacheInfo(hits=0, misses=0, evictions=0, currsize=0, maxsize=8, nbytes=0, max_bytes=None)
+        >>> disable_netloc()
+
+    Returns:
+        (CacheInfo): Statistics since the netloc cache was last enabled or
+            cleared, all zeros if it is disabled.
+    """
+    if (store := _netloc_store) is None:
+        return CacheInfo(0, 0, 0, 0, 0, 0, None)
+    return store.info()
+
+
+def cached(func: Callable[..., Any]):
+    """Memoize `func` while the cache is enabled.
+
+    Applied below `validator`, to a function whose value is its only
+    positional argument. Keyword options are normalised against their
+    defaults, so that passing a default explicitly hits the same entry.
+
+    Examples:
+        >>> from validators import validator
+        >>> @validator
+        ... @cached
+        ... def even(value, /, *, strict=False):
+        ...     return not (value % 2)
+        >>> enable()
+        >>> even(4), even(4, strict=False), info().hits
+        (True, True, 1)
+        >>> disable()
+
+    Args:
+        func:
+            Function which is to be memoized.
+
+    Returns:
+        (Callable[..., Any]):
+            `func`, with its results kept while the cache is enabled.
+    """
+    defaults = tuple((func.__kwdefaults__ or {}).items())
+    names = frozenset(name for name, _ in defaults)
+
+    @wraps(func)
+    def memoized(*args: Any, **kwargs: Any):
+        store = _store
+        if store is None or len(args) != 1 or not names.issuperset(kwargs):
+            return func(*args, **kwargs)
+        value = args[0]
+        key = (
+            func,
+            value.__class__,
+            value,
+            *[kwargs.get(name, default) for name, default in defaults],
+        )
+        try:
+            result = store.get(key)
+        except TypeError:
+            # unhashable value or option
+            return func(*args, **kwargs)
+        if result is None:
+            result = bool(func(*args, **kwargs))
+            store.put(key, result, getsizeof(key) + getsizeof(value))
+        return result
+
+    return memoized
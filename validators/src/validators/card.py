@@ -1,11 +1,51 @@
 """Card."""
 
 # standard
-import re
+from bisect import bisect_right
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, FrozenSet, List, Optional, Tuple
 
 # local
+from .batch import BatchResult
 from .utils import validator
 
+numpy: Any = None
+try:
+    # external, optional
+    numpy = import_module("numpy")
+except ImportError:
+    pass
+
+# digit sum of each digit doubled, by ASCII code of the digit
+_DOUBLED = bytes.maketrans(b"0123456789", bytes((0, 2, 4, 6, 8, 1, 3, 5, 7, 9)))
+# rows of an array checked at once, to bound temporary arrays to a few MiB
+_ARRAY_CHUNK = 1 << 16
+
+# Issuer identification number ranges, over the first six digits, and
+# lengths of the card numbers issued in them. Ranges co-branded with
+# another brand, such as Discover cards in 622126-622925, are omitted.
+# ref: https://en.wikipedia.org/wiki/Payment_card_number
+_IIN_RANGES = (
+    ("2200", "2204", "mir", range(16, 20)),
+    ("2221", "2720", "mastercard", (16,)),
+    ("300", "305", "diners", range(14, 20)),
+    ("3095", "3095", "diners", range(14, 20)),
+    ("34", "34", "amex", (15,)),
+    ("3528", "3589", "jcb", range(16, 20)),
+    ("36", "36", "diners", range(14, 20)),
+    ("37", "37", "amex", (15,)),
+    ("38", "39", "diners", range(14, 20)),
+    ("4", "4", "visa", (13, 16, 19)),
+    ("51", "55", "mastercard", (16,)),
+    ("6011", "6011", "discover", range(16, 20)),
+    ("62", "62", "unionpay", range(16, 20)),
+    ("644", "649", "discover", range(16, 20)),
+    ("65", "65", "discover", range(16, 20)),
+    ("81", "81", "unionpay", range(16, 20)),
+)
+_IIN_DIGITS = 6
+
 
 @validator
 def card_number(value: str, /):
@@ -29,15 +69,147 @@ def card_number(value: str, /):
         (Literal[True]): If `value` is a valid generic card number.
         (ValidationError): If `value` is an invalid generic card number.
     """
-    if not value:
-        return False
-    try:
-        digits = list(map(int, value))
-        odd_sum = sum(digits[-1::-2])
-        even_sum = sum(sum(divmod(2 * d, 10)) for d in digits[-2::-2])
-        return (odd_sum + even_sum) % 10 == 0
-    except ValueError:
-        return False
+    return (digits := _digits(value)) is not None and _luhn(digits)
+
+
+def _digits(value: object):
+    """ASCII digits of a card number, `None` if it has anything else."""
+    if isinstance(value, str):
+        try:
+            # other decimal digits are accepted, like `int` does
+            value = "".join(str(int(char)) for char in value) if not value.isascii() else value
+        except ValueError:
+            return None
+        value = value.encode("ascii")
+    elif not isinstance(value, bytes):
+        return None
+    return value if value.isdigit() else None
+
+
+def _luhn(digits: bytes):
+    """Whether ASCII `digits` pass Luhn's check.
+
+    Digits to double are mapped to the digit sum of their double with a
+    translation table, so that both halves are summed as byte strings.
+    """
+    odd = digits[-1::-2]
+    return (sum(odd) - 0x30 * len(odd) + sum(digits[-2::-2].translate(_DOUBLED))) % 10 == 0
+
+
+def _luhn_array(values: Any) -> Any:
+    """Luhn's check of a NumPy array of strings, one vectorised pass per chunk.
+
+    Strings shorter than the width of the array are padded with NUL
+    characters, so each row is made of digits followed by padding. Rows
+    with non-ASCII characters, which may be other decimal digits, are
+    checked one by one like `card_number` does.
+    """
+    # native byte order, so that code points are read as they are
+    values = numpy.ascontiguousarray(values, values.dtype.newbyteorder("=")).reshape(-1)
+    code = numpy.uint8 if values.dtype.kind == "S" else numpy.uint32
+    width = values.dtype.itemsize // numpy.dtype(code).itemsize
+    columns = numpy.arange(width)
+    table = numpy.array((0, 2, 4, 6, 8, 1, 3, 5, 7, 9), dtype=numpy.uint8)
+    result = numpy.zeros(len(values), dtype=bool)
+    for start in range(0, len(values) if width else 0, _ARRAY_CHUNK):
+        codes = values[start : start + _ARRAY_CHUNK].view(code).reshape(-1, width)
+        # unsigned, so codes below "0" wrap around past 9
+        digits = codes - code(0x30)
+        is_digit = digits < 10
+        lengths = is_digit.sum(axis=1)
+        valid = (lengths > 0) & (is_digit | (codes == 0)).all(axis=1)
+        valid &= (is_digit == (columns < lengths[:, None])).all(axis=1)
+        digits = numpy.where(is_digit, digits, 0).astype(numpy.uint8)
+        # every other digit is doubled, counting from the last one
+        doubled = ((lengths[:, None] - 1 - columns) & 1).astype(bool)
+        total = numpy.where(doubled, table[digits], digits).sum(axis=1, dtype=numpy.uint32)
+        result[start : start + len(codes)] = valid & (total % 10 == 0)
+        if code is numpy.uint32:
+            for row in numpy.flatnonzero((codes > 0x7F).any(axis=1)):
+                value = str(values[start + row])
+                result[start + row] = (digits := _digits(value)) is not None and _luhn(digits)
+    return result
+
+
+def card_number_batch(values: Any, /):
+    """Validate many card numbers at once with Luhn's algorithm.
+
+    Card numbers, as strings or bytes, are checked like `card_number`
+    does, without building a `ValidationError` for failing ones. If
+    [NumPy][1] is installed, a NumPy array of fixed-width strings (of
+    `S` or `U` dtype) is checked in a few vectorised passes instead.
+
+    [1]: https://numpy.org/
+
+    Examples:
+        >>> result = card_number_batch(['4242424242424242', '4242424242424241', b'79927398713'])
+        >>> result
+        BatchResult(total=3, failed=1)
+        >>> list(result.flags)
+        [1, 0, 1]
+
+    Args:
+        values:
+            Card numbers, or a NumPy array of them.
+
+    Returns:
+        (BatchResult): Pass/fail flags of `values`, in order.
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray) and values.dtype.kind in "SU":
+        return BatchResult(bytearray(_luhn_array(values).tobytes()))
+    return BatchResult(
+        bytearray((digits := _digits(value)) is not None and _luhn(digits) for value in values)
+    )
+
+
+@lru_cache
+def _iin_table():
+    """First and last six digit IIN of each range, with its brand and lengths."""
+    starts: List[int] = []
+    ends: List[Tuple[int, str, FrozenSet[int]]] = []
+    for low, high, brand, lengths in _IIN_RANGES:
+        # ranges are sorted and disjoint, so a single `bisect` finds the one
+        starts.append(int(low.ljust(_IIN_DIGITS, "0")))
+        ends.append((int(high.ljust(_IIN_DIGITS, "9")), brand, frozenset(lengths)))
+    return starts, ends
+
+
+def card_brand(value: str, /) -> Optional[str]:
+    """Return the brand of a card number.
+
+    The number is checked with Luhn's algorithm once, then its first six
+    digits are looked up, with a binary search, in a table of the issuer
+    identification number ranges of each brand, such as 2221-2720 for
+    Mastercard or 644-649 for Discover, along with the card number
+    lengths of the brand. The brand validators, like `visa`, use it.
+
+    Examples:
+        >>> card_brand('4242424242424242')
+        'visa'
+        >>> card_brand('2223003122003222')
+        'mastercard'
+        >>> card_brand('6445644564456445')
+        'discover'
+        >>> card_brand('4242424242424241') is None
+        True
+
+    Args:
+        value:
+            Card number string.
+
+    Returns:
+        (Literal["amex", "diners", "discover", "jcb", "mastercard", "mir", "unionpay", "visa"]):
+            The brand, named like its validator.
+        (None): If `value` is not a valid card number of a known brand.
+    """
+    if (digits := _digits(value)) is None or len(digits) < _IIN_DIGITS or not _luhn(digits):
+        return None
+    starts, ends = _iin_table()
+    iin = int(digits[:_IIN_DIGITS])
+    if (idx := bisect_right(starts, iin) - 1) < 0:
+        return None
+    end, brand, lengths = ends[idx]
+    return brand if iin <= end and len(digits) in lengths else None
 
 
 @validator
@@ -58,8 +230,7 @@ def visa(value: str, /):
         (Literal[True]): If `value` is a valid Visa card number.
         (ValidationError): If `value` is an invalid Visa card number.
     """
-    pattern = re.compile(r"^4")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "visa"
 
 
 @validator
@@ -80,8 +251,7 @@ def mastercard(value: str, /):
         (Literal[True]): If `value` is a valid Mastercard card number.
         (ValidationError): If `value` is an invalid Mastercard card number.
     """
-    pattern = re.compile(r"^(51|52|53|54|55|22|23|24|25|26|27)")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "mastercard"
 
 
 @validator
@@ -102,8 +272,7 @@ def amex(value: str, /):
         (Literal[True]): If `value` is a valid American Express card number.
         (ValidationError): If `value` is an invalid American Express card number.
     """
-    pattern = re.compile(r"^(34|37)")
-    return card_number(value) and len(value) == 15 and pattern.match(value)
+    return card_brand(value) == "amex"
 
 
 @validator
@@ -124,8 +293,7 @@ def unionpay(value: str, /):
         (Literal[True]): If `value` is a valid UnionPay card number.
         (ValidationError): If `value` is an invalid UnionPay card number.
     """
-    pattern = re.compile(r"^62")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "unionpay"
 
 
 @validator
@@ -146,8 +314,7 @@ def diners(value: str, /):
         (Literal[True]): If `value` is a valid Diners Club card number.
         (ValidationError): If `value` is an invalid Diners Club card number.
     """
-    pattern = re.compile(r"^(30|36|38|39)")
-    return card_number(value) and len(value) in {14, 16} and pattern.match(value)
+    return card_brand(value) == "diners"
 
 
 @validator
@@ -168,8 +335,7 @@ def jcb(value: str, /):
         (Literal[True]): If `value` is a valid JCB card number.
         (ValidationError): If `value` is an invalid JCB card number.
     """
-    pattern = re.compile(r"^35")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "jcb"
 
 
 @validator
@@ -190,8 +356,7 @@ def discover(value: str, /):
         (Literal[True]): If `value` is a valid Discover card number.
         (ValidationError): If `value` is an invalid Discover card number.
     """
-    pattern = re.compile(r"^(60|64|65)")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "discover"
 
 
 @validator
@@ -212,5 +377,4 @@ def mir(value: str, /):
         (Literal[True]): If `value` is a valid Mir card number.
         (ValidationError): If `value` is an invalid Mir card number.
     """
-    pattern = re.compile(r"^(220[0-4])")
-    return card_number(value) and len(value) == 16 and pattern.match(value)
+    return card_brand(value) == "mir"
@@ -5,6 +5,7 @@ from hashlib import sha256
 import re
 
 # local
+from validators.cache import cached
 from validators.utils import validator
 
 
@@ -24,6 +25,7 @@ def _validate_old_btc_address(addr: str):
 
 
 @validator
+@cached
 def btc_address(value: str, /):
     """Return whether or not given value is a valid bitcoin address.
 
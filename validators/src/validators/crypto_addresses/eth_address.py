@@ -4,6 +4,7 @@
 import re
 
 # local
+from validators.cache import cached
 from validators.utils import validator
 
 _keccak_flag = True
@@ -31,6 +32,7 @@ def _validate_eth_checksum_address(addr: str):
 
 
 @validator
+@cached
 def eth_address(value: str, /):
     """Return whether or not given value is a valid ethereum address.
 
@@ -1,45 +1,115 @@
 """Domain."""
 
 # standard
-from os import environ
-from pathlib import Path
+from encodings.idna import ToASCII, dots
+from functools import lru_cache
 import re
-from typing import Optional, Set
 
 # local
-from .utils import validator
+from .cache import cached
+from .psl import _labels, _match  # type: ignore
+from .tld import _check as _check_tld  # type: ignore
+from .utils import compiled_by, validator
+
+
+@lru_cache
+def _domain_regex(rfc_1034: bool, rfc_2782: bool):
+    """Domain validation regex."""
+    service_record = r"_" if rfc_2782 else ""
+    trailing_dot = r"\.?$" if rfc_1034 else r"$"
+    return re.compile(
+        # First character of the domain
+        rf"^(?:[a-z0-9{service_record}]"
+        # Sub-domain
+        + rf"(?:[a-z0-9-{service_record}]{{0,61}}"
+        # Hostname
+        + rf"[a-z0-9{service_record}])?\.)"
+        # First 61 characters of the gTLD
+        + r"+[a-z0-9][a-z0-9-_]{0,61}"
+        # Last character of the gTLD
+        + rf"[a-z]{trailing_dot}",
+        re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _label_to_ascii(label: str):
+    """Punycode conversion of one label, cached."""
+    return ToASCII(label).decode("ascii")
+
+
+def _to_ascii(value: str):
+    """Encode `value` like the `idna` codec does, but faster.
+
+    ASCII names only need the codec's label length checks. Other names
+    are converted label by label, and labels seen before are not
+    converted again.
+    """
+    if value.isascii():
+        if len(value) < 64 and ".." not in value and not value.startswith("."):
+            # no label can be empty or too long
+            return value
+        *labels, last = value.split(".")
+        if not all(0 < len(label) < 64 for label in labels):
+            raise UnicodeError("label empty or too long")
+        if len(last) >= 64:
+            raise UnicodeError("label too long")
+        return value
+    labels = dots.split(value)
+    trailing_dot = "." if labels and not labels[-1] else ""
+    if trailing_dot:
+        del labels[-1]
+    return ".".join(map(_label_to_ascii, labels)) + trailing_dot
+
+
+def _registrable(value: str):
+    """Whether `value` is under a listed public suffix, and not one itself."""
+    if (labels := _labels(value)) is None:
+        return False
+    size, listed = _match(labels)
+    return listed and len(labels) > size
 
 
-class _IanaTLD:
-    """Read IANA TLDs, and optionally cache them."""
+@lru_cache
+def _domain_checker(
+    consider_tld: bool = False, rfc_1034: bool = False, rfc_2782: bool = False, psl: bool = False
+):
+    """Domain check with its options resolved."""
+    check_tld = _check_tld if consider_tld else None
+    check_psl = _registrable if psl else None
+    forbidden = re.compile(r"\s|__+").search
+    pattern = _domain_regex(rfc_1034, rfc_2782).match
+
+    def check(value: str, /):
+        if not value:
+            return False
 
-    _full_cache: Optional[Set[str]] = None
-    # source: https://www.statista.com/statistics/265677
-    _popular_cache = {"COM", "ORG", "RU", "DE", "NET", "BR", "UK", "JP", "FR", "IT"}
-    _popular_cache.add("ONION")
+        if check_tld and not check_tld(value.rstrip(".").rsplit(".", 1)[-1].upper()):
+            return False
 
-    @classmethod
-    def _retrieve(cls):
-        with Path(__file__).parent.joinpath("_tld.txt").open() as tld_f:
-            _ = next(tld_f)  # ignore the first line
-            for line in tld_f:
-                yield line.strip()
+        try:
+            return (
+                not forbidden(value)
+                and bool(pattern(encoded := _to_ascii(value)))
+                and (check_psl is None or check_psl(encoded))
+            )
+        except UnicodeError as err:
+            raise UnicodeError(f"Unable to encode/decode {value}") from err
 
-    @classmethod
-    def check(cls, tld: str):
-        if tld in cls._popular_cache:
-            return True
-        if cls._full_cache is None:
-            if environ.get("PYVLD_CACHE_TLD") == "True":
-                cls._full_cache = set(cls._retrieve())
-            else:
-                return tld in cls._retrieve()
-        return tld in cls._full_cache
+    return check
 
 
+@compiled_by(_domain_checker)
 @validator
+@cached
 def domain(
-    value: str, /, *, consider_tld: bool = False, rfc_1034: bool = False, rfc_2782: bool = False
+    value: str,
+    /,
+    *,
+    consider_tld: bool = False,
+    rfc_1034: bool = False,
+    rfc_2782: bool = False,
+    psl: bool = False,
 ):
     """Return whether or not given value is a valid domain.
 
@@ -56,7 +126,7 @@ def domain(
         value:
             Domain string to validate.
         consider_tld:
-            Restrict domain to TLDs allowed by IANA.
+            Restrict domain to TLDs allowed by IANA, see `validators.tld`.
         rfc_1034:
             Allows optional trailing dot in the domain name.
             Ref: [RFC 1034](https://www.rfc-editor.org/rfc/rfc1034).
@@ -64,6 +134,9 @@ def domain(
             Domain name is of type service record.
             Allows optional underscores in the domain name.
             Ref: [RFC 2782](https://www.rfc-editor.org/rfc/rfc2782).
+        psl:
+            Require a suffix listed in the Public Suffix List, and at least
+            one label before it, see `validators.psl`.
 
 
     Returns:
@@ -73,29 +146,4 @@ def domain(
     Raises:
         (UnicodeError): If `value` cannot be encoded into `idna` or decoded into `utf-8`.
     """
-    if not value:
-        return False
-
-    if consider_tld and not _IanaTLD.check(value.rstrip(".").rsplit(".", 1)[-1].upper()):
-        return False
-
-    try:
-        service_record = r"_" if rfc_2782 else ""
-        trailing_dot = r"\.?$" if rfc_1034 else r"$"
-
-        return not re.search(r"\s|__+", value) and re.match(
-            # First character of the domain
-            rf"^(?:[a-z0-9{service_record}]"
-            # Sub-domain
-            + rf"(?:[a-z0-9-{service_record}]{{0,61}}"
-            # Hostname
-            + rf"[a-z0-9{service_record}])?\.)"
-            # First 61 characters of the gTLD
-            + r"+[a-z0-9][a-z0-9-_]{0,61}"
-            # Last character of the gTLD
-            + rf"[a-z]{trailing_dot}",
-            value.encode("idna").decode("utf-8"),
-            re.IGNORECASE,
-        )
-    except UnicodeError as err:
-        raise UnicodeError(f"Unable to encode/decode {value}") from err
+    return _domain_checker(consider_tld, rfc_1034, rfc_2782, psl)(value)
@@ -0,0 +1,207 @@
+"""Plain-bool validators.
+
+Undecorated twins of every validator in the package. They accept the same
+arguments but return `True` or `False`, never `ValidationError`, which makes
+them cheaper in tight loops where only the verdict matters.
+
+Examples:
+    >>> from validators import fast
+    >>> fast.email('someone@example.com')
+    True
+    >>> fast.email('bogus@@')
+    False
+"""
+
+# local
+from .between import between as _between
+from .card import (
+    amex as _amex,
+    card_number as _card_number,
+    diners as _diners,
+    discover as _discover,
+    jcb as _jcb,
+    mastercard as _mastercard,
+    mir as _mir,
+    unionpay as _unionpay,
+    visa as _visa,
+)
+from .country import (
+    calling_code as _calling_code,
+    country_code as _country_code,
+    currency as _currency,
+)
+from .cron import cron as _cron
+from .crypto_addresses import (
+    bsc_address as _bsc_address,
+    btc_address as _btc_address,
+    eth_address as _eth_address,
+    trx_address as _trx_address,
+)
+from .domain import domain as _domain
+from .email import email as _email
+from .encoding import (
+    base16 as _base16,
+    base32 as _base32,
+    base58 as _base58,
+    base64 as _base64,
+)
+from .finance import (
+    creditor_reference as _creditor_reference,
+    cusip as _cusip,
+    isin as _isin,
+    lei as _lei,
+    sedol as _sedol,
+)
+from .hashes import (
+    md5 as _md5,
+    sha1 as _sha1,
+    sha224 as _sha224,
+    sha256 as _sha256,
+    sha384 as _sha384,
+    sha512 as _sha512,
+)
+from .hostname import hostname as _hostname
+from .i18n import (
+    es_cif as _es_cif,
+    es_doi as _es_doi,
+    es_nie as _es_nie,
+    es_nif as _es_nif,
+    fi_business_id as _fi_business_id,
+    fi_ssn as _fi_ssn,
+    fr_department as _fr_department,
+    fr_ssn as _fr_ssn,
+    ind_aadhar as _ind_aadhar,
+    ind_pan as _ind_pan,
+    ru_inn as _ru_inn,
+)
+from .iban import iban as _iban
+from .ip_address import (
+    ipv4 as _ipv4,
+    ipv6 as _ipv6,
+)
+from .length import length as _length
+from .mac_address import mac_address as _mac_address
+from .networks import ip_in_networks as _ip_in_networks
+from .slug import slug as _slug
+from .uri import uri as _uri
+from .url import url as _url
+from .utils import as_bool
+from .uuid import uuid as _uuid
+
+between = as_bool(_between)
+bsc_address = as_bool(_bsc_address)
+btc_address = as_bool(_btc_address)
+eth_address = as_bool(_eth_address)
+trx_address = as_bool(_trx_address)
+amex = as_bool(_amex)
+card_number = as_bool(_card_number)
+diners = as_bool(_diners)
+discover = as_bool(_discover)
+jcb = as_bool(_jcb)
+mastercard = as_bool(_mastercard)
+unionpay = as_bool(_unionpay)
+visa = as_bool(_visa)
+mir = as_bool(_mir)
+calling_code = as_bool(_calling_code)
+country_code = as_bool(_country_code)
+currency = as_bool(_currency)
+cron = as_bool(_cron)
+domain = as_bool(_domain)
+email = as_bool(_email)
+base16 = as_bool(_base16)
+base32 = as_bool(_base32)
+base58 = as_bool(_base58)
+base64 = as_bool(_base64)
+creditor_reference = as_bool(_creditor_reference)
+cusip = as_bool(_cusip)
+isin = as_bool(_isin)
+lei = as_bool(_lei)
+sedol = as_bool(_sedol)
+md5 = as_bool(_md5)
+sha1 = as_bool(_sha1)
+sha224 = as_bool(_sha224)
+sha256 = as_bool(_sha256)
+sha384 = as_bool(_sha384)
+sha512 = as_bool(_sha512)
+hostname = as_bool(_hostname)
+es_cif = as_bool(_es_cif)
+es_doi = as_bool(_es_doi)
+es_nie = as_bool(_es_nie)
+es_nif = as_bool(_es_nif)
+fi_business_id = as_bool(_fi_business_id)
+fi_ssn = as_bool(_fi_ssn)
+fr_department = as_bool(_fr_department)
+fr_ssn = as_bool(_fr_ssn)
+ind_aadhar = as_bool(_ind_aadhar)
+ind_pan = as_bool(_ind_pan)
+ru_inn = as_bool(_ru_inn)
+iban = as_bool(_iban)
+ipv4 = as_bool(_ipv4)
+ipv6 = as_bool(_ipv6)
+length = as_bool(_length)
+mac_address = as_bool(_mac_address)
+ip_in_networks = as_bool(_ip_in_networks)
+slug = as_bool(_slug)
+uri = as_bool(_uri)
+url = as_bool(_url)
+uuid = as_bool(_uuid)
+
+__all__ = (
+    "between",
+    "bsc_address",
+    "btc_address",
+    "eth_address",
+    "trx_address",
+    "amex",
+    "card_number",
+    "diners",
+    "discover",
+    "jcb",
+    "mastercard",
+    "unionpay",
+    "visa",
+    "mir",
+    "calling_code",
+    "country_code",
+    "currency",
+    "cron",
+    "domain",
+    "email",
+    "base16",
+    "base32",
+    "base58",
+    "base64",
+    "creditor_reference",
+    "cusip",
+    "isin",
+    "lei",
+    "sedol",
+    "md5",
+    "sha1",
+    "sha224",
+    "sha256",
+    "sha384",
+    "sha512",
+    "hostname",
+    "es_cif",
+    "es_doi",
+    "es_nie",
+    "es_nif",
+    "fi_business_id",
+    "fi_ssn",
+    "fr_department",
+    "fr_ssn",
+    "ind_aadhar",
+    "ind_pan",
+    "ru_inn",
+    "iban",
+    "ipv4",
+    "ipv6",
+    "length",
+    "mac_address",
+    "ip_in_networks",
+    "slug",
+    "uri",
+    "url",
+    "uuid",
+)
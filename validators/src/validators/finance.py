@@ -1,5 +1,13 @@
 """Finance."""
 
+# standard
+from functools import lru_cache
+import re
+from typing import Any
+
+# local
+from .batch import BatchResult
+from .iban import mod97_10
 from .utils import validator
 
 
@@ -137,3 +145,110 @@ def sedol(value: str):
         check += val * weights[idx]
 
     return (check % 10) == 0
+
+
+@lru_cache
+def _lei_regex():
+    return re.compile(r"[A-Z0-9]{18}[0-9]{2}")
+
+
+def _lei(value: Any):
+    return (
+        isinstance(value, str)
+        and _lei_regex().fullmatch(value) is not None
+        and mod97_10(value) == 1
+    )
+
+
+@validator
+def lei(value: str, /):
+    """Return whether or not given value is a valid LEI.
+
+    Checks if the value is a valid [Legal Entity Identifier][1], as
+    defined by ISO 17442, with an ISO 7064 MOD 97-10 check sum.
+    [1]: https://en.wikipedia.org/wiki/Legal_Entity_Identifier
+
+    Examples:
+        >>> lei('5493001KJTIIGC8Y1R12')
+        True
+        >>> lei('5493001KJTIIGC8Y1R13')
+        ValidationError(func=lei, args={'value': '5493001KJTIIGC8Y1R13'})
+
+    Args:
+        value: LEI string to validate.
+
+    Returns:
+        (Literal[True]): If `value` is a valid LEI string.
+        (ValidationError): If `value` is an invalid LEI string.
+    """
+    return _lei(value)
+
+
+def lei_batch(values: Any, /):
+    """Validate many LEI strings at once, like `lei` does.
+
+    Examples:
+        >>> lei_batch(['5493001KJTIIGC8Y1R12', 'HWUPKR0MPOU8FGXBT394', '5493001KJTIIGC8Y1R1'])
+        BatchResult(total=3, failed=1)
+
+    Args:
+        values: LEI strings to validate.
+
+    Returns:
+        (BatchResult): Pass/fail flags of `values`, in order.
+    """
+    return BatchResult(bytearray(map(_lei, values)))
+
+
+@lru_cache
+def _creditor_reference_regex():
+    return re.compile(r"RF[0-9]{2}[A-Z0-9]{1,21}", re.IGNORECASE)
+
+
+def _creditor_reference(value: Any):
+    return (
+        isinstance(value, str)
+        and _creditor_reference_regex().fullmatch(value) is not None
+        and mod97_10(value[4:] + value[:4]) == 1
+    )
+
+
+@validator
+def creditor_reference(value: str, /):
+    """Return whether or not given value is a valid RF creditor reference.
+
+    Checks if the value is a valid [RF creditor reference][1], as
+    defined by ISO 11649, without spaces. Like IBAN codes, it has an
+    ISO 7064 MOD 97-10 check sum.
+    [1]: https://en.wikipedia.org/wiki/Creditor_Reference
+
+    Examples:
+        >>> creditor_reference('RF18539007547034')
+        True
+        >>> creditor_reference('RF19539007547034')
+        ValidationError(func=creditor_reference, args={'value': 'RF19539007547034'})
+
+    Args:
+        value: RF creditor reference string to validate.
+
+    Returns:
+        (Literal[True]): If `value` is a valid RF creditor reference.
+        (ValidationError): If `value` is an invalid RF creditor reference.
+    """
+    return _creditor_reference(value)
+
+
+def creditor_reference_batch(values: Any, /):
+    """Validate many RF creditor references at once, like `creditor_reference` does.
+
+    Examples:
+        >>> creditor_reference_batch(['RF18539007547034', 'RF712348231', 'RF00'])
+        BatchResult(total=3, failed=1)
+
+    Args:
+        values: RF creditor reference strings to validate.
+
+    Returns:
+        (BatchResult): Pass/fail flags of `values`, in order.
+    """
+    return BatchResult(bytearray(map(_creditor_reference, values)))
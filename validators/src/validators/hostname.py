@@ -1,15 +1,18 @@
 """Hostname."""
 
 # standard
-from functools import lru_cache
+from functools import lru_cache, partial
 import re
-from typing import Optional
-
-from .domain import domain
+from typing import Literal, Optional
 
 # local
+from .cache import cached
+from .domain import _domain_checker  # type: ignore
 from .ip_address import ipv4, ipv6
-from .utils import validator
+from .utils import as_bool, compiled_by, validator
+
+_ipv4 = as_bool(ipv4)
+_ipv6 = as_bool(ipv6)
 
 
 @lru_cache
@@ -46,7 +49,102 @@ def _port_validator(value: str):
     return None
 
 
+_IPV4_CHARS = frozenset("0123456789.")
+
+
+def classify_host(value: str, /) -> Optional[Literal["simple", "domain", "ipv4", "ipv6"]]:
+    """Return which kind of host `value` looks like, without validating it.
+
+    `value` is classified by the characters it holds, with a few string
+    tests and no regex, into the only kind it could be valid as: IPv6
+    addresses hold a colon, IPv4 addresses only digits and dots, simple
+    hostnames are ASCII without a dot, and anything else is a domain
+    name. Non-ASCII values are domain names, as IDN separators other
+    than the dot may join their labels. `hostname` then applies only
+    the check of the kind found.
+
+    Examples:
+        >>> classify_host('ubuntu-pc')
+        'simple'
+        >>> classify_host('example.com')
+        'domain'
+        >>> classify_host('12.12.12.12')
+        'ipv4'
+        >>> classify_host('2001:db8::1')
+        'ipv6'
+        >>> classify_host('300.0.0.1')
+        'ipv4'
+
+    Args:
+        value:
+            Host, without port.
+
+    Returns:
+        (Literal["simple", "domain", "ipv4", "ipv6"]): The kind of host.
+        (None): If `value` is empty.
+    """
+    if not value:
+        return None
+    if ":" in value:
+        return "ipv6"
+    if not value.isascii():
+        return "domain"
+    if "." not in value:
+        return "simple"
+    if _IPV4_CHARS.issuperset(value):
+        return "ipv4"
+    return "domain"
+
+
+@lru_cache
+def _hostname_checker(
+    skip_ipv6_addr: bool = False,
+    skip_ipv4_addr: bool = False,
+    may_have_port: bool = True,
+    maybe_simple: bool = True,
+    consider_tld: bool = False,
+    private: Optional[bool] = None,
+    rfc_1034: bool = False,
+    rfc_2782: bool = False,
+    psl: bool = False,
+):
+    """Hostname check with its options resolved."""
+    simple = _simple_hostname_regex().match if maybe_simple else None
+    domain_check = _domain_checker(consider_tld, rfc_1034, rfc_2782, psl)
+    ipv4_check = None if skip_ipv4_addr else partial(_ipv4, cidr=False, private=private)
+    ipv6_check = None if skip_ipv6_addr else partial(_ipv6, cidr=False)
+
+    def check(value: str, /):
+        if not value:
+            return False
+
+        if simple and "." not in value and ":" not in value and value.isascii():
+            # tried first, as a simple hostname holds no port to split off
+            if simple(value):
+                return True
+
+        if may_have_port and (host_seg := _port_validator(value)):
+            value = host_seg
+
+        if "." not in value and ":" not in value and value.isascii():
+            # what `classify_host` calls simple, without the function call
+            return bool(simple and simple(value))
+        kind = classify_host(value)
+        if kind == "domain":
+            try:
+                return bool(domain_check(value))
+            except UnicodeError:
+                return False
+        if kind == "ipv4":
+            return bool(ipv4_check and ipv4_check(value))
+        return bool(ipv6_check and ipv6_check(value))
+
+    return check
+
+
+@compiled_by(_hostname_checker)
 @validator
+@cached
 def hostname(
     value: str,
     /,
@@ -59,6 +157,7 @@ def hostname(
     private: Optional[bool] = None,  # only for ip-addresses
     rfc_1034: bool = False,
     rfc_2782: bool = False,
+    psl: bool = False,
 ):
     """Return whether or not given value is a valid hostname.
 
@@ -96,7 +195,7 @@ def hostname(
         maybe_simple:
             Hostname string maybe only hyphens and alpha-numerals.
         consider_tld:
-            Restrict domain to TLDs allowed by IANA.
+            Restrict domain to TLDs allowed by IANA, see `validators.tld`.
         private:
             Embedded IP address is public if `False`, private/local if `True`.
         rfc_1034:
@@ -105,25 +204,22 @@ def hostname(
         rfc_2782:
             Domain/Host name is of type service record.
             Ref: [RFC 2782](https://www.rfc-editor.org/rfc/rfc2782).
+        psl:
+            Require domain names to have a suffix listed in the Public
+            Suffix List, and at least one label before it, see `validators.psl`.
 
     Returns:
         (Literal[True]): If `value` is a valid hostname.
         (ValidationError): If `value` is an invalid hostname.
     """
-    if not value:
-        return False
-
-    if may_have_port and (host_seg := _port_validator(value)):
-        return (
-            (_simple_hostname_regex().match(host_seg) if maybe_simple else False)
-            or domain(host_seg, consider_tld=consider_tld, rfc_1034=rfc_1034, rfc_2782=rfc_2782)
-            or (False if skip_ipv4_addr else ipv4(host_seg, cidr=False, private=private))
-            or (False if skip_ipv6_addr else ipv6(host_seg, cidr=False))
-        )
-
-    return (
-        (_simple_hostname_regex().match(value) if maybe_simple else False)
-        or domain(value, consider_tld=consider_tld, rfc_1034=rfc_1034, rfc_2782=rfc_2782)
-        or (False if skip_ipv4_addr else ipv4(value, cidr=False, private=private))
-        or (False if skip_ipv6_addr else ipv6(value, cidr=False))
-    )
+    return _hostname_checker(
+        skip_ipv6_addr,
+        skip_ipv4_addr,
+        may_have_port,
+        maybe_simple,
+        consider_tld,
+        private,
+        rfc_1034,
+        rfc_2782,
+        psl,
+    )(value)
@@ -4,7 +4,7 @@
 from typing import Dict
 
 # local
-from validators.utils import validator
+from validators.utils import as_bool, validator
 
 
 def _nif_nie_validation(value: str, number_by_letter: Dict[str, str]):
@@ -140,6 +140,11 @@ def es_nie(value: str, /):
     return False
 
 
+_es_cif = as_bool(es_cif)
+_es_nif = as_bool(es_nif)
+_es_nie = as_bool(es_nie)
+
+
 @validator
 def es_doi(value: str, /):
     """Validate a Spanish DOI.
@@ -165,4 +170,4 @@ def es_doi(value: str, /):
         (Literal[True]): If `value` is a valid DOI string.
         (ValidationError): If `value` is an invalid DOI string.
     """
-    return es_nie(value) or es_nif(value) or es_cif(value)
+    return _es_nie(value) or _es_nif(value) or _es_cif(value)
@@ -6,7 +6,7 @@ import re
 import typing
 
 # local
-from validators.utils import validator
+from validators.utils import as_bool, validator
 
 
 @lru_cache
@@ -64,6 +64,9 @@ def fr_department(value: typing.Union[str, int]):
     return 1 <= value <= 19 or 21 <= value <= 95 or 971 <= value <= 976  # Overseas departments
 
 
+_fr_department = as_bool(fr_department)
+
+
 @validator
 def fr_ssn(value: str):
     """Validate a french Social Security Number.
@@ -99,7 +102,7 @@ def fr_ssn(value: str):
     groups = list(matched.groups())
     control_key = groups[-1]
     department = groups[3]
-    if department != "99" and not fr_department(department):
+    if department != "99" and not _fr_department(department):
         # 99 stands for foreign born people
         return False
     if control_key is None:
@@ -1,28 +1,205 @@
 """IBAN."""
 
 # standard
+from functools import lru_cache
 import re
+from string import ascii_uppercase, digits
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple
 
 # local
+from .batch import BatchResult
 from .utils import validator
 
+# fmt: off
+# BBAN format of each country, in the notation of the SWIFT IBAN registry,
+# and the bank and branch identifiers as slices of the BBAN.
+# ref: https://www.swift.com/standards/data-standards/iban-international-bank-account-number
+_IBAN_REGISTRY: Dict[str, Tuple[str, Tuple[int, int], Optional[Tuple[int, int]]]] = {
+    "AD": ("4!n4!n12!c", (0, 4), (4, 8)),
+    "AE": ("3!n16!n", (0, 3), None),
+    "AL": ("8!n16!c", (0, 3), (3, 7)),
+    "AT": ("5!n11!n", (0, 5), None),
+    "AZ": ("4!a20!c", (0, 4), None),
+    "BA": ("3!n3!n8!n2!n", (0, 3), (3, 6)),
+    "BE": ("3!n7!n2!n", (0, 3), None),
+    "BG": ("4!a4!n2!n8!c", (0, 4), (4, 8)),
+    "BH": ("4!a14!c", (0, 4), None),
+    "BI": ("5!n5!n11!n2!n", (0, 5), (5, 10)),
+    "BR": ("8!n5!n10!n1!a1!c", (0, 8), (8, 13)),
+    "BY": ("4!c4!n16!c", (0, 4), None),
+    "CH": ("5!n12!c", (0, 5), None),
+    "CR": ("4!n14!n", (0, 4), None),
+    "CY": ("3!n5!n16!c", (0, 3), (3, 8)),
+    "CZ": ("4!n6!n10!n", (0, 4), None),
+    "DE": ("8!n10!n", (0, 8), None),
+    "DJ": ("5!n5!n11!n2!n", (0, 5), (5, 10)),
+    "DK": ("4!n9!n1!n", (0, 4), None),
+    "DO": ("4!c20!n", (0, 4), None),
+    "EE": ("2!n14!n", (0, 2), None),
+    "EG": ("4!n4!n17!n", (0, 4), (4, 8)),
+    "ES": ("4!n4!n1!n1!n10!n", (0, 4), (4, 8)),
+    "FI": ("3!n11!n", (0, 3), None),
+    "FK": ("2!a12!n", (0, 2), None),
+    "FO": ("4!n9!n1!n", (0, 4), None),
+    "FR": ("5!n5!n11!c2!n", (0, 5), (5, 10)),
+    "GB": ("4!a6!n8!n", (0, 4), (4, 10)),
+    "GE": ("2!a16!n", (0, 2), None),
+    "GI": ("4!a15!c", (0, 4), None),
+    "GL": ("4!n9!n1!n", (0, 4), None),
+    "GR": ("3!n4!n16!c", (0, 3), (3, 7)),
+    "GT": ("4!c20!c", (0, 4), None),
+    "HR": ("7!n10!n", (0, 7), None),
+    "HU": ("3!n4!n1!n15!n1!n", (0, 3), (3, 7)),
+    "IE": ("4!a6!n8!n", (0, 4), (4, 10)),
+    "IL": ("3!n3!n13!n", (0, 3), (3, 6)),
+    "IQ": ("4!a3!n12!n", (0, 4), (4, 7)),
+    "IS": ("4!n2!n6!n10!n", (0, 2), (2, 4)),
+    "IT": ("1!a5!n5!n12!c", (1, 6), (6, 11)),
+    "JO": ("4!a4!n18!c", (0, 4), (4, 8)),
+    "KW": ("4!a22!c", (0, 4), None),
+    "KZ": ("3!n13!c", (0, 3), None),
+    "LB": ("4!n20!c", (0, 4), None),
+    "LC": ("4!a24!c", (0, 4), None),
+    "LI": ("5!n12!c", (0, 5), None),
+    "LT": ("5!n11!n", (0, 5), None),
+    "LU": ("3!n13!c", (0, 3), None),
+    "LV": ("4!a13!c", (0, 4), None),
+    "LY": ("3!n3!n15!n", (0, 3), (3, 6)),
+    "MC": ("5!n5!n11!c2!n", (0, 5), (5, 10)),
+    "MD": ("2!c18!c", (0, 2), None),
+    "ME": ("3!n13!n2!n", (0, 3), None),
+    "MK": ("3!n10!c2!n", (0, 3), None),
+    "MN": ("4!n12!n", (0, 4), None),
+    "MR": ("5!n5!n11!n2!n", (0, 5), (5, 10)),
+    "MT": ("4!a5!n18!c", (0, 4), (4, 9)),
+    "MU": ("4!a2!n2!n12!n3!n3!a", (0, 6), (6, 8)),
+    "NI": ("4!a20!n", (0, 4), None),
+    "NL": ("4!a10!n", (0, 4), None),
+    "NO": ("4!n6!n1!n", (0, 4), None),
+    "OM": ("3!n16!c", (0, 3), None),
+    "PK": ("4!a16!c", (0, 4), None),
+    "PL": ("8!n16!n", (0, 3), (3, 8)),
+    "PS": ("4!a21!c", (0, 4), None),
+    "PT": ("4!n4!n11!n2!n", (0, 4), (4, 8)),
+    "QA": ("4!a21!c", (0, 4), None),
+    "RO": ("4!a16!c", (0, 4), None),
+    "RS": ("3!n13!n2!n", (0, 3), None),
+    "RU": ("9!n5!n15!c", (0, 9), (9, 14)),
+    "SA": ("2!n18!c", (0, 2), None),
+    "SC": ("4!a2!n2!n16!n3!a", (0, 6), (6, 8)),
+    "SD": ("2!n12!n", (0, 2), None),
+    "SE": ("3!n16!n1!n", (0, 3), None),
+    "SI": ("5!n8!n2!n", (0, 5), None),
+    "SK": ("4!n6!n10!n", (0, 4), None),
+    "SM": ("1!a5!n5!n12!c", (1, 6), (6, 11)),
+    "SO": ("4!n3!n12!n", (0, 4), (4, 7)),
+    "ST": ("4!n4!n11!n2!n", (0, 4), (4, 8)),
+    "SV": ("4!a20!n", (0, 4), None),
+    "TL": ("3!n14!n2!n", (0, 3), None),
+    "TN": ("2!n3!n13!n2!n", (0, 2), (2, 5)),
+    "TR": ("5!n1!n16!c", (0, 5), None),
+    "UA": ("6!n19!c", (0, 6), None),
+    "VA": ("3!n15!n", (0, 3), None),
+    "VG": ("4!a16!n", (0, 4), None),
+    "XK": ("4!n10!n2!n", (0, 2), (2, 4)),
+    "YE": ("4!a4!n18!c", (0, 4), (4, 8)),
+}
+# fmt: on
+_BBAN_CHARS = {"n": "[0-9]", "a": "[A-Z]", "c": "[A-Z0-9]"}
 
-def _char_value(char: str):
-    """A=10, B=11, ..., Z=35."""
-    return char if char.isdigit() else str(10 + ord(char) - ord("A"))
 
+class IBANParts(NamedTuple):
+    """Components of a valid IBAN, see `parse_iban`."""
 
-def _mod_check(value: str):
-    """Check if the value string passes the mod97-test."""
-    # move country code and check numbers to end
-    rearranged = value[4:] + value[:4]
-    return int("".join(_char_value(char) for char in rearranged)) % 97 == 1
+    country: str
+    check_digits: str
+    bban: str
+    bank: str
+    branch: str
+    account: str
+    national_check: str = ""
+
+
+@lru_cache
+def _mod97_table():
+    """Remainder after appending each character, by the remainder before it.
+
+    Letters count as two digits, A=10, B=11, ..., Z=35, in either case.
+    """
+    table: Dict[str, List[int]] = {}
+    for value, char in enumerate(digits + ascii_uppercase):
+        shift = 10 if value < 10 else 100
+        table[char] = table[char.lower()] = [(rem * shift + value) % 97 for rem in range(97)]
+    return table
+
+
+def mod97_10(value: str, /) -> Optional[int]:
+    """Return the ISO 7064 MOD 97-10 remainder of an alphanumeric string.
+
+    The string is read as a number, letters standing for two digits
+    each, A=10 to Z=35, as IBAN, LEI and RF creditor references do.
+    Characters are folded into the remainder one at a time with a
+    lookup table, so no large integer is ever built.
+
+    Examples:
+        >>> mod97_10('3214282912345698765432161182')
+        1
+        >>> mod97_10('WEST12345698765432GB82')
+        1
+        >>> mod97_10('GB82-WEST') is None
+        True
+
+    Args:
+        value:
+            String of ASCII letters and digits.
+
+    Returns:
+        (int): The remainder, from 0 to 96, which is 1 for a valid
+            check sum.
+        (None): If `value` holds other characters.
+    """
+    table = _mod97_table()
+    rem = 0
+    try:
+        for char in value:
+            rem = table[char][rem]
+    except KeyError:
+        return None
+    return rem
+
+
+@lru_cache
+def _iban_patterns():
+    """Pattern of the check digits and BBAN, by country code."""
+    patterns: Dict[str, Pattern[str]] = {}
+    for country, (bban, _, _) in _IBAN_REGISTRY.items():
+        parts = re.findall(r"(\d+)!([nac])", bban)
+        regex = "".join(f"{_BBAN_CHARS[kind]}{{{size}}}" for size, kind in parts)
+        patterns[country] = re.compile(f"[0-9]{{2}}{regex}", re.IGNORECASE)
+    return patterns
+
+
+def _iban(value: Any):
+    """Country code of a valid IBAN, `None` if it is not one."""
+    if not isinstance(value, str):
+        return None
+    country = value[:2].upper()
+    pattern = _iban_patterns().get(country)
+    # the pattern of the country is of fixed width, so it checks the length too
+    if pattern is None or pattern.fullmatch(value, 2) is None:
+        return None
+    return country if mod97_10(value[4:] + value[:4]) == 1 else None
 
 
 @validator
 def iban(value: str, /):
     """Return whether or not given value is a valid IBAN code.
 
+    The length and BBAN format must be those the [IBAN registry][1]
+    gives for the country, and the check digits must be valid.
+
+    [1]: https://www.swift.com/standards/data-standards/iban-international-bank-account-number
+
     Examples:
         >>> iban('DE29100500001061045672')
         True
@@ -37,8 +214,70 @@ def iban(value: str, /):
         (Literal[True]): If `value` is a valid IBAN code.
         (ValidationError): If `value` is an invalid IBAN code.
     """
-    return (
-        (re.match(r"^[a-z]{2}[0-9]{2}[a-z0-9]{11,30}$", value, re.IGNORECASE) and _mod_check(value))
-        if value
-        else False
+    return _iban(value) is not None if value else False
+
+
+def iban_batch(values: Any, /):
+    """Validate many IBAN codes at once, like `iban` does.
+
+    Examples:
+        >>> iban_batch(['DE29100500001061045672', 'DE29100500001061045673'])
+        BatchResult(total=2, failed=1)
+
+    Args:
+        values:
+            IBAN strings to validate.
+
+    Returns:
+        (BatchResult): Pass/fail flags of `values`, in order.
+    """
+    return BatchResult(bytearray(_iban(value) is not None for value in values))
+
+
+def parse_iban(value: str, /):
+    """Return the components of a valid IBAN.
+
+    `value` is validated like `iban` does, then split at the positions
+    the IBAN registry gives for the bank and branch identifiers of its
+    country. The account is what follows them in the BBAN, including
+    national check digits placed after them, as in France or Spain.
+    Characters before the bank identifier, the CIN check character in
+    Italy and San Marino, are the national check. The result is truthy,
+    so it can replace a call to `iban` in a condition.
+
+    Examples:
+        >>> parts = parse_iban('GB82WEST12345698765432')
+        >>> parts.country, parts.bank, parts.branch, parts.account
+        ('GB', 'WEST', '123456', '98765432')
+        >>> parse_iban('DE29100500001061045672').branch
+        ''
+        >>> parse_iban('IT60X0542811101000000123456').national_check
+        'X'
+        >>> parse_iban('DE2910050000106104567')
+        ValidationError(func=iban, args={'value': 'DE2910050000106104567'})
+
+    Args:
+        value:
+            IBAN string to parse.
+
+    Returns:
+        (IBANParts): If `value` is a valid IBAN code. Letters are in
+            upper case, and `branch` and `national_check` are empty in
+            countries without them.
+        (ValidationError): If `value` is an invalid IBAN code.
+    """
+    if (country := _iban(value)) is None:
+        # fails again, for the same `ValidationError` as `iban`
+        return iban(value)
+    bban = value[4:].upper()
+    _, bank, branch = _IBAN_REGISTRY[country]
+    end = bank[1] if branch is None else branch[1]
+    return IBANParts(
+        country,
+        value[2:4],
+        bban,
+        bban[bank[0] : bank[1]],
+        "" if branch is None else bban[branch[0] : branch[1]],
+        bban[end:],
+        bban[: bank[0]],
     )
@@ -1,41 +1,197 @@
 """IP Address."""
 
 # standard
+from bisect import bisect_right
+from functools import lru_cache
 from ipaddress import (
     AddressValueError,
-    IPv4Address,
-    IPv4Network,
     IPv6Address,
+    IPv6Interface,
     IPv6Network,
     NetmaskValueError,
+    ip_network,
 )
-import re
-from typing import Optional
+from socket import inet_aton, inet_ntoa
+from typing import List, Optional, Tuple
 
 # local
 from .utils import validator
 
+# IANA IPv4 and IPv6 Special-Purpose Address Registries, and multicast blocks:
+# https://www.iana.org/assignments/iana-ipv4-special-registry
+# https://www.iana.org/assignments/iana-ipv6-special-registry
+# the most specific range applies
+_SPECIAL_IPV4 = (
+    ("0.0.0.0/8", "this-network"),
+    ("0.0.0.0/32", "unspecified"),
+    ("10.0.0.0/8", "private"),
+    ("100.64.0.0/10", "shared"),
+    ("127.0.0.0/8", "loopback"),
+    ("169.254.0.0/16", "link-local"),
+    ("172.16.0.0/12", "private"),
+    ("192.0.0.0/24", "protocol-assignment"),
+    ("192.0.2.0/24", "documentation"),
+    ("192.88.99.0/24", "relay-anycast"),
+    ("192.168.0.0/16", "private"),
+    ("198.18.0.0/15", "benchmarking"),
+    ("198.51.100.0/24", "documentation"),
+    ("203.0.113.0/24", "documentation"),
+    ("224.0.0.0/4", "multicast"),
+    ("240.0.0.0/4", "reserved"),
+    ("255.255.255.255/32", "broadcast"),
+)
+_SPECIAL_IPV6 = (
+    ("::/128", "unspecified"),
+    ("::1/128", "loopback"),
+    ("::ffff:0:0/96", "ipv4-mapped"),
+    ("64:ff9b::/96", "translation"),
+    ("64:ff9b:1::/48", "translation"),
+    ("100::/64", "discard"),
+    ("2001::/23", "protocol-assignment"),
+    ("2001::/32", "teredo"),
+    ("2001:2::/48", "benchmarking"),
+    ("2001:db8::/32", "documentation"),
+    ("2002::/16", "6to4"),
+    ("3fff::/20", "documentation"),
+    ("fc00::/7", "private"),
+    ("fe80::/10", "link-local"),
+    ("fec0::/10", "site-local"),
+    ("ff00::/8", "multicast"),
+)
+# categories matched by `private=True`
+_PRIVATE = frozenset(
+    {
+        "broadcast",
+        "link-local",
+        "loopback",
+        "multicast",
+        "private",
+        "reserved",
+        "site-local",
+        "unspecified",
+    }
+)
 
-def _check_private_ip(value: str, is_private: Optional[bool]):
+
+@lru_cache
+def _special_ranges(version: int) -> Tuple[List[int], List[str]]:
+    """First address and category of consecutive ranges, sorted for `bisect`.
+
+    Nested ranges of the registry are flattened, so that each address
+    falls in exactly one range; addresses in none are `global`.
+    """
+    networks = [
+        (ip_network(cidr), category)
+        for cidr, category in (_SPECIAL_IPV4 if version == 4 else _SPECIAL_IPV6)
+    ]
+    bounds = {0}
+    for network, _ in networks:
+        bounds.add(int(network.network_address))
+        bounds.add(int(network.broadcast_address) + 1)
+    # past the last address
+    bounds.discard(1 << (32 if version == 4 else 128))
+    starts: List[int] = []
+    categories: List[str] = []
+    for bound in sorted(bounds):
+        matches = [
+            (network.num_addresses, category)
+            for network, category in networks
+            if int(network.network_address) <= bound <= int(network.broadcast_address)
+        ]
+        category = min(matches)[1] if matches else "global"
+        if not categories or categories[-1] != category:
+            starts.append(bound)
+            categories.append(category)
+    return starts, categories
+
+
+def _category(address: int, version: int) -> str:
+    """Category of the integer `address` of IP `version`."""
+    starts, categories = _special_ranges(version)
+    category = categories[bisect_right(starts, address) - 1]
+    if category == "ipv4-mapped":
+        return _category(address & 0xFFFFFFFF, 4)
+    return category
+
+
+def _check_private_ip(address: int, version: int, is_private: Optional[bool]):
     if is_private is None:
         return True
-    if (
-        any(
-            value.startswith(l_bit)
-            for l_bit in {
-                "10.",  # private
-                "192.168.",  # private
-                "169.254.",  # link-local
-                "127.",  # localhost
-                "0.0.0.0",  # loopback #nosec
-            }
-        )
-        or re.match(r"^172\.(?:1[6-9]|2\d|3[0-1])\.", value)  # private
-        or re.match(r"^(?:22[4-9]|23[0-9]|24[0-9]|25[0-5])\.", value)  # broadcast
-    ):
-        return is_private
-
-    return not is_private
+    return (_category(address, version) in _PRIVATE) is is_private
+
+
+def _parse_ipv4(value: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Integer address and prefix length of a dotted-quad, with an optional `/` prefix.
+
+    Accepts exactly what `IPv4Network` does, without building it. The
+    prefix is a length, a netmask or a hostmask, and `None` when absent.
+    """
+    dotted, slash, prefix = value.partition("/")
+    try:
+        packed = inet_aton(dotted)
+    except (OSError, ValueError):
+        return None
+    # `inet_aton` also takes shorthands and leading zeros, which do not print back
+    if inet_ntoa(packed) != dotted:
+        return None
+    address = int.from_bytes(packed, "big")
+    if not slash:
+        return address, None
+    if prefix.isascii() and prefix.isdigit():
+        # leading zeros are tolerated in prefix lengths
+        return (address, length) if (length := int(prefix)) <= 32 else None
+    if (mask := _parse_ipv4(prefix)) is None or mask[1] is not None:
+        return None
+    for bits in (mask[0] ^ 0xFFFFFFFF, mask[0]):
+        # host bits of a netmask, then of a hostmask, are consecutive ones
+        if not bits & (bits + 1):
+            return address, 32 - bits.bit_length()
+    return None
+
+
+def ip_category(value: str, /):
+    """Return the special-purpose range an IP address belongs to.
+
+    Addresses are looked up in the IANA special-purpose address
+    registries, with a binary search over their ranges. Categories are
+    `unspecified`, `this-network`, `private`, `shared`, `loopback`,
+    `link-local`, `site-local`, `protocol-assignment`, `documentation`,
+    `benchmarking`, `relay-anycast`, `translation`, `discard`, `teredo`,
+    `6to4`, `multicast`, `reserved` and `broadcast`, or `global` outside
+    of those. IPv4-mapped IPv6 addresses have the category of the IPv4
+    address. `ipv4` and `ipv6` with `private=True` accept the
+    `unspecified`, `private`, `loopback`, `link-local`, `site-local`,
+    `multicast`, `reserved` and `broadcast` categories.
+
+    Examples:
+        >>> ip_category('192.168.1.1')
+        'private'
+        >>> ip_category('10.0.0.0/8')
+        'private'
+        >>> ip_category('::ffff:127.0.0.1')
+        'loopback'
+        >>> ip_category('2001:db8::1')
+        'documentation'
+        >>> ip_category('8.8.8.8')
+        'global'
+        >>> ip_category('300.0.0.1') is None
+        True
+
+    Args:
+        value:
+            IPv4 or IPv6 address, optionally with a `/` prefix or netmask,
+            which does not change its category.
+
+    Returns:
+        (str): The category of the address.
+        (None): If `value` is not an IP address.
+    """
+    if (parsed := _parse_ipv4(value)) is not None:
+        return _category(parsed[0], 4)
+    try:
+        return _category(int(IPv6Interface(value).ip), 6)
+    except ValueError:
+        return None
 
 
 @validator
@@ -72,7 +228,8 @@ def ipv4(
         strict:
             IP address string is strictly in CIDR notation.
         private:
-            IP address is public if `False`, private/local/loopback/broadcast if `True`.
+            IP address is public if `False`, private/local/loopback/broadcast if `True`,
+            see `ip_category`.
         host_bit:
             If `False` and host bits (along with network bits) _are_ set in the supplied
             address, this function raises a validation error. ref [IPv4Network][2].
@@ -82,20 +239,27 @@ def ipv4(
         (Literal[True]): If `value` is a valid IPv4 address.
         (ValidationError): If `value` is an invalid IPv4 address.
     """
-    if not value:
+    if not value or (parsed := _parse_ipv4(value)) is None:
         return False
-    try:
-        if cidr:
-            if strict and value.count("/") != 1:
-                raise ValueError("IPv4 address was expected in CIDR notation")
-            return IPv4Network(value, strict=not host_bit) and _check_private_ip(value, private)
-        return IPv4Address(value) and _check_private_ip(value, private)
-    except (ValueError, AddressValueError, NetmaskValueError):
+    address, prefix = parsed
+    if prefix is None:
+        # IPv4 address was expected in CIDR notation
+        return not (cidr and strict) and _check_private_ip(address, 4, private)
+    if not cidr or (not host_bit and address & ((1 << (32 - prefix)) - 1)):
         return False
+    return _check_private_ip(address, 4, private)
 
 
 @validator
-def ipv6(value: str, /, *, cidr: bool = True, strict: bool = False, host_bit: bool = True):
+def ipv6(
+    value: str,
+    /,
+    *,
+    cidr: bool = True,
+    strict: bool = False,
+    private: Optional[bool] = None,
+    host_bit: bool = True,
+):
     """Returns if a given value is a valid IPv6 address.
 
     Including IPv4-mapped IPv6 addresses. The initial version of ipv6 validator
@@ -118,6 +282,9 @@ def ipv6(value: str, /, *, cidr: bool = True, strict: bool = False, host_bit: bo
             IP address string may contain CIDR annotation.
         strict:
             IP address string is strictly in CIDR notation.
+        private:
+            IP address is public if `False`, private/local/loopback/multicast if `True`,
+            see `ip_category`.
         host_bit:
             If `False` and host bits (along with network bits) _are_ set in the supplied
             address, this function raises a validation error. ref [IPv6Network][2].
@@ -133,7 +300,9 @@ def ipv6(value: str, /, *, cidr: bool = True, strict: bool = False, host_bit: bo
         if cidr:
             if strict and value.count("/") != 1:
                 raise ValueError("IPv6 address was expected in CIDR notation")
-            return IPv6Network(value, strict=not host_bit)
-        return IPv6Address(value)
+            IPv6Network(value, strict=not host_bit)
+        else:
+            IPv6Address(value)
     except (ValueError, AddressValueError, NetmaskValueError):
         return False
+    return private is None or _check_private_ip(int(IPv6Interface(value).ip), 6, private)
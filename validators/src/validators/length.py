@@ -5,7 +5,9 @@ from typing import Union
 
 # local
 from .between import between
-from .utils import validator
+from .utils import as_bool, validator
+
+_between = as_bool(between)
 
 
 @validator
@@ -42,4 +44,4 @@ def length(value: str, /, *, min_val: Union[int, None] = None, max_val: Union[in
     if max_val is not None and max_val < 0:
         raise ValueError("Length cannot be negative. `max_val` is less than zero.")
 
-    return bool(between(len(value), min_val=min_val, max_val=max_val))
+    return _between(len(value), min_val=min_val, max_val=max_val)
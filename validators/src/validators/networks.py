@@ -0,0 +1,403 @@
+"""Networks."""
+
+# standard
+from array import array
+from bisect import bisect_right
+from functools import partial
+from ipaddress import IPv6Address, IPv6Network
+from itertools import compress, islice, repeat
+from operator import not_
+from socket import AF_INET6, inet_aton, inet_ntoa, inet_pton
+from sys import getsizeof
+from typing import Any, Iterable, List, MutableSequence, NamedTuple, Optional, Tuple, Union
+
+# local
+from .ip_address import _parse_ipv4  # type: ignore
+from .utils import validator
+
+_IPV6_CHARS = frozenset("0123456789ABCDEFabcdef:")
+
+
+def _parse_ipv6(value: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Integer address and prefix length of plain hexadecimal IPv6 networks.
+
+    Only what `IPv6Network` accepts is returned, `None` leaves the rest,
+    valid or not, such as scoped or IPv4-suffixed addresses, to it.
+    """
+    address, slash, prefix = value.partition("/")
+    if not _IPV6_CHARS.issuperset(address):
+        return None
+    if slash and not (prefix.isascii() and prefix.isdigit() and int(prefix) <= 128):
+        return None
+    try:
+        packed = inet_pton(AF_INET6, address)
+    except OSError:
+        return None
+    return int.from_bytes(packed, "big"), int(prefix) if slash else None
+
+
+def _network_range(value: str, host_bit: bool = True) -> Tuple[int, int, int]:
+    """IP version, first and last address of an address or network.
+
+    Host bits of networks are ignored, like `ipaddress` does with
+    `strict=False`, unless `host_bit` is `False`.
+
+    Raises:
+        (ValueError): If `value` is neither an IPv4 nor an IPv6 network.
+    """
+    if (parsed := _parse_ipv4(value)) is not None:
+        address, prefix = parsed
+        bits = 32
+    elif (parsed := _parse_ipv6(value)) is not None:
+        address, prefix = parsed
+        bits = 128
+    else:
+        network = IPv6Network(value, strict=not host_bit)
+        return 6, int(network.network_address), int(network.broadcast_address)
+    host = (1 << (bits - (bits if prefix is None else prefix))) - 1
+    if not host_bit and address & host:
+        raise ValueError(f"{value} has host bits set")
+    return 4 if bits == 32 else 6, address & ~host, address | host
+
+
+_ALL_ONES = (1 << 128) - 1
+
+
+def _merge(ranges: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+    """Sort ranges and merge those that overlap or touch."""
+    ranges.sort()
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in ranges:
+        if ends and start <= ends[-1] + 1:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class NetworkSet:
+    """Set of IPv4 and IPv6 networks, for fast membership tests.
+
+    Networks are kept as a sorted table of merged address ranges, one
+    per IP version, so that building takes O(n log n) time and each
+    lookup a binary search. IPv4 ranges are packed in arrays of 32-bit
+    integers.
+
+    Examples:
+        >>> networks = NetworkSet(['10.0.0.0/8', '192.168.0.0/16', '2001:db8::/32'])
+        >>> '10.1.2.3' in networks, '2001:db8::1' in networks, '8.8.8.8' in networks
+        (True, True, False)
+        >>> '192.168.1.0/24' in networks
+        True
+        >>> len(NetworkSet(['10.0.0.0/9', '10.128.0.0/9', '10.1.0.0/16']))
+        1
+
+    Args:
+        networks:
+            IPv4 and IPv6 addresses or networks, in CIDR, netmask or
+            hostmask notation. Host bits are ignored.
+
+    Raises:
+        (ValueError): If one of `networks` is not an IP network.
+    """
+
+    __slots__ = ("_ipv4", "_ipv6")
+
+    def __init__(self, networks: Iterable[str]):
+        """Initialize Network Set."""
+        ranges: Tuple[List[Tuple[int, int]], List[Tuple[int, int]]] = ([], [])
+        for network in networks:
+            try:
+                version, start, end = _network_range(network)
+            except ValueError as exp:
+                raise ValueError(f"{network!r} is not an IP network") from exp
+            ranges[version == 6].append((start, end))
+        starts, ends = _merge(ranges[0])
+        self._ipv4: Tuple[MutableSequence[int], MutableSequence[int]] = (
+            array("I", starts),
+            array("I", ends),
+        )
+        self._ipv6: Tuple[MutableSequence[int], MutableSequence[int]] = _merge(ranges[1])
+
+    def __contains__(self, value: object):
+        """Whether address or network `value` is within the set."""
+        if not isinstance(value, str):
+            return False
+        try:
+            version, start, end = _network_range(value)
+        except ValueError:
+            return False
+        starts, ends = self._ipv4 if version == 4 else self._ipv6
+        # ranges are merged, so a network within the set is within one range
+        idx = bisect_right(starts, start) - 1
+        return idx >= 0 and end <= ends[idx]
+
+    def __len__(self):
+        """Number of merged address ranges."""
+        return len(self._ipv4[0]) + len(self._ipv6[0])
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by the address ranges, in bytes."""
+        ipv4 = sum(getsizeof(table) for table in self._ipv4)
+        ipv6 = sum(getsizeof(table) + sum(map(getsizeof, table)) for table in self._ipv6)
+        return ipv4 + ipv6
+
+    def __repr__(self):
+        """Repr Network Set."""
+        return f"NetworkSet(ranges={len(self)}, nbytes={self.nbytes})"
+
+
+@validator
+def ip_in_networks(value: str, /, *, networks: Union[NetworkSet, Iterable[str]]):
+    """Return whether an IP address or network is within one of `networks`.
+
+    Build a `NetworkSet` once to validate many values against the same
+    networks, other iterables are turned into one on every call.
+
+    Examples:
+        >>> allowed = NetworkSet(['10.0.0.0/8', 'fd00::/8'])
+        >>> ip_in_networks('10.20.30.40', networks=allowed)
+        True
+        >>> ip_in_networks('fd00::1/64', networks=allowed)
+        True
+        >>> ip_in_networks('11.0.0.1', networks=['10.0.0.0/8'])
+        ValidationError(func=ip_in_networks, args={'value': '11.0.0.1', 'networks': ['10.0.0.0/8']})
+
+    Args:
+        value:
+            IPv4 or IPv6 address or network to validate.
+        networks:
+            Networks `value` must be within.
+
+    Returns:
+        (Literal[True]): If `value` is within one of `networks`.
+        (ValidationError): If `value` is not an IP address or network,
+            is outside of `networks`, or if one of `networks` is invalid.
+    """
+    if not isinstance(networks, NetworkSet):
+        networks = NetworkSet(networks)
+    return value in networks
+
+
+class NetworkReport(NamedTuple):
+    """Findings of `analyse_networks`, by index in the analysed list.
+
+    `duplicates` pairs each repeated network with its first occurrence,
+    and `covered` each network with one that strictly contains it.
+    """
+
+    invalid: List[int]
+    duplicates: List[Tuple[int, int]]
+    covered: List[Tuple[int, int]]
+    aggregated: Optional[List[str]]
+
+    def __bool__(self):
+        """Whether every network is valid, and none overlaps another."""
+        return not (self.invalid or self.duplicates or self.covered)
+
+
+def _cidr_blocks(start: int, end: int, bits: int):
+    """Fewest CIDR blocks, as first address and prefix length, spanning a range."""
+    while start <= end:
+        # largest block aligned on `start` that does not go past `end`
+        size = min((start & -start or 1 << bits).bit_length(), (end - start + 1).bit_length()) - 1
+        yield start, bits - size
+        start += 1 << size
+
+
+# low bits of `_sweep` keys, holding the index of the network in the list
+_INDEX_BITS = 64
+
+
+def _sweep(
+    keys: List[int],
+    bits: int,
+    duplicate_of: List[int],
+    cover_of: List[int],
+    merged: Optional[Tuple[List[int], List[int]]] = None,
+):
+    """Find duplicate and covered networks of one IP version, in one pass.
+
+    Above its `_INDEX_BITS` low bits, holding the index of the network,
+    each key holds the first address of the network, then the complement
+    of its last address in `bits` bits. Plain integers then sort by first
+    address, widest first, and equal networks by index. At the index of
+    each duplicate, `duplicate_of` is set to that of its first occurrence,
+    and at that of each other network within another, `cover_of` to that
+    of a covering one. If given,
+    `merged` is filled with the first and last addresses of the ranges
+    the networks span, merged like `_merge` does, in the same pass.
+    """
+    keys.sort()
+    mask = (1 << bits) - 1
+    index_mask = (1 << _INDEX_BITS) - 1
+    first_network = first = cover_end = cover = -1
+    for key in keys:
+        if (network := key >> _INDEX_BITS) == first_network:
+            duplicate_of[key & index_mask] = first
+            continue
+        first_network, first = network, key & index_mask
+        if (end := mask - (network & mask)) <= cover_end:
+            # sorted by first address, so within the widest network so far
+            cover_of[first] = cover
+            continue
+        if merged is not None:
+            starts, ends = merged
+            if (start := network >> bits) <= cover_end + 1 and ends:
+                ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        cover_end, cover = end, first
+
+
+_IPV4_HOSTS = tuple((1 << (32 - length)) - 1 for length in range(33))
+# values analysed at a time, see `_ipv4_keys`
+_CHUNK_SIZE = 4096
+
+
+def _ipv4_keys(values: List[str], indexes: Iterable[int], host_bit: bool) -> Optional[List[int]]:
+    """`_sweep` keys of many IPv4 networks in CIDR notation, parsed at once.
+
+    Each step runs over all `values` in C, through `map`, rather than
+    one value at a time. `None` if one of `values` is anything else, or
+    not a network `_network_range` would accept, for them to be parsed
+    one at a time.
+    """
+    if not values:
+        return []
+    if list(map(str.count, values, repeat("/"))).count(1) != len(values):
+        return None
+    # with one slash each, addresses and prefix lengths alternate
+    fields = "/".join(values).split("/")
+    dotted, lengths = fields[0::2], fields[1::2]
+    try:
+        packed = list(map(inet_aton, dotted))
+    except (OSError, ValueError):
+        return None
+    digits = "".join(lengths)
+    if list(map(inet_ntoa, packed)) != dotted or "" in lengths:
+        return None
+    if not (digits.isascii() and digits.isdigit()) or max(prefixes := list(map(int, lengths))) > 32:
+        return None
+    hosts = list(map(_IPV4_HOSTS.__getitem__, prefixes))
+    addresses = list(map(partial(int.from_bytes, byteorder="big"), packed))
+    if not host_bit and any(map(int.__and__, addresses, hosts)):
+        return None
+    return [
+        ((address & ~host) << 32 | (0xFFFFFFFF - (address | host))) << _INDEX_BITS | index
+        for address, host, index in zip(addresses, hosts, indexes)
+    ]
+
+
+def _pairs(found: List[int]):
+    """Indexes set by `_sweep`, with what they were set to, in index order."""
+    hits = list(map((-1).__ne__, found))
+    return list(zip(compress(range(len(found)), hits), compress(found, hits)))
+
+
+def _format_ipv4(address: int):
+    return f"{address >> 24}.{address >> 16 & 255}.{address >> 8 & 255}.{address & 255}"
+
+
+def analyse_networks(
+    values: Iterable[Any],
+    /,
+    *,
+    strict: bool = False,
+    host_bit: bool = True,
+    aggregate: bool = False,
+):
+    """Find invalid, duplicate and overlapping networks in a list.
+
+    Networks are sorted by their first address, widest first, then swept
+    once, so that the list is analysed in O(n log n) time rather than
+    comparing every pair. CIDR networks are either disjoint or nested,
+    so every overlap is a duplicate or a network covered by another.
+    Networks are equal when they span the same addresses, whatever their
+    notation. Aggregation merges ranges in that same sorted pass.
+
+    Values are parsed by chunks: a chunk of IPv4 networks all valid and
+    in CIDR notation is parsed at once by `_ipv4_keys`, while any other
+    chunk is parsed one value at a time. On CPython 3.11, a list of 1M
+    networks takes about 1.5 seconds, or about 2 with aggregation, on a
+    typical desktop, see `benchmarks/bench_networks.py`.
+
+    Examples:
+        >>> report = analyse_networks(
+        ...     ['10.0.0.0/8', '10.1.0.0/16', '192.168.0.0/24', '10.0.0.0/255.0.0.0', 'bogus'],
+        ...     aggregate=True,
+        ... )
+        >>> report.invalid, report.duplicates, report.covered
+        ([4], [(3, 0)], [(1, 0)])
+        >>> report.aggregated
+        ['10.0.0.0/8', '192.168.0.0/24']
+        >>> bool(report), bool(analyse_networks(['10.0.0.0/9', '10.128.0.0/9']))
+        (False, True)
+        >>> analyse_networks(['10.0.0.0/9', '10.128.0.0/9'], aggregate=True).aggregated
+        ['10.0.0.0/8']
+
+    Args:
+        values:
+            IPv4 and IPv6 networks, in CIDR, netmask or hostmask notation.
+        strict:
+            Networks are strictly in CIDR notation, see `ipv4`.
+        host_bit:
+            If `False`, networks with host bits set are invalid, see `ipv4`.
+        aggregate:
+            Also compute the fewest networks spanning the same addresses
+            as the valid ones.
+
+    Returns:
+        (NetworkReport): Indexes of invalid, duplicate and covered
+            networks, and the aggregated networks when asked for,
+            IPv4 first. It is truthy if none were found.
+    """
+    invalid: List[int] = []
+    # keys of IPv4, then IPv6 networks, see `_sweep`
+    tables: Tuple[List[int], List[int]] = ([], [])
+    iterator, base = iter(values), 0
+    while chunk := list(islice(iterator, _CHUNK_SIZE)):
+        indexes = range(base, base + len(chunk))
+        base += len(chunk)
+        rest: Iterable[Tuple[int, Any]] = zip(indexes, chunk)
+        try:
+            ipv6 = list(map(str.__contains__, chunk, repeat(":")))
+        except TypeError:
+            ipv6 = None  # not only strings, parsed one at a time
+        if ipv6 is not None:
+            ipv4 = list(map(not_, ipv6))
+            keys = _ipv4_keys(list(compress(chunk, ipv4)), compress(indexes, ipv4), host_bit)
+            if keys is not None:
+                tables[0].extend(keys)
+                rest = compress(rest, ipv6)
+        for index, value in rest:
+            try:
+                if strict and value.count("/") != 1:
+                    raise ValueError("network was expected in CIDR notation")
+                version, start, end = _network_range(value, host_bit)
+            except (ValueError, TypeError, AttributeError):
+                invalid.append(index)
+                continue
+            if version == 4:
+                tables[0].append((start << 32 | (0xFFFFFFFF - end)) << _INDEX_BITS | index)
+            else:
+                tables[1].append((start << 128 | (_ALL_ONES - end)) << _INDEX_BITS | index)
+
+    duplicate_of, cover_of = [-1] * base, [-1] * base
+    aggregated: Optional[List[str]] = [] if aggregate else None
+    for bits, keys in zip((32, 128), tables):
+        if aggregated is None:
+            _sweep(keys, bits, duplicate_of, cover_of)
+            continue
+        merged: Tuple[List[int], List[int]] = ([], [])
+        _sweep(keys, bits, duplicate_of, cover_of, merged)
+        for start, end in zip(*merged):
+            for address, prefix in _cidr_blocks(start, end, bits):
+                text = _format_ipv4(address) if bits == 32 else str(IPv6Address(address))
+                aggregated.append(f"{text}/{prefix}")
+    return NetworkReport(invalid, _pairs(duplicate_of), _pairs(cover_of), aggregated)
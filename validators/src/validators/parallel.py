@@ -0,0 +1,208 @@
+"""Parallel."""
+
+# standard
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from os import PathLike, cpu_count
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# local
+from . import tld
+from .batch import BatchResult
+from .utils import as_bool
+
+_worker_check: Optional[Callable[[Any], bool]] = None
+
+
+def _init_worker(validator: Callable[..., Any], options: Dict[str, Any], tld_path: str):
+    """Prepare a worker process, once, before it receives any chunk."""
+    global _worker_check
+    check = as_bool(validator)
+    _worker_check = partial(check, **options) if options else check
+    # module level caches live as long as the worker does
+    tld.load(tld_path)
+
+
+def _check_chunk(values: List[Any]):
+    """Validate one chunk inside a worker process."""
+    if _worker_check is None:
+        raise RuntimeError("worker was not initialized")
+    return bytearray(map(_worker_check, values))
+
+
+def _read_lines(path: "Union[str, PathLike[str]]", encoding: str = "utf-8"):
+    """Yield lines of a text file without their line endings."""
+    with open(path, encoding=encoding, newline="") as source:
+        for line in source:
+            yield line.rstrip("\r\n")
+
+
+def _chunked(values: Iterable[Any], chunk_size: int):
+    """Split `values` into lists of `chunk_size` items."""
+    values = iter(values)
+    while chunk := list(islice(values, chunk_size)):
+        yield chunk
+
+
+def _checked_chunks(
+    validator: Callable[..., Any],
+    values: Iterable[Any],
+    jobs: int,
+    chunk_size: int,
+    options: Dict[str, Any],
+) -> Iterator[Tuple[List[Any], bytearray]]:
+    """Chunks of `values` and their flags, see `parallel_chunks`."""
+    if jobs == 1:
+        check = partial(as_bool(validator), **options) if options else as_bool(validator)
+        for chunk in _chunked(values, chunk_size):
+            yield chunk, bytearray(map(check, chunk))
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(validator, options, tld.info().path)
+    ) as executor:
+        pending: Deque[Tuple[List[Any], "Future[bytearray]"]] = deque()
+        for chunk in _chunked(values, chunk_size):
+            pending.append((chunk, executor.submit(_check_chunk, chunk)))
+            if len(pending) >= 2 * jobs:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+
+def parallel_chunks(
+    validator: Callable[..., Any],
+    values: Iterable[Any],
+    /,
+    *,
+    jobs: Optional[int] = None,
+    chunk_size: int = 10_000,
+    **options: Any,
+) -> Iterator[Tuple[List[Any], bytearray]]:
+    """Validate `values` in worker processes, yielding chunks in input order.
+
+    At most two chunks per worker are in flight, so memory use does not
+    depend on the length of `values`. Each worker is initialized once with
+    `validator` and `options`, and keeps its compiled regexes and tables
+    for all the chunks it handles.
+
+    Examples:
+        >>> from validators import email
+        >>> for chunk, flags in parallel_chunks(email, ['a@b.com', 'x'], jobs=1):
+        ...     print(chunk, list(flags))
+        ['a@b.com', 'x'] [1, 0]
+
+    Args:
+        validator:
+            Function decorated with `validator`.
+        values:
+            Values to validate.
+        jobs:
+            Number of worker processes, defaults to the number of CPUs.
+            With `1` values are validated in the calling process.
+        chunk_size:
+            Number of values sent to a worker at a time.
+        **options:
+            Keyword arguments passed to `validator` with every value.
+
+    Yields:
+        (Tuple[List[Any], bytearray]): A chunk of `values` and its pass/fail flags.
+
+    Raises:
+        (TypeError): If `validator` is not decorated with `validator`.
+        (ValueError): If `jobs` or `chunk_size` is less than one.
+    """
+    if jobs is None:
+        jobs = cpu_count() or 1
+    # checked on call, not when the chunks are first iterated
+    if jobs < 1 or chunk_size < 1:
+        raise ValueError("`jobs` and `chunk_size` must be at least one")
+    as_bool(validator)  # fail early, not inside a worker
+    return _checked_chunks(validator, values, jobs, chunk_size, options)
+
+
+class ParallelResult(BatchResult):
+    """Pass/fail flags of a parallel validation, with timing."""
+
+    __slots__ = ("elapsed", "jobs")
+
+    def __init__(self, flags: bytearray, elapsed: float, jobs: int):
+        """Initialize Parallel Result."""
+        super().__init__(flags)
+        self.elapsed = elapsed
+        self.jobs = jobs
+
+    @property
+    def throughput(self):
+        """Values validated per second."""
+        return len(self) / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        """Repr Parallel Result."""
+        return (
+            f"ParallelResult(total={len(self)}, failed={len(self.failures)}, "
+            + f"jobs={self.jobs}, throughput={self.throughput:.0f}/s)"
+        )
+
+
+def parallel(
+    validator: Callable[..., Any],
+    source: "Union[Iterable[Any], str, PathLike[str]]",
+    /,
+    *,
+    jobs: Optional[int] = None,
+    chunk_size: int = 10_000,
+    **options: Any,
+):
+    """Validate many values with the same validator, on all CPUs.
+
+    `source` is either an iterable of values or the path, as `str` or
+    path-like object, of a text file with one value per line. Values
+    are sharded into chunks which are validated by a pool of worker
+    processes, see `parallel_chunks`.
+
+    Examples:
+        >>> from validators import url
+        >>> result = parallel(url, ['https://example.com', 'example'], jobs=1)
+        >>> list(result.flags), list(result.failures), result.jobs
+        ([1, 0], [1], 1)
+
+    Args:
+        validator:
+            Function decorated with `validator`.
+        source:
+            Values to validate, or path to a file holding one value per line.
+        jobs:
+            Number of worker processes, defaults to the number of CPUs.
+        chunk_size:
+            Number of values sent to a worker at a time.
+        **options:
+            Keyword arguments passed to `validator` with every value.
+
+    Returns:
+        (ParallelResult): Pass/fail flags of all values, in input order.
+
+    Raises:
+        (TypeError): If `validator` is not decorated with `validator`.
+        (ValueError): If `jobs` or `chunk_size` is less than one.
+        (OSError): If `source` is a path which cannot be read.
+    """
+    if jobs is None:
+        jobs = cpu_count() or 1
+    start = perf_counter()
+    chunks = parallel_chunks(
+        validator,
+        _read_lines(source) if isinstance(source, (str, PathLike)) else source,
+        jobs=jobs,
+        chunk_size=chunk_size,
+        **options,
+    )
+    flags = bytearray()
+    for _, chunk_flags in chunks:
+        flags += chunk_flags
+    return ParallelResult(flags, perf_counter() - start, jobs)
@@ -0,0 +1,141 @@
+"""Public Suffix List."""
+
+# standard
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+# source: https://publicsuffix.org/list/public_suffix_list.dat
+_BUNDLED = Path(__file__).parent.joinpath("_psl.dat")
+# keys of a trie node besides its child labels
+_RULE = "."
+_EXCEPTION = "!"
+
+_trie: Optional[Dict[str, Any]] = None
+_lock = Lock()
+
+
+def _compile(path: Path):
+    """Compile Public Suffix List rules into a trie of reversed labels."""
+    root: Dict[str, Any] = {}
+    with path.open(encoding="utf-8") as rules:
+        for line in rules:
+            rule = line.strip()
+            if not rule or rule.startswith("//"):
+                continue
+            exception = rule.startswith("!")
+            node = root
+            rule = rule.lstrip("!")
+            if not rule.isascii():
+                rule = rule.encode("idna").decode("ascii")
+            for label in reversed(rule.lower().split(".")):
+                node = node.setdefault(label, {})
+            node[_EXCEPTION if exception else _RULE] = True
+    return root
+
+
+def _current():
+    """Trie of the bundled list, compiled on first use."""
+    global _trie
+    if (trie := _trie) is None:
+        with _lock:
+            if (trie := _trie) is None:
+                trie = _trie = _compile(_BUNDLED)
+    return trie
+
+
+def _labels(value: str):
+    """Lower case ASCII labels of a domain name, `None` if it is not one."""
+    value = value[:-1] if value.endswith(".") else value
+    try:
+        value = value.lower() if value.isascii() else value.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    labels = value.split(".")
+    return None if "" in labels else labels
+
+
+def _match(labels: List[str]) -> Tuple[int, bool]:
+    """Number of labels in the public suffix, and if a listed rule matched.
+
+    Walks the trie once from the last label, so it takes time linear in
+    the number of labels. Exception rules win, then the longest rule,
+    and an unlisted last label is a public suffix by itself.
+    """
+    node = _trie or _current()
+    size, listed = 1, False
+    for depth, label in enumerate(reversed(labels), 1):
+        child = node.get(label)
+        if child is not None and _EXCEPTION in child:
+            return depth - 1, True
+        wildcard = node.get("*")
+        if wildcard is not None and _RULE in wildcard:
+            size, listed = depth, True
+        if child is not None and _RULE in child:
+            size, listed = depth, True
+        node = child if child is not None else wildcard
+        if node is None:
+            break
+    return size, listed
+
+
+def public_suffix(value: str, /):
+    """Return the public suffix of a domain name.
+
+    The public suffix (also eTLD) is the part of a domain name under which
+    anyone can register names, as defined by the bundled snapshot of the
+    [Public Suffix List][1]. Names under an unlisted TLD have that TLD as
+    their public suffix.
+
+    [1]: https://publicsuffix.org/
+
+    Examples:
+        >>> public_suffix('www.example.co.uk')
+        'co.uk'
+        >>> public_suffix('EXAMPLE.com.')
+        'com'
+        >>> public_suffix('пример.рф')
+        'xn--p1ai'
+        >>> public_suffix('example..com') is None
+        True
+
+    Args:
+        value:
+            Domain name, optionally with a trailing dot.
+
+    Returns:
+        (str): The public suffix, in lower case ASCII.
+        (None): If `value` is not a domain name.
+    """
+    if (labels := _labels(value)) is None:
+        return None
+    size, _ = _match(labels)
+    return ".".join(labels[-size:])
+
+
+def registrable_domain(value: str, /):
+    """Return the registrable domain of a domain name.
+
+    The registrable domain (also eTLD+1) is the public suffix, see
+    `public_suffix`, and the label right before it.
+
+    Examples:
+        >>> registrable_domain('www.example.co.uk')
+        'example.co.uk'
+        >>> registrable_domain('user.github.io')
+        'user.github.io'
+        >>> registrable_domain('co.uk') is None
+        True
+
+    Args:
+        value:
+            Domain name, optionally with a trailing dot.
+
+    Returns:
+        (str): The registrable domain, in lower case ASCII.
+        (None): If `value` is a public suffix, or not a domain name.
+    """
+    if (labels := _labels(value)) is None:
+        return None
+    size, _ = _match(labels)
+    return ".".join(labels[-size - 1 :]) if len(labels) > size else None
@@ -0,0 +1,123 @@
+"""TLD."""
+
+# standard
+from os import PathLike, fspath
+from pathlib import Path
+from threading import Lock
+from typing import FrozenSet, NamedTuple, Optional, Union
+
+# local
+from .cache import clear
+
+_BUNDLED = Path(__file__).parent.joinpath("_tld.txt")
+# not delegated by IANA, reserved by RFC 7686
+_SPECIAL = frozenset({"ONION"})
+
+
+class TLDInfo(NamedTuple):
+    """Source of the TLD registry in use."""
+
+    version: str
+    size: int
+    path: str
+
+
+class _Registry(NamedTuple):
+    tlds: FrozenSet[str]
+    info: TLDInfo
+
+
+_registry: Optional[_Registry] = None
+_lock = Lock()
+
+
+def _read(path: Path):
+    """Parse an IANA TLD list."""
+    lines = path.read_bytes().decode("ascii").splitlines()
+    header = lines[0] if lines and lines[0].startswith("#") else ""
+    tlds = frozenset(
+        line.strip().upper() for line in lines if line.strip() and not line.startswith("#")
+    )
+    if not tlds:
+        raise ValueError(f"no TLDs in {path}")
+    version = header.split(",", 1)[0].replace("# Version", "").strip()
+    return _Registry(tlds | _SPECIAL, TLDInfo(version, len(tlds), str(path)))
+
+
+def load(path: "Optional[Union[str, PathLike[str]]]" = None):
+    """Replace the TLDs considered by `domain`, `hostname`, `url` and `email`.
+
+    `path` points to a list in the format published by IANA at
+    https://data.iana.org/TLD/tlds-alpha-by-domain.txt, one TLD per line
+    after a `# Version ...` header. The list is parsed completely before
+    it replaces the one in use, so threads validating meanwhile see
+    either the old or the new list. Results memoized by `cache` are
+    dropped, as they may depend on the old list.
+
+    Examples:
+        >>> load().version
+        '2024052400'
+
+    Args:
+        path:
+            IANA TLD list to load, defaults to the list bundled with
+            this package.
+
+    Returns:
+        (TLDInfo): The version, number of TLDs and path of the list loaded.
+
+    Raises:
+        (OSError): If `path` cannot be read.
+        (ValueError): If `path` is empty or holds no TLDs.
+    """
+    global _registry
+    registry = _read(Path(fspath(path)) if path is not None else _BUNDLED)
+    with _lock:
+        _registry = registry
+    clear()
+    return registry.info
+
+
+def _current():
+    """Registry in use, loading the bundled list on first use."""
+    global _registry
+    if (registry := _registry) is None:
+        with _lock:
+            if (registry := _registry) is None:
+                registry = _registry = _read(_BUNDLED)
+    return registry
+
+
+def _check(tld: str):
+    """Whether upper case `tld` is in the registry in use."""
+    return tld in (_registry or _current()).tlds
+
+
+def info():
+    """Version, number of TLDs and path of the list in use.
+
+    Examples:
+        >>> info().size > 1000
+        True
+
+    Returns:
+        (TLDInfo): Source of the TLD registry in use.
+    """
+    return _current().info
+
+
+def is_tld(value: str, /):
+    """Whether `value` is a top level domain of the list in use.
+
+    Examples:
+        >>> is_tld('com'), is_tld('onion'), is_tld('notatld')
+        (True, True, False)
+
+    Args:
+        value:
+            Top level domain, without the leading dot.
+
+    Returns:
+        (bool): If `value` is in the registry, ignoring case.
+    """
+    return _check(value.upper())
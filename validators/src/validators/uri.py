@@ -6,7 +6,10 @@
 # local
 from .email import email
 from .url import url
-from .utils import validator
+from .utils import as_bool, validator
+
+_email = as_bool(email)
+_url = as_bool(url)
 
 
 def _file_url(value: str):
@@ -64,11 +67,11 @@ def uri(value: str, /):
         }
         # fmt: on
     ):
-        return url(value)
+        return _url(value)
 
     # email
     if value.startswith("mailto:"):
-        return email(value[len("mailto:") :])
+        return _email(value[len("mailto:") :])
 
     # file
     if value.startswith("file:"):
@@ -2,13 +2,30 @@
 
 # standard
 from functools import lru_cache
+from inspect import signature
 import re
-from typing import Callable, Optional
-from urllib.parse import parse_qs, unquote, urlsplit
+from sys import getsizeof
+from typing import Any, Callable, Literal, NamedTuple, Optional, Union
+from urllib.parse import unquote, urlsplit
 
 # local
-from .hostname import hostname
-from .utils import validator
+from . import cache
+from .cache import cached
+from .hostname import _hostname_checker, classify_host  # type: ignore
+from .utils import ValidationError, compiled_by, validator
+
+
+class URLParts(NamedTuple):
+    """Components of a valid URL, see `parse_url`."""
+
+    scheme: str
+    userinfo: str
+    host: str
+    host_kind: Literal["simple", "domain", "ipv4", "ipv6"]
+    port: Optional[int]
+    path: str
+    query: str
+    fragment: str
 
 
 @lru_cache
@@ -86,8 +103,8 @@ def _validate_auth_segment(value: str):
     )
 
 
-def _validate_netloc(
-    value: str,
+@lru_cache
+def _netloc_checker(
     skip_ipv6_addr: bool,
     skip_ipv4_addr: bool,
     may_have_port: bool,
@@ -96,71 +113,166 @@ def _validate_netloc(
     private: Optional[bool],
     rfc_1034: bool,
     rfc_2782: bool,
+    psl: bool,
 ):
-    """Validate netloc."""
-    if not value or value.count("@") > 1:
-        return False
-    if value.count("@") < 1:
-        return hostname(
-            (
-                value
-                if _confirm_ipv6_skip(value, skip_ipv6_addr) or "]:" in value
-                else value.lstrip("[").replace("]", "", 1)
-            ),
-            skip_ipv6_addr=_confirm_ipv6_skip(value, skip_ipv6_addr),
-            skip_ipv4_addr=skip_ipv4_addr,
-            may_have_port=may_have_port,
-            maybe_simple=simple_host,
-            consider_tld=consider_tld,
-            private=private,
-            rfc_1034=rfc_1034,
-            rfc_2782=rfc_2782,
-        )
-    basic_auth, host = value.rsplit("@", 1)
-    return hostname(
-        (
-            host
-            if _confirm_ipv6_skip(host, skip_ipv6_addr) or "]:" in value
-            else host.lstrip("[").replace("]", "", 1)
-        ),
-        skip_ipv6_addr=_confirm_ipv6_skip(host, skip_ipv6_addr),
-        skip_ipv4_addr=skip_ipv4_addr,
-        may_have_port=may_have_port,
-        maybe_simple=simple_host,
-        consider_tld=consider_tld,
-        private=private,
-        rfc_1034=rfc_1034,
-        rfc_2782=rfc_2782,
-    ) and _validate_auth_segment(basic_auth)
+    """Netloc check with its options resolved."""
+    # only bracketed hosts are checked as IPv6 addresses
+    options = (skip_ipv4_addr, may_have_port, simple_host, consider_tld, private)
+    bracketed_host = _hostname_checker(False, *options, rfc_1034, rfc_2782, psl)
+    other_host = _hostname_checker(True, *options, rfc_1034, rfc_2782, psl)
+
+    def check_host(host: str, value: str):
+        if _confirm_ipv6_skip(host, skip_ipv6_addr):
+            return other_host(host)
+        return bracketed_host(host if "]:" in value else host.lstrip("[").replace("]", "", 1))
+
+    def check(value: str, /):
+        if not value or value.count("@") > 1:
+            return False
+        if value.count("@") < 1:
+            return check_host(value, value)
+        basic_auth, host = value.rsplit("@", 1)
+        return check_host(host, value) and _validate_auth_segment(basic_auth)
+
+    host_options = (skip_ipv6_addr, *options, rfc_1034, rfc_2782, psl)
+
+    def memoized(value: str, /):
+        # see `cache.enable_netloc`
+        store = cache._netloc_store  # type: ignore
+        if store is None:
+            return check(value)
+        key = (host_options, value)
+        result = store.get(key)
+        if result is None:
+            result = bool(check(value))
+            store.put(key, result, getsizeof(key) + getsizeof(value))
+        return result
+
+    return memoized
+
+
+@lru_cache
+def _scheme_regex():
+    return re.compile(r"[a-z][a-z0-9+\-.]*", re.ASCII | re.IGNORECASE)
+
+
+@lru_cache
+def _query_regex(separator: str):
+    # every field, between separators, holds a `=`
+    field = rf"[^{separator}=]*=[^{separator}]*"
+    return re.compile(rf"{field}(?:{separator}{field})*")
+
+
+@lru_cache
+def _fragment_regex():
+    # See RFC3986 Section 3.5 Fragment for allowed characters
+    # Adding "#", see https://github.com/python-validators/validators/issues/403
+    return re.compile(r"[0-9a-z?/:@\-._~%!$&'()*+,;=#]*", re.IGNORECASE)
+
+
+def _split_url(value: str):
+    """Split `value` like `urlsplit`, in one pass over its delimiters.
+
+    URLs without a scheme, or with a bracketed or non-ASCII netloc, are
+    left to `urlsplit`, which checks those.
+    """
+    colon = value.find(":")
+    if colon < 1 or not _scheme_regex().fullmatch(value, 0, colon):
+        return urlsplit(value)
+    netloc = ""
+    start = colon + 1
+    if value.startswith("//", start):
+        start += 2
+        end = len(value)
+        for delimiter in "/?#":
+            if 0 <= (found := value.find(delimiter, start, end)):
+                end = found
+        netloc = value[start:end]
+        if not netloc.isascii() or "[" in netloc or "]" in netloc:
+            return urlsplit(value)
+        start = end
+    fragment = query = ""
+    end = len(value)
+    if 0 <= (found := value.find("#", start)):
+        fragment = value[found + 1 :]
+        end = found
+    if 0 <= (found := value.find("?", start, end)):
+        query = value[found + 1 : end]
+        end = found
+    return value[:colon].lower(), netloc, value[start:end], query, fragment
 
 
 def _validate_optionals(path: str, query: str, fragment: str, strict_query: bool):
     """Validate path query and fragments."""
-    optional_segments = True
-    if path:
-        optional_segments &= bool(_path_regex().match(path))
-    try:
-        if (
-            query
-            # ref: https://github.com/python/cpython/issues/117109
-            and parse_qs(query, strict_parsing=strict_query, separator="&")
-            and parse_qs(query, strict_parsing=strict_query, separator=";")
+    if path and not _path_regex().match(path):
+        return False
+    if (
+        query
+        and strict_query
+        # ref: https://github.com/python/cpython/issues/117109
+        and not (_query_regex("&").fullmatch(query) and _query_regex(";").fullmatch(query))
+    ):
+        return False
+    return not fragment or bool(_fragment_regex().fullmatch(fragment))
+
+
+@lru_cache
+def _url_checker(
+    skip_ipv6_addr: bool = False,
+    skip_ipv4_addr: bool = False,
+    may_have_port: bool = True,
+    simple_host: bool = False,
+    strict_query: bool = True,
+    consider_tld: bool = False,
+    private: Optional[bool] = None,
+    rfc_1034: bool = False,
+    rfc_2782: bool = False,
+    psl: bool = False,
+    validate_scheme: Callable[[str], bool] = _validate_scheme,
+):
+    """URL check with its options resolved.
+
+    The check returns the split URL when it is valid, so that
+    `parse_url` does not split it again.
+    """
+    whitespace = re.compile(r"\s").search
+    netloc_check = _netloc_checker(
+        skip_ipv6_addr,
+        skip_ipv4_addr,
+        may_have_port,
+        simple_host,
+        consider_tld,
+        private,
+        rfc_1034,
+        rfc_2782,
+        psl,
+    )
+
+    def check(value: str, /):
+        if not value or whitespace(value):
+            # url must not contain any white
+            # spaces, they must be encoded
+            return False
+
+        try:
+            scheme, netloc, path, query, fragment = _split_url(value)
+        except ValueError:
+            return False
+
+        if not (
+            validate_scheme(scheme)
+            and netloc_check(netloc)
+            and _validate_optionals(path, query, fragment, strict_query)
         ):
-            optional_segments &= True
-    except TypeError:
-        # for Python < v3.9.2 (official v3.10)
-        if query and parse_qs(query, strict_parsing=strict_query):
-            optional_segments &= True
-    if fragment:
-        # See RFC3986 Section 3.5 Fragment for allowed characters
-        # Adding "#", see https://github.com/python-validators/validators/issues/403
-        optional_segments &= bool(
-            re.fullmatch(r"[0-9a-z?/:@\-._~%!$&'()*+,;=#]*", fragment, re.IGNORECASE)
-        )
-    return optional_segments
+            return None
+        return scheme, netloc, path, query, fragment
+
+    return check
 
 
+@compiled_by(_url_checker)
 @validator
+@cached
 def url(
     value: str,
     /,
@@ -174,6 +286,7 @@ def url(
     private: Optional[bool] = None,  # only for ip-addresses
     rfc_1034: bool = False,
     rfc_2782: bool = False,
+    psl: bool = False,
     validate_scheme: Callable[[str], bool] = _validate_scheme,
 ):
     r"""Return whether or not given value is a valid URL.
@@ -214,7 +327,7 @@ def url(
         strict_query:
             Fail validation on query string parsing error.
         consider_tld:
-            Restrict domain to TLDs allowed by IANA.
+            Restrict domain to TLDs allowed by IANA, see `validators.tld`.
         private:
             Embedded IP address is public if `False`, private/local if `True`.
         rfc_1034:
@@ -223,6 +336,9 @@ def url(
         rfc_2782:
             Domain/Host name is of type service record.
             Ref: [RFC 2782](https://www.rfc-editor.org/rfc/rfc2782).
+        psl:
+            Require domain names to have a suffix listed in the Public
+            Suffix List, and at least one label before it, see `validators.psl`.
         validate_scheme:
             Function that validates URL scheme.
 
@@ -230,28 +346,79 @@ def url(
         (Literal[True]): If `value` is a valid url.
         (ValidationError): If `value` is an invalid url.
     """
-    if not value or re.search(r"\s", value):
-        # url must not contain any white
-        # spaces, they must be encoded
-        return False
+    return _url_checker(
+        skip_ipv6_addr,
+        skip_ipv4_addr,
+        may_have_port,
+        simple_host,
+        strict_query,
+        consider_tld,
+        private,
+        rfc_1034,
+        rfc_2782,
+        psl,
+        validate_scheme,
+    )(value)
 
-    try:
-        scheme, netloc, path, query, fragment = urlsplit(value)
-    except ValueError:
-        return False
 
-    return (
-        validate_scheme(scheme)
-        and _validate_netloc(
-            netloc,
-            skip_ipv6_addr,
-            skip_ipv4_addr,
-            may_have_port,
-            simple_host,
-            consider_tld,
-            private,
-            rfc_1034,
-            rfc_2782,
-        )
-        and _validate_optionals(path, query, fragment, strict_query)
+_url_signature = signature(url)
+
+
+def parse_url(value: str, /, **options: Any) -> Union[URLParts, ValidationError]:
+    """Return the components of a valid URL.
+
+    `value` is validated exactly like `url` does with the same `options`,
+    and split into its components along the way. The result is truthy,
+    so it can replace a call to `url` in a condition.
+
+    Examples:
+        >>> parts = parse_url('https://admin@example.com:8042/over/there?name=ferret#nose')
+        >>> parts.userinfo, parts.host, parts.host_kind, parts.port, parts.query
+        ('admin', 'example.com', 'domain', 8042, 'name=ferret')
+        >>> parse_url('http://[::1]/').host
+        '::1'
+        >>> parse_url('http://10.0.0.1', skip_ipv4_addr=True)
+        ValidationError(func=url, args={'value': 'http://10.0.0.1', 'skip_ipv4_addr': True})
+
+    Args:
+        value:
+            URL string to parse.
+        **options:
+            Keyword arguments of `url`.
+
+    Returns:
+        (URLParts): If `value` is a valid url. Its `host` is without
+            brackets and `port` is `None` when absent.
+        (ValidationError): If `value` is an invalid url.
+
+    Raises:
+        (TypeError): If `options` are not keyword arguments of `url`.
+    """
+    bound = _url_signature.bind(value, **{k: v for k, v in options.items() if k != "r_ve"})
+    bound.apply_defaults()
+    _, *resolved = bound.arguments.values()
+    try:
+        split = _url_checker(*resolved)(value)
+    except (ValueError, TypeError, UnicodeError):
+        split = None
+    if not split:
+        # fails again, for the same `ValidationError` as `url`
+        return url(value, **options)
+    scheme, netloc, path, query, fragment = split
+    userinfo, _, host = netloc.rpartition("@")
+    port = ""
+    if host.startswith("["):
+        host, _, port = host[1:].partition("]")
+        port = port[1:]
+    elif ":" in host:
+        host, _, port = host.rpartition(":")
+    return URLParts(
+        scheme,
+        userinfo,
+        host,
+        classify_host(host) or "simple",
+        int(port) if port else None,
+        path,
+        query,
+        fragment,
     )
@@ -2,21 +2,66 @@
 
 # standard
 from functools import wraps
-from inspect import getfullargspec
-from itertools import chain
+from inspect import getfullargspec, signature, unwrap
 from os import environ
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
 
 
 class ValidationError(Exception):
-    """Exception class when validation failure occurs."""
+    """Exception class when validation failure occurs.
 
-    def __init__(self, function: Callable[..., Any], arg_dict: Dict[str, Any], message: str = ""):
-        """Initialize Validation Failure."""
-        if message:
-            self.reason = message
+    The arguments of the failed call are kept as they were passed, the
+    mapping exposed through attribute access, `__dict__` and `repr` is
+    only built when one of them is first read.
+    """
+
+    __slots__ = ("func", "_arg_names", "_call_args", "_call_kwargs", "_message", "_pending")
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        arg_dict: Dict[str, Any],
+        message: str = "",
+        *,
+        args: Tuple[Any, ...] = (),
+        arg_names: Tuple[str, ...] = (),
+    ):
+        """Initialize Validation Failure.
+
+        Positional `args` are paired with `arg_names` and merged
+        with `arg_dict`, lazily, on first access.
+        """
         self.func = function
-        self.__dict__.update(arg_dict)
+        self._arg_names = arg_names
+        self._call_args = args
+        self._call_kwargs = arg_dict
+        self._message = message
+        self._pending = True
+
+    @property
+    def __dict__(self):  # type: ignore
+        """Arguments of the failed call."""
+        attrs: Dict[str, Any] = _instance_dict(self)
+        if self._pending:
+            self._pending = False
+            arg_dict: Dict[str, Any] = {"reason": self._message} if self._message else {}
+            arg_dict["func"] = self.func
+            arg_dict.update(zip(self._arg_names, self._call_args))
+            arg_dict.update(self._call_kwargs)
+            # keep attributes that were set before the arguments were read
+            arg_dict.update(attrs)
+            attrs.clear()
+            attrs.update(arg_dict)
+        return attrs
+
+    def __getattr__(self, name: str) -> Any:
+        """Look up call arguments."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
     def __repr__(self):
         """Repr Validation Failure."""
@@ -34,12 +79,44 @@ class ValidationError(Exception):
         return False
 
 
-def _func_args_as_dict(func: Callable[..., Any], *args: Any, **kwargs: Any):
-    """Return function's positional and key value arguments as an ordered dictionary."""
-    return dict(
-        list(zip(dict.fromkeys(chain(getfullargspec(func)[0], kwargs.keys())), args))
-        + list(kwargs.items())
-    )
+_instance_dict = BaseException.__dict__["__dict__"].__get__
+_raise_validation_error = environ.get("RAISE_VALIDATION_ERROR", "False") == "True"
+
+
+def refresh_env():
+    """Re-read the `RAISE_VALIDATION_ERROR` environment variable.
+
+    The variable is read once, when `validators` is imported. Call this
+    after changing it at runtime for the new value to take effect.
+
+    Examples:
+        >>> from os import environ
+        >>> environ["RAISE_VALIDATION_ERROR"] = "True"
+        >>> refresh_env()
+        True
+        >>> del environ["RAISE_VALIDATION_ERROR"]
+        >>> refresh_env()
+        False
+
+    Returns:
+        (bool): Whether validators now raise `ValidationError` on failure.
+    """
+    global _raise_validation_error
+    _raise_validation_error = environ.get("RAISE_VALIDATION_ERROR", "False") == "True"
+    return _raise_validation_error
+
+
+def _plain_bool(func: Callable[..., Any]):
+    """Wrap `func` to return a plain `bool`, never raising on invalid input."""
+
+    @wraps(func)
+    def plain(*args: Any, **kwargs: Any) -> bool:
+        try:
+            return bool(func(*args, **kwargs))
+        except (ValueError, TypeError, UnicodeError):
+            return False
+
+    return plain
 
 
 def validator(func: Callable[..., Any]):
@@ -69,34 +146,150 @@ def validator(func: Callable[..., Any]):
     Raises:
         (ValidationError): If `r_ve` or `RAISE_VALIDATION_ERROR` is `True`
     """
+    # introspect once, the argument names are only needed on failure
+    arg_names = tuple(getfullargspec(unwrap(func)).args)
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any):
-        raise_validation_error = False
+        raise_validation_error = _raise_validation_error
         if "r_ve" in kwargs:
             raise_validation_error = True
             del kwargs["r_ve"]
-        if environ.get("RAISE_VALIDATION_ERROR", "False") == "True":
-            raise_validation_error = True
 
         try:
-            if raise_validation_error:
-                if func(*args, **kwargs):
-                    return True
-                else:
-                    raise ValidationError(func, _func_args_as_dict(func, *args, **kwargs))
-            else:
-                return (
-                    True
-                    if func(*args, **kwargs)
-                    else ValidationError(func, _func_args_as_dict(func, *args, **kwargs))
-                )
+            if func(*args, **kwargs):
+                return True
         except (ValueError, TypeError, UnicodeError) as exp:
             if raise_validation_error:
                 raise ValidationError(
-                    func, _func_args_as_dict(func, *args, **kwargs), str(exp)
+                    func, kwargs, str(exp), args=args, arg_names=arg_names
                 ) from exp
-            else:
-                return ValidationError(func, _func_args_as_dict(func, *args, **kwargs), str(exp))
+            return ValidationError(func, kwargs, str(exp), args=args, arg_names=arg_names)
+
+        if raise_validation_error:
+            raise ValidationError(func, kwargs, args=args, arg_names=arg_names)
+        return ValidationError(func, kwargs, args=args, arg_names=arg_names)
 
+    # an attribute, not a registry, so that it survives `functools.wraps`
+    setattr(wrapper, "_bool_variant", _plain_bool(func))
     return wrapper
+
+
+def as_bool(func: Callable[..., Any]) -> Callable[..., bool]:
+    """Return the plain-bool variant of a validator.
+
+    The variant takes the same arguments as the decorated function but
+    returns `True` or `False` and never builds `ValidationError`.
+    It is what validators use when calling each other.
+
+    Examples:
+        >>> @validator
+        ... def even(value):
+        ...     return not (value % 2)
+        >>> as_bool(even)(5)
+        False
+
+    Args:
+        func:
+            Function decorated with `validator`.
+
+    Returns:
+        (Callable[..., bool]): The plain-bool variant of `func`.
+
+    Raises:
+        (TypeError): If `func` is not decorated with `validator`.
+    """
+    variant: Optional[Callable[..., bool]] = getattr(func, "_bool_variant", None)
+    if variant is None:
+        raise TypeError(f"{func!r} is not a validator")
+    return variant
+
+
+def compiled_by(compiler: Callable[..., Callable[..., Any]]):
+    """Register how a validator is specialised by `compile`.
+
+    `compiler` takes the keyword options of the validator and returns a
+    function of the value alone, with those options already resolved.
+    It should return what the undecorated validator would.
+
+    Examples:
+        >>> def _multiple_checker(*, of=2):
+        ...     return lambda value: not (value % of)
+        >>> @compiled_by(_multiple_checker)
+        ... @validator
+        ... def multiple(value, /, *, of=2):
+        ...     return _multiple_checker(of=of)(value)
+        >>> compile(multiple, of=3)(9)
+        True
+
+    Args:
+        compiler:
+            Factory of option-specialised checks.
+
+    Returns:
+        (Callable[[Callable[..., Any]], Callable[..., Any]]):
+            A decorator for functions decorated with `validator`.
+    """
+
+    def register(func: Callable[..., Any]):
+        setattr(func, "_compiler", compiler)
+        return func
+
+    return register
+
+
+def compile(func: Callable[..., Any], /, **options: Any):
+    """Return `func` specialised for the given keyword options.
+
+    Options are checked against the signature of `func` once. Validators
+    that register a compiler (`url`, `hostname`, `domain` and `email`)
+    also resolve option-dependent regexes and branches once, so that each
+    call only pays for validating the value. Other validators get their
+    options bound.
+
+    Importing this function by name shadows the builtin `compile`, so
+    it is not exported by `from validators import *`; use it as
+    `validators.compile` or import it explicitly.
+
+    Examples:
+        >>> from validators import url
+        >>> strict_url = compile(url, consider_tld=True, simple_host=False)
+        >>> strict_url('https://example.com')
+        True
+        >>> strict_url('https://example.notatld')
+        ValidationError(func=url, args={'value': 'https://example.notatld'})
+
+    Args:
+        func:
+            Function decorated with `validator`.
+        **options:
+            Keyword arguments of `func`.
+
+    Returns:
+        (Callable[[Any], ValidationError | Literal[True]]):
+            A validator of one positional value, with its own
+            plain-bool variant for `as_bool`.
+
+    Raises:
+        (TypeError): If `func` is not decorated with `validator`,
+            or does not accept `options`.
+    """
+    as_bool(func)  # only validators can be compiled
+    signature(func).bind(None, **options)
+    compiler: Optional[Callable[..., Callable[..., Any]]] = getattr(func, "_compiler", None)
+    if compiler is not None:
+        # compilers return checks cached for, and shared with, `func` itself
+        check = compiler(**options)
+
+        def specialised(value: Any, /):
+            return check(value)
+    else:
+        unwrapped: Callable[..., Any] = getattr(func, "__wrapped__")
+
+        def specialised(value: Any, /):
+            return unwrapped(value, **options)
+
+    # failures report the name of the validator that was compiled
+    setattr(specialised, "__name__", func.__name__)
+    setattr(specialised, "__qualname__", func.__qualname__)
+    return validator(specialised)
@@ -0,0 +1,119 @@
+"""Test Command Line Interface."""
+
+# standard
+from io import StringIO
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+from typing import List
+
+# external
+import pytest
+
+# local
+import validators
+from validators.__main__ import main
+
+lines = ["someone@example.com", "bogus@@", "", "other@example.org"]
+
+
+@pytest.fixture
+def source(tmp_path: Path):
+    """Input file with CRLF and LF line endings."""
+    path = tmp_path / "emails.txt"
+    path.write_bytes(("\r\n".join(lines[:2]) + "\n" + "\n".join(lines[2:]) + "\n").encode())
+    return str(path)
+
+
+@pytest.mark.parametrize("jobs", ["0", "1", "2"])
+def test_writes_status_per_line(source: str, jobs: str, capsys: pytest.CaptureFixture[str]):
+    """Test writes status per line."""
+    assert main(["email", source, "--jobs", jobs, "--chunk-size", "3"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "pass\tsomeone@example.com",
+        "fail\tbogus@@",
+        "fail\t",
+        "pass\tother@example.org",
+    ]
+
+
+def test_writes_json_lines(source: str, capsys: pytest.CaptureFixture[str]):
+    """Test writes json lines."""
+    main(["email", source, "-f", "jsonl"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert records == [
+        {"value": value, "valid": valid} for value, valid in zip(lines, (True, False, False, True))
+    ]
+
+
+def test_writes_failures_from_stdin(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    """Test writes failures from stdin."""
+    monkeypatch.setattr("sys.stdin", StringIO("\n".join(lines)))
+    assert main(["email", "-f", "failures"]) == 1
+    assert capsys.readouterr().out == "bogus@@\n\n"
+
+
+def test_passes_options(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Test passes options."""
+    path = tmp_path / "hosts.txt"
+    path.write_text("example.com\nexample.notatld\n")
+    assert main(["domain", str(path), "-o", "consider_tld=true", "-f", "failures"]) == 1
+    assert capsys.readouterr().out == "example.notatld\n"
+
+
+def test_returns_zero_when_all_pass(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Test returns zero when all pass, including empty input."""
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert main(["email", str(path), "--stats"]) == 0
+    assert capsys.readouterr().err.startswith("0 values, 0 failed")
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["not_a_validator"],
+        ["email", "-o", "nope"],
+        ["domain", "-o", "unknown=1"],
+        ["email", "-j", "-3"],
+        ["email", "-j", "two"],
+        ["email", "--chunk-size", "0"],
+        ["email", "--chunk-size", "-10"],
+    ],
+)
+def test_rejects_invalid_arguments(argv: List[str]):
+    """Test rejects invalid arguments."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(argv)
+    assert exc_info.value.code == 2
+
+
+def test_reports_unreadable_source(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Test reports missing and unreadable input files as usage errors."""
+    for path in (tmp_path / "missing.txt", tmp_path):
+        with pytest.raises(SystemExit) as exc_info:
+            main(["email", str(path)])
+        assert exc_info.value.code == 2
+        assert "cannot read" in capsys.readouterr().err
+
+
+def test_exits_quietly_on_closed_output(tmp_path: Path):
+    """Test a reader closing the pipe early, as `| head -1` does, is no error."""
+    path = tmp_path / "slugs.txt"
+    path.write_text("my-slug\n" * 200_000)
+    env = dict(os.environ, PYTHONPATH=str(Path(validators.__file__).parents[1]))
+    with subprocess.Popen(
+        [sys.executable, "-m", "validators", "slug", str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    ) as process:
+        assert process.stdout is not None and process.stderr is not None
+        assert process.stdout.readline() == b"pass\tmy-slug\n"
+        process.stdout.close()
+        assert process.stderr.read() == b""
+    assert process.returncode == 1
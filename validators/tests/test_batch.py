@@ -0,0 +1,83 @@
+"""Test Batch."""
+
+# standard
+from typing import Any, Iterable, List
+
+# external
+import pytest
+
+# local
+from validators import BatchResult, batch, batched_by, between, email, ipv4, validator
+
+
+def test_returns_flags_and_failures():
+    """Test returns flags and failures."""
+    result = batch(email, ["a@example.com", "bogus@@", "", "b@example.com", "@"])
+    assert isinstance(result, BatchResult)
+    assert result.flags == bytearray([1, 0, 0, 1, 0])
+    assert list(result.failures) == [1, 2, 4]
+    assert result.passed == 2
+    assert len(result) == 5
+    assert not result
+
+
+def test_passes_options_to_every_value():
+    """Test passes options to every value."""
+    result = batch(ipv4, ["10.0.0.1", "8.8.8.8", "192.168.0.1"], private=True)
+    assert list(result.failures) == [1]
+
+
+def test_swallows_validation_exceptions():
+    """Test exceptions are reported as failures."""
+    result = batch(between, [1, 2], min_val=5, max_val=4)
+    assert list(result.failures) == [0, 1]
+
+
+def test_works_with_custom_validator_and_generators():
+    """Test works with custom validator and generators."""
+
+    @validator
+    def even(value: int):
+        return not (value % 2)
+
+    result = batch(even, (num for num in range(10)))
+    assert bytes(result.flags) == b"\x01\x00" * 5
+    assert batch(even, [])
+
+
+def test_rejects_undecorated_function():
+    """Test rejects undecorated function."""
+    with pytest.raises(TypeError):
+        batch(len, ["a"])
+
+
+def test_runs_registered_bulk_implementation():
+    """Test validators registered with `batched_by` are run in bulk."""
+    seen: List[Any] = []
+
+    def bulk(values: Iterable[Any], *, of: int = 2):
+        seen.append(values)
+        return (not value % of for value in values)
+
+    @batched_by(bulk)
+    @validator
+    def multiple(value: int, /, *, of: int = 2):
+        return not value % of
+
+    values = [3, 4, 9]
+    assert list(batch(multiple, values, of=3).failures) == [1]
+    assert seen == [values]
+
+
+def test_email_agrees_with_email():
+    """Test the bulk `email` check agrees with `email`."""
+    values = ["a@example.com", "bogus@@", "b@example.com", "c@-example.com", "", "@"]
+    flags = [bool(email(value)) for value in values]
+    assert list(batch(email, values).flags) == flags
+    assert list(batch(email, ["a@[::1]"], ipv6_address=True).flags) == [1]
+
+
+def test_rejects_unknown_options():
+    """Test options the validator does not accept raise `TypeError`."""
+    with pytest.raises(TypeError):
+        batch(email, ["a@example.com"], max_domains=2)
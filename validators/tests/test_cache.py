@@ -0,0 +1,215 @@
+"""Test Cache."""
+
+# standard
+from threading import Thread
+from typing import Iterator, List
+
+# external
+import pytest
+
+# local
+from validators import (
+    ValidationError,
+    as_bool,
+    btc_address,
+    cache,
+    compile,
+    domain,
+    email,
+    parse_url,
+    url,
+    validator,
+)
+
+
+@pytest.fixture(autouse=True)
+def _disabled_cache() -> Iterator[None]:
+    """Leave the caches disabled after each test."""
+    yield
+    cache.disable()
+    cache.disable_netloc()
+
+
+def test_disabled_by_default():
+    """Test nothing is cached unless enabled."""
+    assert domain("example.com")
+    assert cache.info() == cache.CacheInfo(0, 0, 0, 0, 0, 0, None)
+
+
+def test_counts_hits_and_misses():
+    """Test repeated values are answered from the cache."""
+    cache.enable(maxsize=16)
+    for _ in range(3):
+        assert email("someone@example.com") is True
+        assert isinstance(email("bogus@@"), ValidationError)
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+
+
+def test_plain_bool_variant_shares_the_cache():
+    """Test the plain-bool variant hits entries of the validator."""
+    cache.enable()
+    assert url("https://example.com")
+    assert as_bool(url)("https://example.com") is True
+    assert cache.info().hits == 1
+
+
+def test_normalises_default_options():
+    """Test passing defaults explicitly hits the same entry."""
+    cache.enable()
+    domain("example.com")
+    domain("example.com", consider_tld=False, rfc_1034=False)
+    assert cache.info().hits == 1
+    assert not domain("example.notatld", consider_tld=True)
+    assert domain("example.notatld")
+    assert cache.info().currsize == 3
+
+
+def test_keeps_validation_error_details():
+    """Test cached failures still report the call."""
+    cache.enable()
+    domain("example.com.")
+    result = domain("example.com.", rfc_1034=False)
+    assert isinstance(result, ValidationError)
+    assert result.value == "example.com."
+    assert result.rfc_1034 is False
+    with pytest.raises(ValidationError):
+        domain("example.com.", r_ve=True)
+
+
+def test_evicts_least_recently_used():
+    """Test entries over `maxsize` are evicted oldest first."""
+    cache.enable(maxsize=2)
+    domain("a.com")
+    domain("b.com")
+    domain("a.com")
+    domain("c.com")
+    assert cache.info().evictions == 1
+    domain("a.com")
+    assert cache.info().hits == 2
+    domain("b.com")
+    assert cache.info().misses == 4
+
+
+def test_evicts_over_byte_budget():
+    """Test entries are evicted to stay within `max_bytes`."""
+    cache.enable(maxsize=1_000, max_bytes=2_000)
+    for idx in range(100):
+        domain(f"host{idx}.example.com")
+    info = cache.info()
+    assert 0 < info.nbytes <= 2_000
+    assert info.evictions == 100 - info.currsize
+    domain("x" * 10_000 + ".com")
+    assert cache.info().nbytes <= 2_000
+
+
+def test_skips_unhashable_and_raising_values():
+    """Test values that cannot be cached are still validated."""
+    calls: List[object] = []
+
+    @validator
+    @cache.cached
+    def positive(value: object, /):
+        calls.append(value)
+        if not isinstance(value, int):
+            raise TypeError("not an integer")
+        return value > 0
+
+    cache.enable()
+    assert isinstance(positive([1]), ValidationError)
+    assert isinstance(positive("1"), ValidationError)
+    assert isinstance(positive("1"), ValidationError)
+    assert positive(1) and positive(1)
+    assert calls == [[1], "1", "1", 1]
+    assert cache.info().currsize == 1
+
+
+def test_distinguishes_value_types():
+    """Test equal values of different types do not share entries."""
+
+    @validator
+    @cache.cached
+    def is_int(value: object, /):
+        return type(value) is int
+
+    cache.enable()
+    assert is_int(1)
+    assert not is_int(True)
+    assert not is_int(1.0)
+
+
+def test_clear_keeps_cache_enabled():
+    """Test clear drops entries and statistics."""
+    cache.enable(maxsize=8)
+    btc_address("1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2")
+    btc_address("1BvBMSEYstWetqTFn5Au4m4GFg7xJaNVN2")
+    cache.clear()
+    assert cache.info() == cache.CacheInfo(0, 0, 0, 0, 8, 0, None)
+
+
+@pytest.mark.parametrize(("maxsize", "max_bytes"), [(0, None), (10, 0)])
+def test_rejects_empty_budget(maxsize: int, max_bytes: int):
+    """Test enable rejects budgets of nothing."""
+    with pytest.raises(ValueError):
+        cache.enable(maxsize, max_bytes)
+
+
+def test_thread_safe():
+    """Test concurrent lookups keep consistent statistics."""
+    cache.enable(maxsize=64)
+    values = [f"host{idx % 100}.example.com" for idx in range(2_000)]
+
+    def work():
+        for value in values:
+            assert domain(value)
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert info.hits + info.misses == 4 * len(values)
+    assert info.currsize == 64
+    assert info.currsize + info.evictions <= info.misses
+
+
+def test_netloc_cache_shares_hosts_across_urls():
+    """Test URLs with the same netloc validate it once."""
+    cache.enable_netloc(maxsize=16)
+    assert url("https://user@example.com:8080/a?x=1")
+    assert url("https://user@example.com:8080/b#top")
+    assert parse_url("https://user@example.com:8080/c")
+    assert isinstance(url("https://user@example.com:8080/ d"), ValidationError)
+    assert isinstance(url("https://user@example.com:8080/?bogus"), ValidationError)
+    info = cache.netloc_info()
+    assert (info.hits, info.misses, info.currsize) == (3, 1, 1)
+    assert info.nbytes > 0
+
+
+def test_netloc_cache_keys_on_host_options():
+    """Test netlocs are cached per set of host options."""
+    cache.enable_netloc()
+    assert url("http://10.0.0.1/")
+    assert isinstance(url("http://10.0.0.1/", skip_ipv4_addr=True), ValidationError)
+    assert isinstance(url("http://10.0.0.1/", private=False), ValidationError)
+    assert compile(url, private=True)("http://10.0.0.1/")
+    assert url("http://example.notatld")
+    assert isinstance(url("http://example.notatld", consider_tld=True), ValidationError)
+    info = cache.netloc_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 6, 6)
+
+
+def test_netloc_cache_evicts_and_clears():
+    """Test the netloc cache is bounded and cleared with the memoization cache."""
+    cache.enable_netloc(maxsize=2)
+    for idx in range(5):
+        assert url(f"https://host{idx}.example.com/")
+    assert cache.netloc_info().evictions == 3
+    cache.clear()
+    assert cache.netloc_info() == cache.CacheInfo(0, 0, 0, 0, 2, 0, None)
+    cache.disable_netloc()
+    assert url("https://example.com/")
+    assert cache.netloc_info().misses == 0
+    with pytest.raises(ValueError):
+        cache.enable_netloc(0)
@@ -1,5 +1,8 @@
 """Test Card."""
 
+# standard
+from random import Random
+
 # external
 import pytest
 
@@ -7,7 +10,9 @@ import pytest
 from validators import (
     ValidationError,
     amex,
+    card_brand,
     card_number,
+    card_number_batch,
     diners,
     discover,
     jcb,
@@ -211,3 +216,88 @@ def test_returns_true_on_valid_mir(value: str):
 def test_returns_failed_on_valid_mir(value: str):
     """Test returns failed on invalid Mir card (other payment systems)."""
     assert isinstance(mir(value), ValidationError)
+
+
+@pytest.mark.parametrize(
+    ("value", "brand"),
+    [
+        ("4000000000006", "visa"),
+        ("4242424242424242", "visa"),
+        ("4000000000000000006", "visa"),
+        ("2221000000000009", "mastercard"),
+        ("2720000000000005", "mastercard"),
+        ("5555555555554444", "mastercard"),
+        ("378282246310005", "amex"),
+        ("6200000000000005", "unionpay"),
+        ("81000000000000000", "unionpay"),
+        ("30950000000000", "diners"),
+        ("36227206271667", "diners"),
+        ("35890000000000009", "jcb"),
+        ("6011000000000004", "discover"),
+        ("6490000000000004", "discover"),
+        ("650000000000000002", "discover"),
+        ("2204000000000000", "mir"),
+    ],
+)
+def test_returns_brand_of_card_number(value: str, brand: str):
+    """Test returns brand of card number, at the bounds of its IIN ranges."""
+    assert card_brand(value) == brand
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "0",
+        "4242424242424241",
+        "2205000000000009",
+        "2220000000000000",
+        "3527000000000008",
+        "5600000000000003",
+        "6012000000000003",
+        "6430000000000007",
+        "900000000000001",
+        "3700000000000007",
+        "40000000000000006",
+        "4242-4242-4242-4242",
+    ],
+)
+def test_returns_none_on_unknown_card_number(value: str):
+    """Test returns none on invalid numbers, unknown IINs and wrong lengths."""
+    assert card_brand(value) is None
+    assert isinstance(mastercard(value), ValidationError)
+
+
+def _random_card_numbers(count: int):
+    rng = Random(23)
+    values = [str(rng.getrandbits(64))[: rng.randrange(1, 20)] for _ in range(count)]
+    return values + ["", "4242 4242", "٤٢٤٢٤٢٤٢٤٢٤٢٤٢٤٢", "79927398713"]
+
+
+def test_card_number_batch_agrees_with_card_number():
+    """Test the batch flags are those of card_number, for str and bytes."""
+    values = _random_card_numbers(5_000)
+    expected = [int(bool(card_number(value))) for value in values]
+    assert list(card_number_batch(values).flags) == expected
+    encoded = [value.encode() for value in values if value.isascii()]
+    assert list(card_number_batch(encoded).flags) == [
+        int(bool(card_number(value.decode()))) for value in encoded
+    ]
+    assert list(card_number_batch([None, 4242424242424242]).flags) == [0, 0]
+
+
+@pytest.mark.parametrize("dtype", ["S", "U", ">U", "<U"])
+def test_card_number_batch_checks_numpy_arrays(dtype: str):
+    """Test the vectorised check of NumPy arrays agrees with card_number."""
+    numpy = pytest.importorskip("numpy")
+    values = _random_card_numbers(5_000) + ["\x004242", "42\x0042", "4242\x00", "٤2٤2", "4242²"]
+    if dtype == "S":
+        values = [value for value in values if value.isascii()]
+        array = numpy.array([value.encode() for value in values])
+    else:
+        width = max(map(len, values))
+        array = numpy.array(values, dtype=f"{dtype}{width}")
+    assert array.dtype.kind == dtype[-1]
+    expected = [int(bool(card_number(value.rstrip("\x00")))) for value in values]
+    assert list(card_number_batch(array).flags) == expected
+    assert len(card_number_batch(array[:0])) == 0
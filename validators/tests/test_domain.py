@@ -5,6 +5,7 @@ import pytest
 
 # local
 from validators import ValidationError, domain
+from validators.domain import _to_ascii  # type: ignore
 
 
 @pytest.mark.parametrize(
@@ -107,3 +108,36 @@ def test_returns_failed_validation_invalid_top_level_domain(
         domain(value, consider_tld=consider_tld, rfc_1034=rfc_1034, rfc_2782=rfc_2782),
         ValidationError,
     )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "example.com",
+        "example.com.",
+        "EXAMPLE.com",
+        "a" * 63 + ".com",
+        "a" * 64 + ".com",
+        "example." + "a" * 63,
+        "example." + "a" * 64,
+        "example..com",
+        ".example.com",
+        "xn----gtbspbbmkef.xn--p1ai",
+        "пример.рф",
+        "пример.рф.",
+        "пример。рф",
+        "Bücher.example",
+        "ü" * 64 + ".com",
+        "пример..рф",
+        "exa mple.рф",
+    ],
+)
+def test_ascii_conversion_matches_idna_codec(value: str):
+    """Test the IDNA conversion matches the `idna` codec, errors included."""
+    try:
+        expected = value.encode("idna").decode("utf-8")
+    except UnicodeError:
+        with pytest.raises(UnicodeError):
+            _to_ascii(value)
+    else:
+        assert _to_ascii(value) == expected
@@ -1,10 +1,14 @@
 """Test eMail."""
 
+# standard
+from importlib import import_module
+from typing import Any, Callable, Dict, List
+
 # external
 import pytest
 
 # local
-from validators import ValidationError, email
+from validators import ValidationError, email, email_stream
 
 
 @pytest.mark.parametrize(
@@ -56,3 +60,52 @@ def test_returns_true_on_valid_email(value: str):
 def test_returns_failed_validation_on_invalid_email(value: str):
     """Test returns failed validation on invalid email."""
     assert isinstance(email(value), ValidationError)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"ipv4_address": True}, {"ipv6_address": True}, {"simple_host": True, "rfc_1034": True}],
+)
+def test_email_stream_matches_email(options: Dict[str, bool]):
+    """Test email_stream yields the results of email, in order."""
+    values = [
+        "email@here.com",
+        "abc@bar",
+        "email@[127.0.0.1]",
+        "email@127.0.0.1",
+        "email@[2001:db8::1]",
+        "example@-invalid.com",
+        "someone@localhost.",
+        "stephen smith@example.com",
+        "email@here.com",
+        "",
+    ]
+    expected = [bool(email(value, **options)) for value in values]
+    assert list(email_stream(values, **options)) == expected
+
+
+def test_email_stream_checks_each_domain_once(monkeypatch: pytest.MonkeyPatch):
+    """Test email_stream validates each distinct domain part once."""
+    module = import_module("validators.email")
+    checked: List[str] = []
+    host_checker = module._host_checker
+
+    def counting_checker(*args: Any) -> Callable[[str], Any]:
+        check = host_checker(*args)
+
+        def counting_check(value: str):
+            checked.append(value)
+            return check(value)
+
+        return counting_check
+
+    monkeypatch.setattr(module, "_host_checker", counting_checker)
+    values = [f"user{idx}@host{idx % 3}.example.com" for idx in range(30)]
+    results = email_stream(values + ["not an address@host0.example.com"])
+    assert next(results) is True
+    assert checked == ["host0.example.com"]
+    assert list(results) == [True] * 29 + [False]
+    assert checked == ["host0.example.com", "host1.example.com", "host2.example.com"]
+    checked.clear()
+    assert all(email_stream(values, max_domains=2))
+    assert len(checked) == 30
@@ -0,0 +1,79 @@
+"""Test Fast."""
+
+# standard
+from importlib import import_module
+from pkgutil import walk_packages
+from typing import Any, Dict
+
+# external
+import pytest
+
+# local
+import validators
+from validators import ValidationError, as_bool, fast
+
+
+def _validators():
+    """Public validators of every module, including those not in `__all__`."""
+    found: Dict[str, Any] = {}
+    for module in walk_packages(validators.__path__, "validators."):
+        if module.name == "validators.__main__":
+            continue
+        for name, value in vars(import_module(module.name)).items():
+            if name.startswith("_"):
+                continue
+            try:
+                as_bool(value)
+            except TypeError:
+                continue
+            found[name] = value
+    return found
+
+
+def _validator_names():
+    return sorted(_validators())
+
+
+@pytest.mark.parametrize("name", list(_validator_names()))
+def test_every_validator_has_a_plain_bool_variant(name: str):
+    """Test every validator of the package has a plain-bool variant."""
+    assert name in fast.__all__
+    assert getattr(fast, name) is as_bool(_validators()[name])
+
+
+def test_exports_only_plain_bool_variants():
+    """Test fast exports no more than the validators of the package."""
+    assert sorted(fast.__all__) == sorted(_validator_names())
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "expected"),
+    [
+        ("email", "someone@example.com", True),
+        ("email", "bogus@@", False),
+        ("hostname", "[::1]:22", True),
+        ("hostname", "_example.com", False),
+        ("domain", "xn----gtbspbbmkef.xn--p1ai", True),
+        ("ipv4", "900.80.70.11", False),
+        ("visa", "4242424242424242", True),
+        ("es_doi", "X0095892X", False),
+        ("iban", "GB82WEST12345698765432", True),
+        ("uri", "mailto:someone@example.com", True),
+        ("uri", "bogus", False),
+    ],
+)
+def test_returns_plain_bool(name: str, value: str, expected: bool):
+    """Test returns plain bool."""
+    assert getattr(fast, name)(value) is expected
+
+
+def test_swallows_validation_exceptions():
+    """Test exceptions that validators report are returned as `False`."""
+    assert isinstance(validators.between(3, min_val=5, max_val=4), ValidationError)
+    assert fast.between(3, min_val=5, max_val=4) is False
+
+
+def test_rejects_undecorated_function():
+    """Test rejects undecorated function."""
+    with pytest.raises(TypeError):
+        as_bool(len)
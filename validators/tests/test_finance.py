@@ -4,7 +4,16 @@
 import pytest
 
 # local
-from validators import ValidationError, cusip, isin, sedol
+from validators import (
+    ValidationError,
+    creditor_reference,
+    creditor_reference_batch,
+    cusip,
+    isin,
+    lei,
+    lei_batch,
+    sedol,
+)
 
 # ==> CUSIP <== #
 
@@ -96,3 +105,61 @@ def test_returns_true_on_valid_sedol(value: str):
 def test_returns_failed_validation_on_invalid_sedol(value: str):
     """Test returns failed validation on invalid sedol."""
     assert isinstance(sedol(value), ValidationError)
+
+# ==> LEI <== #
+
+
+@pytest.mark.parametrize(
+    "value", ["5493001KJTIIGC8Y1R12", "529900T8BM49AURSDO55", "HWUPKR0MPOU8FGXBT394"]
+)
+def test_returns_true_on_valid_lei(value: str):
+    """Test returns true on valid lei."""
+    assert lei(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "5493001KJTIIGC8Y1R13",
+        "5493001kjtiigc8y1r12",
+        "5493001KJTIIGC8Y1R1",
+        "5493001KJTIIGC8Y1RA2",
+        "",
+    ],
+)
+def test_returns_failed_validation_on_invalid_lei(value: str):
+    """Test returns failed validation on invalid lei."""
+    assert isinstance(lei(value), ValidationError)
+
+
+# ==> RF Creditor Reference <== #
+
+
+@pytest.mark.parametrize(
+    "value", ["RF18539007547034", "RF18000000000539007547034", "RF712348231", "rf712348231"]
+)
+def test_returns_true_on_valid_creditor_reference(value: str):
+    """Test returns true on valid creditor reference."""
+    assert creditor_reference(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "RF19539007547034",
+        "RF18 5390 0754 7034",
+        "RF18",
+        "RF180000000000539007547034",
+        "XX712348231",
+    ],
+)
+def test_returns_failed_validation_on_invalid_creditor_reference(value: str):
+    """Test returns failed validation on invalid creditor reference."""
+    assert isinstance(creditor_reference(value), ValidationError)
+
+
+def test_batches_agree_with_validators():
+    """Test the batch flags are those of lei and creditor_reference."""
+    values = ["5493001KJTIIGC8Y1R12", "5493001KJTIIGC8Y1R13", "RF712348231", "RF722348231", None]
+    assert list(lei_batch(values).flags) == [1, 0, 0, 0, 0]
+    assert list(creditor_reference_batch(values).flags) == [0, 0, 1, 0, 0]
@@ -4,7 +4,7 @@
 import pytest
 
 # local
-from validators import ValidationError, hostname
+from validators import ValidationError, classify_host, hostname
 
 
 @pytest.mark.parametrize(
@@ -45,6 +45,8 @@ def test_returns_true_on_valid_hostname(value: str, rfc_1034: bool, rfc_2782: bo
         ("this-pc-is-sh*t", False, False),
         ("lab-01a-note._com_.com:404", False, False),
         ("4-oh-4:@.com", False, False),
+        # simple hostnames are ASCII, even where case folding would match
+        ("\u212aelvin-pc", False, False),
         # bad (hostname w/ optional ports)
         ("example.com:-4444", False, False),
         ("xn----gtbspbbmkef.xn--p1ai:65538", False, False),
@@ -65,3 +67,52 @@ def test_returns_true_on_valid_hostname(value: str, rfc_1034: bool, rfc_2782: bo
 def test_returns_failed_validation_on_invalid_hostname(value: str, rfc_1034: bool, rfc_2782: bool):
     """Test returns failed validation on invalid hostname."""
     assert isinstance(hostname(value, rfc_1034=rfc_1034, rfc_2782=rfc_2782), ValidationError)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("ubuntu-pc", "simple"),
+        ("1234", "simple"),
+        ("-bad-", "simple"),
+        ("example.com", "domain"),
+        ("_example.com", "domain"),
+        ("xn----gtbspbbmkef.xn--p1ai", "domain"),
+        ("пример。рф", "domain"),
+        ("\u212aelvin", "domain"),
+        ("1.2.3.4.com", "domain"),
+        ("12.12.12.12", "ipv4"),
+        ("900.80.70.11", "ipv4"),
+        ("1.2", "ipv4"),
+        ("::1", "ipv6"),
+        ("fe80::1%eth0", "ipv6"),
+        ("[::1]", "ipv6"),
+        ("", None),
+    ],
+)
+def test_classifies_host(value: str, expected: str):
+    """Test classifies host by the only kind it could be valid as."""
+    assert classify_host(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "skip_ipv4_addr", "skip_ipv6_addr", "maybe_simple"),
+    [
+        ("12.12.12.12", True, False, True),
+        ("::1", False, True, True),
+        ("ubuntu-pc", False, False, False),
+    ],
+)
+def test_returns_failed_validation_on_skipped_host_kind(
+    value: str, skip_ipv4_addr: bool, skip_ipv6_addr: bool, maybe_simple: bool
+):
+    """Test returns failed validation when the kind of host is not allowed."""
+    assert isinstance(
+        hostname(
+            value,
+            skip_ipv4_addr=skip_ipv4_addr,
+            skip_ipv6_addr=skip_ipv6_addr,
+            maybe_simple=maybe_simple,
+        ),
+        ValidationError,
+    )
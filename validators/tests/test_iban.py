@@ -1,19 +1,122 @@
 """Test IBAN."""
 
+# standard
+from random import Random
+from string import ascii_uppercase, digits
+from typing import List, Optional
+
 # external
 import pytest
 
 # local
-from validators import ValidationError, iban
+from validators import IBANParts, ValidationError, iban, iban_batch, mod97_10, parse_iban
 
 
-@pytest.mark.parametrize("value", ["GB82WEST12345698765432", "NO9386011117947"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        "GB82WEST12345698765432",
+        "NO9386011117947",
+        "gb82west12345698765432",
+        "BE68539007547034",
+        "MT84MALT011000012345MTLCAST001S",
+        "LC55HEMM000100010012001200023015",
+        "RU0304452522540817810538091310419",
+    ],
+)
 def test_returns_true_on_valid_iban(value: str):
     """Test returns true on valid iban."""
     assert iban(value)
 
 
-@pytest.mark.parametrize("value", ["GB81WEST12345698765432", "NO9186011117947"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        "GB81WEST12345698765432",
+        "NO9186011117947",
+        "GB82WEST12345698765432\n",
+        # valid check digits, but wrong length or BBAN format for the country
+        "DE3110050000106104567",
+        "DE791005000010610456723",
+        "GB25123412345698765432",
+        "NO088601111794A",
+        # valid check digits, but not a country of the IBAN registry
+        "XX4212345678901234",
+    ],
+)
 def test_returns_failed_validation_on_invalid_iban(value: str):
     """Test returns failed validation on invalid iban."""
     assert isinstance(iban(value), ValidationError)
+
+
+def _big_int_mod97(value: str):
+    return int("".join(str(int(char, 36)) for char in value)) % 97
+
+
+@pytest.mark.parametrize(("value", "expected"), [("", 0), ("96", 96), ("97", 0), ("A", 10)])
+def test_mod97_10_returns_remainder(value: str, expected: int):
+    """Test mod97_10 returns the remainder of short strings."""
+    assert mod97_10(value) == expected
+
+
+@pytest.mark.parametrize("value", ["GB82 WEST", "GB82-WEST", "É1"])
+def test_mod97_10_returns_none_on_other_characters(value: str):
+    """Test mod97_10 returns none on characters other than ASCII letters and digits."""
+    assert mod97_10(value) is None
+
+
+def test_mod97_10_agrees_with_big_int_remainder():
+    """Test mod97_10 agrees with the remainder of the whole number."""
+    rng = Random(24)
+    alphabet = digits + ascii_uppercase + ascii_uppercase.lower()
+    for _ in range(2_000):
+        value = "".join(rng.choices(alphabet, k=rng.randrange(1, 60)))
+        assert mod97_10(value) == _big_int_mod97(value), value
+
+
+def test_iban_batch_agrees_with_iban():
+    """Test the batch flags are those of iban."""
+    values: List[Optional[str]] = [
+        "GB82WEST12345698765432",
+        "GB81WEST12345698765432",
+        "DE29100500001061045672",
+        "",
+        None,
+    ]
+    assert list(iban_batch(values).flags) == [int(bool(iban(value))) for value in values]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            "FR1420041010050500013M02606",
+            IBANParts("FR", "14", "20041010050500013M02606", "20041", "01005", "0500013M02606"),
+        ),
+        (
+            "it60x0542811101000000123456",
+            IBANParts("IT", "60", "X0542811101000000123456", "05428", "11101", "000000123456", "X"),
+        ),
+        (
+            "SM86U0322509800000000270100",
+            IBANParts("SM", "86", "U0322509800000000270100", "03225", "09800", "000000270100", "U"),
+        ),
+        (
+            "ES9121000418450200051332",
+            IBANParts("ES", "91", "21000418450200051332", "2100", "0418", "450200051332"),
+        ),
+        (
+            "NL91ABNA0417164300",
+            IBANParts("NL", "91", "ABNA0417164300", "ABNA", "", "0417164300"),
+        ),
+    ],
+)
+def test_parse_iban_returns_components(value: str, expected: IBANParts):
+    """Test parse_iban returns bank, branch and account of valid iban."""
+    assert parse_iban(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "DE3110050000106104567", "XX4212345678901234"])
+def test_parse_iban_returns_failed_validation_on_invalid_iban(value: str):
+    """Test parse_iban returns failed validation on invalid iban."""
+    assert isinstance(parse_iban(value), ValidationError)
@@ -1,10 +1,14 @@
 """Test IP Address."""
 
+# standard
+from ipaddress import IPv4Address, IPv4Network
+from random import Random
+
 # external
 import pytest
 
 # local
-from validators import ValidationError, ipv4, ipv6
+from validators import ValidationError, ip_category, ipv4, ipv6
 
 
 @pytest.mark.parametrize(
@@ -204,3 +208,122 @@ def test_returns_true_on_valid_public_ipv4_address(address: str, private: bool):
 def test_returns_failed_validation_on_invalid_public_ipv4_address(address: str, private: bool):
     """Test returns failed validation on private ipv4 address."""
     assert isinstance(ipv4(address, private=private), ValidationError)
+
+
+@pytest.mark.parametrize(
+    ("address", "category"),
+    [
+        ("0.0.0.0", "unspecified"),
+        ("0.1.2.3", "this-network"),
+        ("10.255.255.255", "private"),
+        ("11.0.0.0", "global"),
+        ("100.64.0.1", "shared"),
+        ("127.0.0.1", "loopback"),
+        ("169.254.169.254", "link-local"),
+        ("172.15.255.255", "global"),
+        ("172.16.0.0", "private"),
+        ("172.31.255.255", "private"),
+        ("172.32.0.0", "global"),
+        ("192.0.0.8", "protocol-assignment"),
+        ("192.0.2.1", "documentation"),
+        ("192.168.1.1/24", "private"),
+        ("198.19.255.255", "benchmarking"),
+        ("224.0.0.251", "multicast"),
+        ("240.0.0.1", "reserved"),
+        ("255.255.255.254", "reserved"),
+        ("255.255.255.255", "broadcast"),
+        ("8.8.8.8/255.0.0.0", "global"),
+        ("::", "unspecified"),
+        ("::1", "loopback"),
+        ("::2", "global"),
+        ("::ffff:10.0.0.1", "private"),
+        ("::ffff:8.8.8.8", "global"),
+        ("64:ff9b::8.8.8.8", "translation"),
+        ("2001::1", "teredo"),
+        ("2001:2::1", "benchmarking"),
+        ("2001:4::1", "protocol-assignment"),
+        ("2001:db8::/32", "documentation"),
+        ("2002::1", "6to4"),
+        ("2606:4700::1111", "global"),
+        ("fd12:3456::1", "private"),
+        ("fe80::1%eth0", "link-local"),
+        ("fec0::1", "site-local"),
+        ("ff02::1", "multicast"),
+        ("ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff", "multicast"),
+    ],
+)
+def test_ip_category_returns_special_purpose_range(address: str, category: str):
+    """Test ip_category returns the special-purpose range of an address."""
+    assert ip_category(address) == category
+
+
+@pytest.mark.parametrize("value", ["", "abc", "256.0.0.1", "01.0.0.1", "::1::", "10.0.0.0/33"])
+def test_ip_category_returns_none_on_invalid_address(value: str):
+    """Test ip_category returns none on invalid address."""
+    assert ip_category(value) is None
+
+
+@pytest.mark.parametrize(
+    ("address", "private"),
+    [
+        ("::1", True),
+        ("fd00::1/64", True),
+        ("fe80::1", True),
+        ("ff02::1", True),
+        ("::ffff:192.168.0.1", True),
+        ("2606:4700::1111", False),
+        ("2001:db8::1", False),
+        ("::ffff:1.1.1.1", False),
+    ],
+)
+def test_returns_true_on_valid_private_or_public_ipv6_address(address: str, private: bool):
+    """Test returns true on ipv6 address of the expected scope."""
+    assert ipv6(address, private=private)
+    assert isinstance(ipv6(address, private=not private), ValidationError)
+
+
+def _random_ipv4(rng: Random):
+    """Dotted-quad like string, valid about a third of the time."""
+    odd = ["00", "01", "0255", "256", "999", "", " 1", "+1", "0x1", "\u0663"]
+    octets = [
+        rng.choice(odd) if rng.random() < 0.3 else str(rng.randrange(256))
+        for _ in range(rng.choice((3, 4, 4, 4, 5)))
+    ]
+    value = ".".join(octets)
+    kind = rng.random()
+    if kind < 0.3:
+        value += f"/{rng.randrange(34)}"
+    elif kind < 0.4:
+        value += "/" + rng.choice(["", "08", "0032", "a", "/8", " 8", "\uff18", "1/2"])
+    elif kind < 0.5:
+        mask = (0xFFFFFFFF << rng.randrange(33)) & 0xFFFFFFFF
+        mask ^= rng.choice((0, 0xFFFFFFFF, 1 << rng.randrange(32)))
+        value += f"/{IPv4Address(mask)}"
+    return value
+
+
+def _reference_ipv4(value: str, cidr: bool, strict: bool, host_bit: bool):
+    """IPv4 check done with `ipaddress` objects."""
+    try:
+        if cidr:
+            if strict and value.count("/") != 1:
+                return False
+            IPv4Network(value, strict=not host_bit)
+        else:
+            IPv4Address(value)
+    except ValueError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(
+    ("cidr", "strict", "host_bit"),
+    [(True, False, True), (False, False, True), (True, True, True), (True, False, False)],
+)
+def test_ipv4_accepts_what_ipaddress_accepts(cidr: bool, strict: bool, host_bit: bool):
+    """Test ipv4 agrees with ipaddress on a random corpus."""
+    rng = Random(4)
+    for _ in range(10_000):
+        value = _random_ipv4(rng)
+        expected = _reference_ipv4(value, cidr, strict, host_bit)
+        assert bool(ipv4(value, cidr=cidr, strict=strict, host_bit=host_bit)) is expected, value
@@ -0,0 +1,194 @@
+"""Test Networks."""
+
+# standard
+from ipaddress import IPv4Address, collapse_addresses, ip_network
+from random import Random
+from typing import Any, Dict, List
+
+# external
+import pytest
+
+# local
+from validators import NetworkReport, NetworkSet, ValidationError, analyse_networks, ip_in_networks
+
+_NETWORKS = [
+    "10.0.0.0/8",
+    "172.16.0.0/255.240.0.0",
+    "192.168.1.7/24",
+    "203.0.113.9",
+    "2001:db8::/32",
+    "fe80::/10",
+]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "10.0.0.0",
+        "10.255.255.255",
+        "10.1.0.0/16",
+        "172.31.0.1",
+        "192.168.1.200",
+        "203.0.113.9",
+        "203.0.113.9/32",
+        "2001:db8:ffff::1",
+        "2001:db8::/48",
+        "fe80::1",
+    ],
+)
+def test_returns_true_on_value_within_networks(value: str):
+    """Test returns true on value within networks."""
+    assert ip_in_networks(value, networks=NetworkSet(_NETWORKS))
+    assert ip_in_networks(value, networks=_NETWORKS)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "abc",
+        "11.0.0.0",
+        "9.255.255.255",
+        "10.0.0.0/7",
+        "192.168.2.1",
+        "203.0.113.10",
+        "203.0.113.0/24",
+        "2001:db9::1",
+        "::1",
+        "::ffff:10.0.0.1",
+    ],
+)
+def test_returns_failed_validation_on_value_outside_networks(value: str):
+    """Test returns failed validation on value outside networks."""
+    assert isinstance(ip_in_networks(value, networks=NetworkSet(_NETWORKS)), ValidationError)
+
+
+def test_merges_overlapping_and_adjacent_networks():
+    """Test ranges are merged, so that networks spanning several entries are found."""
+    networks = NetworkSet(["10.0.0.0/25", "10.0.0.128/25", "10.0.0.64/26", "10.0.1.0/24"])
+    assert len(networks) == 1
+    assert "10.0.0.0/23" in networks
+    assert "10.0.2.0" not in networks
+    assert len(NetworkSet(["0.0.0.0/0", "255.255.255.255", "::/0", "::1"])) == 2
+    assert len(NetworkSet([])) == 0 and "10.0.0.1" not in NetworkSet([])
+    assert 42 not in networks
+
+
+def test_rejects_invalid_network():
+    """Test invalid networks are reported by value."""
+    with pytest.raises(ValueError, match="'10.0.0.256/8'"):
+        NetworkSet(["10.0.0.0/8", "10.0.0.256/8"])
+    assert isinstance(ip_in_networks("10.0.0.1", networks=["10/8"]), ValidationError)
+
+
+def test_agrees_with_ipaddress():
+    """Test membership agrees with ipaddress on random networks."""
+    rng = Random(20)
+    networks = [
+        ip_network((rng.getrandbits(32), length), strict=False)
+        for length in (rng.randrange(8, 33) for _ in range(500))
+    ]
+    network_set = NetworkSet(map(str, networks))
+    assert network_set.nbytes > 0
+    for _ in range(2_000):
+        address = IPv4Address(rng.getrandbits(32))
+        if rng.random() < 0.5:
+            # within or next to one of the networks
+            network = rng.choice(networks)
+            address = network.network_address + rng.randrange(-1, network.num_addresses + 1)
+        expected = any(address in network for network in networks)
+        assert (str(address) in network_set) is expected, address
+
+
+def test_analyse_networks_reports_findings_by_index():
+    """Test analyse_networks reports invalid, duplicate and covered networks."""
+    values = [
+        "10.0.0.0/8",
+        "10.1.0.0/16",
+        "bogus",
+        "10.1.0.0/255.255.0.0",
+        "2001:db8::/32",
+        "2001:db8:1::/48",
+        "10.1.2.0/24",
+        "10.0.0.0/8",
+        None,
+        "192.168.0.0/24",
+    ]
+    report = analyse_networks(values)
+    assert report == NetworkReport(
+        invalid=[2, 8],
+        duplicates=[(3, 1), (7, 0)],
+        covered=[(1, 0), (5, 4), (6, 0)],
+        aggregated=None,
+    )
+    assert not report
+    assert analyse_networks(["10.0.0.0/9", "10.128.0.0/9", "::/1"])
+    assert analyse_networks([]) == NetworkReport([], [], [], None)
+
+
+@pytest.mark.parametrize(
+    ("options", "invalid"),
+    [
+        ({}, []),
+        ({"strict": True}, [1]),
+        ({"host_bit": False}, [2, 3]),
+        ({"strict": True, "host_bit": False}, [1, 2, 3]),
+    ],
+)
+def test_analyse_networks_applies_ipv4_options(options: Dict[str, bool], invalid: List[int]):
+    """Test strict and host_bit reject networks like ipv4 does."""
+    values = ["10.0.0.0/8", "192.168.0.1", "172.16.0.1/12", "2001:db8::1/32"]
+    assert analyse_networks(values, **options).invalid == invalid
+
+
+@pytest.mark.parametrize("options", [{}, {"strict": True}, {"host_bit": False}])
+def test_analyse_networks_parses_chunks_like_single_values(options: Dict[str, bool]):
+    """Test a chunk parsed at once reports what parsing each value does."""
+    rng = Random(4)
+    networks = [
+        ip_network(
+            (rng.choice((0x0A000000, rng.getrandbits(32))) | rng.getrandbits(20), length),
+            strict=False,
+        )
+        for length in (rng.randrange(8, 33) for _ in range(3000))
+    ]
+    # host bits are set unless rejected, which would leave nothing to parse at once
+    values: List[Any] = [
+        str(network) if "host_bit" in options else f"{network[-1]}/{network.prefixlen}"
+        for network in networks
+    ]
+    values += values[::300]
+    report = analyse_networks(values, aggregate=True, **options)
+    # in the same chunk, a non-string has all values parsed one at a time
+    expected = analyse_networks(values + [None], aggregate=True, **options)
+    assert expected.invalid == [len(values)]
+    assert report == expected._replace(invalid=[])
+
+
+def test_analyse_networks_aggregates_like_ipaddress():
+    """Test the aggregated networks are those of ipaddress.collapse_addresses."""
+    rng = Random(21)
+    for _ in range(50):
+        networks: List[Any] = [
+            ip_network(
+                (rng.choice((0x0A000000, rng.getrandbits(32))) | rng.getrandbits(16), length),
+                strict=False,
+            )
+            for length in (rng.randrange(12, 33) for _ in range(rng.randrange(1, 60)))
+        ]
+        networks += [
+            ip_network(
+                (0x20010DB8 << 96 | rng.getrandbits(8) << 100, rng.randrange(24, 40)), strict=False
+            )
+            for _ in range(rng.randrange(5))
+        ]
+        report = analyse_networks(map(str, networks), aggregate=True)
+        expected = [
+            str(network)
+            for version in (4, 6)
+            for network in collapse_addresses(n for n in networks if n.version == version)
+        ]
+        assert report.aggregated == expected
+        for index, other in report.covered:
+            assert networks[index] != networks[other]
+            assert networks[index].subnet_of(networks[other])
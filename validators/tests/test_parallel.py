@@ -0,0 +1,58 @@
+"""Test Parallel."""
+
+# standard
+from pathlib import Path
+
+# external
+import pytest
+
+# local
+from validators import ParallelResult, domain, email, parallel, parallel_chunks
+
+values = [f"user{idx}@example.com" if idx % 3 else f"user{idx}@@" for idx in range(100)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_returns_flags_in_input_order(jobs: int):
+    """Test returns flags in input order."""
+    result = parallel(email, values, jobs=jobs, chunk_size=7)
+    assert isinstance(result, ParallelResult)
+    assert list(result.failures) == list(range(0, 100, 3))
+    assert result.jobs == jobs
+    assert result.throughput > 0
+
+
+def test_passes_options_to_workers():
+    """Test passes options to workers."""
+    result = parallel(domain, ["example.com", "example.notatld"] * 10, jobs=2, consider_tld=True)
+    assert list(result.failures) == list(range(1, 20, 2))
+
+
+def test_reads_values_from_file(tmp_path: Path):
+    """Test reads values from file."""
+    source = tmp_path / "emails.txt"
+    source.write_text("\r\n".join(values) + "\n", encoding="utf-8")
+    assert parallel(email, source, jobs=2, chunk_size=9).flags == parallel(email, values).flags
+    assert parallel(email, str(source), jobs=1).flags == parallel(email, values).flags
+
+
+def test_yields_chunks_in_order():
+    """Test yields chunks in order."""
+    chunks = list(parallel_chunks(email, values, jobs=2, chunk_size=10))
+    assert [chunk for chunk, _ in chunks] == [values[idx : idx + 10] for idx in range(0, 100, 10)]
+    assert all(len(flags) == 10 for _, flags in chunks)
+
+
+@pytest.mark.parametrize(("jobs", "chunk_size"), [(-1, 10), (0, 10), (2, 0)])
+def test_rejects_invalid_pool_settings(jobs: int, chunk_size: int):
+    """Test rejects invalid pool settings, on call."""
+    with pytest.raises(ValueError):
+        parallel(email, values, jobs=jobs, chunk_size=chunk_size)
+    with pytest.raises(ValueError):
+        parallel_chunks(email, values, jobs=jobs, chunk_size=chunk_size)
+
+
+def test_rejects_undecorated_function():
+    """Test rejects undecorated function."""
+    with pytest.raises(TypeError):
+        parallel(len, values, jobs=2)
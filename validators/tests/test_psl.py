@@ -0,0 +1,104 @@
+"""Test PSL."""
+
+# standard
+from typing import Optional
+
+# external
+import pytest
+
+# local
+from validators import ValidationError, domain, hostname, public_suffix, registrable_domain, url
+
+
+@pytest.mark.parametrize(
+    ("value", "suffix", "registrable"),
+    [
+        # from https://github.com/publicsuffix/list/blob/main/tests/test_psl.txt
+        ("COM", "com", None),
+        ("example.COM", "com", "example.com"),
+        ("WwW.example.COM", "com", "example.com"),
+        ("example", "example", None),
+        ("example.example", "example", "example.example"),
+        ("b.example.example", "example", "example.example"),
+        ("biz", "biz", None),
+        ("domain.biz", "biz", "domain.biz"),
+        ("a.b.domain.biz", "biz", "domain.biz"),
+        ("uk.com", "uk.com", None),
+        ("example.uk.com", "uk.com", "example.uk.com"),
+        ("b.example.uk.com", "uk.com", "example.uk.com"),
+        ("test.ac", "ac", "test.ac"),
+        ("mm", "mm", None),
+        ("c.mm", "c.mm", None),
+        ("b.c.mm", "c.mm", "b.c.mm"),
+        ("a.b.c.mm", "c.mm", "b.c.mm"),
+        ("jp", "jp", None),
+        ("test.jp", "jp", "test.jp"),
+        ("www.test.jp", "jp", "test.jp"),
+        ("ac.jp", "ac.jp", None),
+        ("test.ac.jp", "ac.jp", "test.ac.jp"),
+        ("kyoto.jp", "kyoto.jp", None),
+        ("test.kyoto.jp", "kyoto.jp", "test.kyoto.jp"),
+        ("ide.kyoto.jp", "ide.kyoto.jp", None),
+        ("b.ide.kyoto.jp", "ide.kyoto.jp", "b.ide.kyoto.jp"),
+        ("c.kobe.jp", "c.kobe.jp", None),
+        ("b.c.kobe.jp", "c.kobe.jp", "b.c.kobe.jp"),
+        ("city.kobe.jp", "kobe.jp", "city.kobe.jp"),
+        ("www.city.kobe.jp", "kobe.jp", "city.kobe.jp"),
+        ("ck", "ck", None),
+        ("test.ck", "test.ck", None),
+        ("b.test.ck", "test.ck", "b.test.ck"),
+        ("www.ck", "ck", "www.ck"),
+        ("www.www.ck", "ck", "www.ck"),
+        ("us", "us", None),
+        ("test.us", "us", "test.us"),
+        ("ak.us", "ak.us", None),
+        ("www.k12.ak.us", "k12.ak.us", "www.k12.ak.us"),
+        ("食狮.中国", "xn--fiqs8s", "xn--85x722f.xn--fiqs8s"),
+        ("xn--85x722f.xn--55qx5d.cn", "xn--55qx5d.cn", "xn--85x722f.xn--55qx5d.cn"),
+        ("shishi.公司.cn", "xn--55qx5d.cn", "shishi.xn--55qx5d.cn"),
+        ("公司.cn", "xn--55qx5d.cn", None),
+        # trailing dot, private domains
+        ("www.example.co.uk.", "co.uk", "example.co.uk"),
+        ("user.github.io", "github.io", "user.github.io"),
+    ],
+)
+def test_returns_public_suffix_and_registrable_domain(
+    value: str, suffix: str, registrable: Optional[str]
+):
+    """Test returns public suffix and registrable domain."""
+    assert public_suffix(value) == suffix
+    assert registrable_domain(value) == registrable
+
+
+@pytest.mark.parametrize("value", ["", ".", ".com", "example..com", "a.\udcff.com"])
+def test_returns_none_on_invalid_domain_name(value: str):
+    """Test returns none on invalid domain name."""
+    assert public_suffix(value) is None
+    assert registrable_domain(value) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["example.co.uk", "www.example.co.uk", "user.github.io", "b.c.kobe.jp", "example.com."],
+)
+def test_returns_true_on_registrable_domain(value: str):
+    """Test returns true on domains under a listed public suffix."""
+    assert domain(value, psl=True, rfc_1034=True)
+    assert hostname(f"{value}:443", psl=True, rfc_1034=True)
+    assert url(f"https://{value}/path", psl=True, rfc_1034=True)
+
+
+@pytest.mark.parametrize("value", ["co.uk", "github.io", "c.kobe.jp", "example.notatld"])
+def test_returns_failed_validation_on_public_suffix(value: str):
+    """Test returns failed validation on public suffixes and unlisted TLDs."""
+    assert domain(value)
+    assert isinstance(domain(value, psl=True), ValidationError)
+    assert isinstance(hostname(value, psl=True), ValidationError)
+    assert isinstance(url(f"https://{value}", psl=True), ValidationError)
+
+
+def test_psl_does_not_apply_to_addresses_and_simple_hosts():
+    """Test psl only restricts domain names."""
+    assert hostname("localhost", psl=True)
+    assert hostname("10.0.0.1:80", psl=True)
+    assert url("http://[::1]:8080", psl=True)
@@ -0,0 +1,99 @@
+"""Test TLD."""
+
+# standard
+from pathlib import Path
+from threading import Thread
+from typing import Iterator, List
+
+# external
+import pytest
+
+# local
+from validators import ValidationError, cache, domain, hostname, tld, url
+
+_HEADER = "# Version 2099010100, Last Updated Thu Jan  1 00:00:00 2099 UTC\n"
+
+
+@pytest.fixture(autouse=True)
+def _bundled_registry() -> Iterator[None]:
+    """Restore the bundled TLD list after each test."""
+    yield
+    tld.load()
+    cache.disable()
+
+
+@pytest.fixture
+def custom_list(tmp_path: Path):
+    """IANA formatted list with a TLD the bundled one does not have."""
+    path = tmp_path / "tlds-alpha-by-domain.txt"
+    path.write_text(_HEADER + "COM\nNOTATLD\nXN--P1AI\n")
+    return path
+
+
+def test_bundled_registry():
+    """Test the bundled list is used by default."""
+    info = tld.load()
+    assert info.version == "2024052400"
+    assert info.size > 1000
+    assert info.path.endswith("_tld.txt")
+    assert tld.is_tld("com") and tld.is_tld("ONION")
+    assert not tld.is_tld("notatld")
+
+
+def test_load_replaces_registry(custom_list: Path):
+    """Test loading a list changes every `consider_tld` path."""
+    assert isinstance(domain("example.notatld", consider_tld=True), ValidationError)
+    info = tld.load(custom_list)
+    assert (info.version, info.size, info.path) == ("2099010100", 3, str(custom_list))
+    assert tld.info() == info
+    assert domain("example.notatld", consider_tld=True)
+    assert hostname("example.notatld:80", consider_tld=True)
+    assert url("https://example.notatld/path", consider_tld=True)
+    assert domain("example.onion", consider_tld=True)
+    assert isinstance(domain("example.org", consider_tld=True), ValidationError)
+    assert isinstance(url("https://example.org", consider_tld=True), ValidationError)
+
+
+def test_load_drops_memoized_results(custom_list: Path):
+    """Test results memoized with the old list are not reused."""
+    cache.enable()
+    assert isinstance(domain("example.notatld", consider_tld=True), ValidationError)
+    tld.load(custom_list)
+    assert domain("example.notatld", consider_tld=True)
+
+
+@pytest.mark.parametrize("content", ["", _HEADER, "# comment only\n\n"])
+def test_rejects_empty_list(tmp_path: Path, content: str):
+    """Test lists without TLDs are rejected and the registry kept."""
+    path = tmp_path / "tlds.txt"
+    path.write_text(content)
+    with pytest.raises(ValueError):
+        tld.load(path)
+    assert tld.info().version == "2024052400"
+
+
+def test_rejects_missing_file(tmp_path: Path):
+    """Test missing lists are rejected."""
+    with pytest.raises(OSError):
+        tld.load(tmp_path / "missing.txt")
+
+
+def test_reload_while_validating(custom_list: Path):
+    """Test concurrent validation sees either list, never a partial one."""
+    errors: List[AssertionError] = []
+
+    def work():
+        try:
+            for _ in range(2_000):
+                assert domain("example.com", consider_tld=True)
+        except AssertionError as err:
+            errors.append(err)
+
+    threads = [Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for idx in range(50):
+        tld.load(custom_list if idx % 2 else None)
+    for thread in threads:
+        thread.join()
+    assert not errors
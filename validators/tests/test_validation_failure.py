@@ -1,7 +1,10 @@
 """Test validation Failure."""
 
+# external
+import pytest
+
 # local
-from validators import between
+from validators import ValidationError, between, refresh_env
 
 failed_obj_repr = "ValidationError(func=between"
 
@@ -31,3 +34,50 @@ class TestValidationError:
         assert self.is_in_between.__dict__["value"] == 3
         assert self.is_in_between.__dict__["min_val"] == 4
         assert self.is_in_between.__dict__["max_val"] == 5
+
+
+def test_raises_on_r_ve():
+    """Test `r_ve` raises instead of returning."""
+    with pytest.raises(ValidationError) as exc_info:
+        between(3, min_val=4, max_val=5, r_ve=True)
+    assert exc_info.value.__dict__["value"] == 3
+    assert "r_ve" not in exc_info.value.__dict__
+
+
+def test_refresh_env(monkeypatch: pytest.MonkeyPatch):
+    """Test `RAISE_VALIDATION_ERROR` is only honoured after a refresh."""
+    monkeypatch.setenv("RAISE_VALIDATION_ERROR", "True")
+    assert isinstance(between(3, min_val=4, max_val=5), ValidationError)
+    try:
+        assert refresh_env()
+        with pytest.raises(ValidationError):
+            between(3, min_val=4, max_val=5)
+        assert between(4, min_val=4, max_val=5)
+    finally:
+        monkeypatch.delenv("RAISE_VALIDATION_ERROR")
+        assert not refresh_env()
+
+
+def test_reason_on_exception():
+    """Test exception message is kept as the failure reason."""
+    result = between(3, min_val=5, max_val=4)
+    assert isinstance(result, ValidationError)
+    assert result.reason == "`min_val` cannot be greater than `max_val`"
+
+
+def test_arguments_are_captured_lazily():
+    """Test arguments are only mapped when read."""
+    result = between(3, min_val=4, max_val=5)
+    assert isinstance(result, ValidationError)
+    assert result.func.__name__ == "between"
+    setattr(result, "note", "kept")
+    assert result.value == 3
+    assert vars(result) == {
+        "func": result.func,
+        "value": 3,
+        "min_val": 4,
+        "max_val": 5,
+        "note": "kept",
+    }
+    with pytest.raises(AttributeError):
+        _ = result.reason